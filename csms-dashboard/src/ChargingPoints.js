@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useEffect, useReducer, useRef } from 'react';
 import webSocketService from './WebSocketService';
 
 const formatTime = (timestamp) => {
@@ -12,59 +12,99 @@ const formatTime = (timestamp) => {
   return `${day}-${month}-${year} ${hours}:${minutes}:${seconds}`;
 };
 
+// Energy of the meter values of a station
+const stationTotal = (station) => (
+  station && station.meterValues
+    ? station.meterValues.reduce((total, value) => total + value.value, 0)
+    : 0
+);
+
+// Id of the object with the aggregates of the whole fleet
+const FLEET = '_fleet';
+
+// The topics of the page, e.g. ?groups=Brussels or ?aggregate=1, are passed
+// on to the CSMS. Without topics the dashboard receives all stations.
+const topics = window.location.search.slice(1);
+
+// The CSMS sends a snapshot of all stations when the client connects,
+// followed by deltas of the fields that changed. The total is updated with
+// the changed stations only.
+const fleetReducer = (state, action) => {
+  switch (action.type) {
+    case 'snapshot': {
+      const stations = {};
+      let total = 0;
+      Object.entries(action.objects).forEach(([id, fields]) => {
+        if (id !== FLEET) {
+          stations[id] = { ...fields, id };
+          total += stationTotal(stations[id]);
+        }
+      });
+      return { stations, total, aggregate: action.objects[FLEET] || null };
+    }
+    case 'deltas': {
+      const stations = { ...state.stations };
+      let total = state.total;
+      let aggregate = state.aggregate;
+      action.deltas.forEach(delta => {
+        if (delta.id === FLEET) {
+          aggregate = delta.removed ? null : { ...aggregate, ...delta.fields };
+          return;
+        }
+        total -= stationTotal(stations[delta.id]);
+        if (delta.removed) {
+          delete stations[delta.id];
+        } else {
+          stations[delta.id] = { ...stations[delta.id], ...delta.fields, id: delta.id };
+          total += stationTotal(stations[delta.id]);
+        }
+      });
+      return { stations, total, aggregate };
+    }
+    default:
+      return state;
+  }
+};
+
 const ChargingPoints = () => {
-  const [chargingStations, setChargingStations] = useState({});
-  const [totalConsumed, setTotalConsumed] = useState(0);
+  const [fleet, dispatch] = useReducer(
+    fleetReducer, { stations: {}, total: 0, aggregate: null }
+  );
+  // The epoch of the feed and the sequence number of the last applied delta,
+  // sent when reconnecting to resume without a new snapshot.
+  const position = useRef({ epoch: null, seq: 0 });
 
   useEffect(() => {
     const clientId = "RC_123"; 
-    webSocketService.connect(clientId);
+    webSocketService.connect(clientId, () => [
+      topics,
+      position.current.epoch
+        ? `epoch=${position.current.epoch}&seq=${position.current.seq}`
+        : '',
+    ].filter(Boolean).join('&'));
 
     const listener = (event) => {
       if (event && event.data) {
-        console.log('Received message:', event.data);
         try {
           const data = JSON.parse(event.data);
-          if (data.messageType === "Heartbeat") {
-            const stationId = data.chargePointId;
-            console.log('Received Heartbeat message. Updating charging station:', stationId);
-            setChargingStations(prevStations => ({
-              ...prevStations,
-              [stationId]: { ...prevStations[stationId], id: stationId, connected: true },
-            }));
-          } else if (data.messageType === "MeterValues") {
-            const { stationId, meterValues } = data;
-            console.log('Received MeterValues message. Updating charging station:', stationId);
-            const updatedStations = {
-              ...chargingStations,
-              [stationId]: {
-                ...chargingStations[stationId],
-                meterValues: meterValues.map(value => ({
-                  timestamp: value.timestamp,
-                  value: value.sampled_value[0].value,
-                  unitOfMeasure: value.sampled_value[0].unit_of_measure.unit
-                }))
-              }
-            };
-            setChargingStations(updatedStations);
-
-            // Calculate total consumed energy
-            let total = 0;
-            Object.values(updatedStations).forEach(station => {
-              if (station.meterValues) {
-                station.meterValues.forEach(value => {
-                  total += value.value;
-                });
-              }
-            });
-            setTotalConsumed(total);
-          } else if (data.messageType === "StatusNotification") {
-            const { stationId, connectorStatus } = data;
-            console.log('Received StatusNotification message. Updating charging station:', stationId);
-            setChargingStations(prevStations => ({
-              ...prevStations,
-              [stationId]: { ...prevStations[stationId], id: stationId, connectorStatus },
-            }));
+          if (data.type === "snapshot") {
+            position.current = { epoch: data.epoch, seq: data.seq };
+            dispatch({ type: 'snapshot', objects: data.objects });
+          } else if (data.type === "deltas" || data.type === "delta") {
+            const deltas = (data.type === "delta" ? [data] : data.deltas)
+              .filter(delta => delta.seq > position.current.seq);
+            // With topics the sequence numbers of the deltas have gaps, the
+            // deltas of other topics aren't sent.
+            if (!topics && deltas.length && deltas[0].seq !== position.current.seq + 1) {
+              // Missed a delta, resume from the last one that was applied
+              console.warn('Missed deltas after', position.current.seq, 'reconnecting');
+              webSocketService.reconnect();
+              return;
+            }
+            position.current.seq = Math.max(position.current.seq, data.seq);
+            if (deltas.length) {
+              dispatch({ type: 'deltas', deltas });
+            }
           }
         } catch (error) {
           console.error('Error parsing message:', error);
@@ -76,8 +116,9 @@ const ChargingPoints = () => {
 
     return () => {
       webSocketService.removeEventListener(listener);
+      webSocketService.close();
     };
-  }, [chargingStations]);
+  }, []);
 
 //  const getTransactionIdForStation = (stationId) => {
 //    const station = chargingStations[stationId];
@@ -95,7 +136,7 @@ const ChargingPoints = () => {
   };
   
 
-  console.log('Charging stations:', chargingStations);
+  const chargingStations = fleet.stations;
 
   return (
     <div>
@@ -121,7 +162,17 @@ const ChargingPoints = () => {
 ))}
 
       </div>
-      <h3>Total Consumed Energy: {totalConsumed} kW</h3>
+      <h3>Total Consumed Energy: {fleet.total} kW</h3>
+      {fleet.aggregate && (
+        <div>
+          <h3>Fleet</h3>
+          <p>Connected stations: {fleet.aggregate.stations}</p>
+          {Object.entries(fleet.aggregate.connectorStatus || {}).map(([status, count]) => (
+            <p key={status}>{status}: {count}</p>
+          ))}
+          <p>Total Consumed Energy: {fleet.aggregate.energy} kWh</p>
+        </div>
+      )}
     </div>
   );
 };
@@ -3,20 +3,36 @@ const webSocketService = {
     socket: null,
     listeners: [],
   
-    connect(clientId) {
-      this.socket = new WebSocket(`ws://localhost:9000/${clientId}`, 'ocpp2.0.1');
-      this.socket.onopen = () => {
+    connect(clientId, getQuery = () => '') {
+      // `getQuery` returns the query string of every (re)connection, e.g. the
+      // position in the feed of the CSMS to resume from.
+      this.clientId = clientId;
+      this.getQuery = getQuery;
+      this.closing = false;
+      this.open();
+    },
+
+    open() {
+      const query = this.getQuery();
+      const socket = new WebSocket(
+        `ws://localhost:9000/${this.clientId}${query ? `?${query}` : ''}`,
+        'ocpp2.0.1'
+      );
+      this.socket = socket;
+      socket.onopen = () => {
         console.log('WebSocket connection to CSMS established.');
       };
-      this.socket.onclose = () => {
+      socket.onclose = () => {
         console.log('WebSocket connection to CSMS closed.');
-        // Call any additional cleanup logic if needed
+        // Reconnect, unless close() has been called
+        if (!this.closing && this.socket === socket) {
+          setTimeout(() => this.open(), 1000);
+        }
       };
-      this.socket.onerror = (error) => {
+      socket.onerror = (error) => {
         console.error('WebSocket error:', error);
       };
-      this.socket.onmessage = (event) => {
-        console.log('WebSocket message received:', event.data);
+      socket.onmessage = (event) => {
         this.listeners.forEach(listener => {
           if (typeof listener === 'function') {
             listener(event);
@@ -24,6 +40,13 @@ const webSocketService = {
         });
       };
     },
+
+    reconnect() {
+      // The onclose handler opens a new connection
+      if (this.socket) {
+        this.socket.close();
+      }
+    },
   
     addEventListener(listener) {
       this.listeners.push(listener);
@@ -42,6 +65,7 @@ const webSocketService = {
     },
   
     close() {
+      this.closing = true;
       if (this.socket) {
         this.socket.close();
       }
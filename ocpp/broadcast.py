@@ -0,0 +1,535 @@
+"""
+Fan out messages to many subscribers, e.g. the dashboards of a central
+system, without waiting for any of them.
+
+`Broadcaster.publish()` only puts the message on the bounded queue of every
+subscriber and returns. A writer task per subscriber sends the queued
+messages, so a slow subscriber never delays the caller or the other
+subscribers. When the queue of a subscriber is full, its policy decides what
+happens:
+
+* `DROP_OLDEST`: the oldest queued message is dropped.
+* `COALESCE`: a queued message with the same key is replaced by the new
+  message, e.g. the previous status of the same station. If there is no such
+  message, the oldest queued message is dropped.
+* `DISCONNECT`: the subscriber is disconnected. It may reconnect and start
+  with a fresh queue.
+
+    broadcaster = Broadcaster(policy=COALESCE)
+    broadcaster.subscribe("dashboard_1", websocket)
+    broadcaster.publish(message, key=("StatusNotification", "CP_1"))
+
+Subscribers may be interested in some topics only, e.g. a single station or
+site. A message published with topics is queued for the subscribers of any
+of those topics and for the subscribers without topics. The subscribers are
+looked up in an index by topic, so the other subscribers cost nothing:
+
+    broadcaster.subscribe("dashboard_2", websocket, topics={("group", "Ghent")})
+    broadcaster.publish(message, topics=[("station", "CP_1"), ("group", "Ghent")])
+
+Subscribers that only show the latest state don't need every message. A
+`Coalescer` keeps the latest message per key and publishes the keys that
+changed at a fixed rate, so the traffic to the subscribers is bounded by that
+rate instead of by the rate of the messages:
+
+    coalescer = Coalescer(broadcaster.publish, rate=4)
+    coalescer.update(("StatusNotification", "CP_1"), message)
+
+A `StateFeed` sends the state of many objects, e.g. stations, as a snapshot
+followed by deltas of the fields that changed. Every delta has a sequence
+number, so a client that reconnects can resume from the last delta it
+received instead of receiving a new snapshot.
+
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+LOGGER = logging.getLogger("ocpp")
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+DISCONNECT = "disconnect"
+
+POLICIES = (DROP_OLDEST, COALESCE, DISCONNECT)
+
+
+class Subscriber:
+    """
+    A connection with a bounded queue of messages and a writer task that
+    sends them.
+
+    Args:
+
+        id: Identifies the subscriber in its broadcaster.
+        connection: Connection with async `send()` and `close()` methods.
+        max_queue_size (int): Maximum number of messages waiting to be sent.
+        policy (str): What to do when the queue is full, see `POLICIES`.
+        topics (iterable): Topics the subscriber is interested in, None for
+            all messages.
+
+    """
+
+    def __init__(
+        self,
+        id,
+        connection,
+        max_queue_size: int = 100,
+        policy: str = DROP_OLDEST,
+        topics: Optional[Iterable[Hashable]] = None,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1.")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'.")
+
+        self.id = id
+        self.connection = connection
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self.topics: Optional[FrozenSet] = (
+            frozenset(topics) if topics is not None else None
+        )
+
+        # Entries are [key, message] lists, so coalescing can replace the
+        # message of a queued entry.
+        self._queue: Deque[List] = deque()
+        self._by_key: Dict[Hashable, List] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+
+        # Number of messages sent, dropped and replaced by a newer message.
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    def wants(self, topics: Optional[Iterable[Hashable]]) -> bool:
+        """Whether a message with the given topics is for this subscriber."""
+        if self.topics is None or topics is None:
+            return True
+        return not self.topics.isdisjoint(topics)
+
+    def put(self, message: Any, key: Optional[Hashable] = None) -> bool:
+        """Queue the message without waiting. Returns False if the subscriber
+        has been closed, e.g. because its queue is full and its policy is
+        `DISCONNECT`."""
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue_size:
+            if self.policy == DISCONNECT:
+                LOGGER.warning("Queue of subscriber %s is full, disconnecting", self.id)
+                asyncio.ensure_future(self.close())
+                return False
+
+            if self.policy == COALESCE and key is not None:
+                entry = self._by_key.get(key)
+                if entry is not None:
+                    entry[1] = message
+                    self.coalesced += 1
+                    return True
+
+            oldest_key, _ = oldest = self._queue.popleft()
+            if self._by_key.get(oldest_key) is oldest:
+                del self._by_key[oldest_key]
+            self.dropped += 1
+
+        entry = [key, message]
+        self._queue.append(entry)
+        if key is not None:
+            self._by_key[key] = entry
+
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+        return True
+
+    async def close(self) -> None:
+        """Stop the writer task, discard the queued messages and close the
+        connection."""
+        if self.closed:
+            return
+
+        self.closed = True
+        self._queue.clear()
+        self._by_key.clear()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        try:
+            await self.connection.close()
+        except Exception as e:
+            LOGGER.debug("Failed to close subscriber %s: %s", self.id, e)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._queue:
+                entry = self._queue.popleft()
+                key, message = entry
+                if key is not None and self._by_key.get(key) is entry:
+                    del self._by_key[key]
+                try:
+                    await self.connection.send(message)
+                except Exception as e:
+                    LOGGER.warning("Failed to send to subscriber %s: %s", self.id, e)
+                    await self.close()
+                    return
+                self.sent += 1
+
+
+class Broadcaster:
+    """
+    Subscribers by id and by topic, with the defaults for the size of their
+    queues and their policy.
+    """
+
+    def __init__(self, max_queue_size: int = 100, policy: str = DROP_OLDEST):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'.")
+
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self._subscribers: Dict[Any, Subscriber] = {}
+        # Subscribers that receive all messages and the others by topic.
+        self._unfiltered: Dict[Any, Subscriber] = {}
+        self._by_topic: Dict[Hashable, Dict[Any, Subscriber]] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def __contains__(self, id) -> bool:
+        return id in self._subscribers
+
+    def subscribe(
+        self,
+        id,
+        connection,
+        max_queue_size: Optional[int] = None,
+        policy: Optional[str] = None,
+        topics: Optional[Iterable[Hashable]] = None,
+    ) -> Subscriber:
+        """Add a subscriber for the given topics, or all messages if
+        `topics` is None. A subscriber with the same id is replaced, it
+        should have been unsubscribed first."""
+        self._remove(id)
+        subscriber = Subscriber(
+            id,
+            connection,
+            max_queue_size if max_queue_size is not None else self.max_queue_size,
+            policy if policy is not None else self.policy,
+            topics,
+        )
+        self._subscribers[id] = subscriber
+        if subscriber.topics is None:
+            self._unfiltered[id] = subscriber
+        else:
+            for topic in subscriber.topics:
+                self._by_topic.setdefault(topic, {})[id] = subscriber
+        return subscriber
+
+    async def unsubscribe(self, id, subscriber: Optional[Subscriber] = None) -> None:
+        """Remove the subscriber and close it. If `subscriber` is given, it's
+        only removed if it's still subscribed with that id, e.g. if a client
+        may have reconnected in the meantime."""
+        if subscriber is None:
+            subscriber = self._subscribers.get(id)
+        if subscriber is None:
+            return
+
+        if self._subscribers.get(id) is subscriber:
+            self._remove(id)
+        await subscriber.close()
+
+    def _remove(self, id) -> None:
+        subscriber = self._subscribers.pop(id, None)
+        if subscriber is None:
+            return
+
+        if subscriber.topics is None:
+            del self._unfiltered[id]
+            return
+        for topic in subscriber.topics:
+            subscribers = self._by_topic[topic]
+            del subscribers[id]
+            if not subscribers:
+                del self._by_topic[topic]
+
+    def publish(
+        self,
+        message: Any,
+        key: Optional[Hashable] = None,
+        topics: Optional[Iterable[Hashable]] = None,
+    ) -> None:
+        """Queue the message for the subscribers of any of its `topics`, or
+        for all subscribers if it has none. Never waits. `key` identifies
+        messages that may replace each other if a subscriber uses the
+        `COALESCE` policy."""
+        if topics is None:
+            recipients = self._subscribers
+        else:
+            recipients = dict(self._unfiltered)
+            for topic in topics:
+                subscribers = self._by_topic.get(topic)
+                if subscribers:
+                    recipients.update(subscribers)
+
+        disconnected = []
+        for id, subscriber in recipients.items():
+            if not subscriber.put(message, key):
+                disconnected.append(id)
+
+        for id in disconnected:
+            self._remove(id)
+
+
+class Coalescer:
+    """
+    Keep the latest message per key and pass the messages that changed to
+    `publish(message, key)` at most `rate` times per second.
+
+    Args:
+
+        publish (callable): Called with every changed message and its key,
+            e.g. `Broadcaster.publish`.
+        rate (float): Maximum number of flushes per second.
+        merge (bool): If True, messages are dicts and an update is merged into
+            the message of its key instead of replacing it.
+
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[Any, Hashable], None],
+        rate: float = 4.0,
+        merge: bool = False,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be larger than 0.")
+
+        self._publish = publish
+        self.interval = 1 / rate
+        self._merge = merge
+        # The latest message of every key and of the keys that changed since
+        # the last flush.
+        self.latest: Dict[Hashable, Any] = {}
+        self._dirty: Dict[Hashable, Any] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._last_flush = float("-inf")
+
+        # Number of updates and of messages published.
+        self.updates = 0
+        self.published = 0
+
+    def update(self, key: Hashable, message: Any) -> None:
+        """Replace, or merge into, the latest message of `key`. It's published
+        by the next flush, which is scheduled if needed."""
+        if self._merge:
+            self.latest[key] = {**self.latest.get(key, {}), **message}
+            self._dirty[key] = {**self._dirty.get(key, {}), **message}
+        else:
+            self.latest[key] = message
+            self._dirty[key] = message
+        self.updates += 1
+
+        if self._handle is None:
+            loop = asyncio.get_running_loop()
+            delay = max(0.0, self._last_flush + self.interval - loop.time())
+            self._handle = loop.call_later(delay, self.flush)
+
+    def remove(self, key: Hashable) -> None:
+        """Forget the key, e.g. of a station that disconnected."""
+        self.latest.pop(key, None)
+        self._dirty.pop(key, None)
+
+    def flush(self) -> None:
+        """Publish the messages that changed since the last flush."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._last_flush = asyncio.get_running_loop().time()
+
+        dirty, self._dirty = self._dirty, {}
+        for key, message in dirty.items():
+            self._publish(message, key)
+        self.published += len(dirty)
+
+    def close(self, flush: bool = True) -> None:
+        """Stop flushing. If `flush` is True, the pending changes are
+        published first, otherwise they are discarded."""
+        if flush and self._dirty:
+            self.flush()
+        elif self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._dirty.clear()
+
+
+def _encode(message) -> str:
+    return json.dumps(message, separators=(",", ":"))
+
+
+class StateFeed:
+    """
+    The fields of many objects by id, published as deltas.
+
+    A client that connects is sent the message returned by `resume()`. That's
+    a snapshot of all objects or, if the client has received deltas of this
+    feed before, the deltas it missed. After that it receives the deltas
+    passed to `publish`. The messages are JSON objects:
+
+        {"type": "snapshot", "epoch": "9f1c...", "seq": 41,
+         "objects": {"CP_1": {"connected": true}}}
+        {"type": "delta", "seq": 42, "id": "CP_1",
+         "fields": {"connectorStatus": "Occupied"}}
+        {"type": "delta", "seq": 43, "id": "CP_1", "removed": true}
+        {"type": "deltas", "epoch": "9f1c...", "seq": 43, "deltas": [...]}
+
+    A client that receives all deltas applies a delta if its `seq` is one
+    more than the last one it applied, and reconnects otherwise. Deltas are
+    never dropped, so subscribers should use the `DISCONNECT` policy.
+
+    If the feed has a `topics` function, every delta is published with the
+    topics returned for the object and the changed fields. Subscribers of
+    some topics only get the deltas, snapshots and missed deltas of those
+    topics, their sequence numbers increase but aren't consecutive.
+
+    Args:
+
+        publish (callable): Called with every encoded delta and, if the feed
+            has topics, the keyword argument `topics`. E.g.
+            `Broadcaster.publish`.
+        history (int): Number of deltas kept for clients that resume.
+        topics (callable): Returns the topics of a delta, given the id of the
+            object and the changed fields.
+
+    """
+
+    def __init__(
+        self,
+        publish: Callable[..., None],
+        history: int = 10000,
+        topics: Optional[Callable[[Hashable, Dict], Iterable[Hashable]]] = None,
+    ):
+        self._publish = publish
+        self._topics = topics
+        # Identifies the feed, sequence numbers of another feed, e.g. from
+        # before a restart, can't be resumed.
+        self.epoch = os.urandom(8).hex()
+        self.seq = 0
+        self.objects: Dict[Hashable, Dict[str, Any]] = {}
+        # Deltas with their topics.
+        self._history: Deque[Tuple[Dict, Optional[Tuple]]] = deque(maxlen=history)
+
+    def update(self, id: Hashable, fields: Dict[str, Any]) -> None:
+        """Publish a delta with the fields that differ from the current
+        fields of the object. Nothing is published if none do."""
+        current = self.objects.setdefault(id, {})
+        changed = {
+            name: value
+            for name, value in fields.items()
+            if name not in current or current[name] != value
+        }
+        if changed:
+            current.update(changed)
+            self._add({"type": "delta", "id": id, "fields": changed})
+
+    def remove(self, id: Hashable) -> None:
+        if self.objects.pop(id, None) is not None:
+            self._add({"type": "delta", "id": id, "removed": True})
+
+    def _add(self, delta: Dict) -> None:
+        self.seq += 1
+        delta["seq"] = self.seq
+        if self._topics is None:
+            self._history.append((delta, None))
+            self._publish(_encode(delta))
+        else:
+            topics = tuple(self._topics(delta["id"], delta.get("fields", {})))
+            self._history.append((delta, topics))
+            self._publish(_encode(delta), topics=topics)
+
+    def snapshot(self, subscriber: Optional[Subscriber] = None) -> str:
+        """Return a snapshot of the objects, or only of those with topics
+        the `subscriber` is interested in."""
+        objects = self.objects
+        if subscriber is not None and self._topics is not None:
+            objects = {
+                id: fields
+                for id, fields in objects.items()
+                if subscriber.wants(self._topics(id, fields))
+            }
+        return _encode(
+            {
+                "type": "snapshot",
+                "epoch": self.epoch,
+                "seq": self.seq,
+                "objects": objects,
+            }
+        )
+
+    def missed(
+        self,
+        epoch: Optional[str],
+        seq: Optional[int],
+        subscriber: Optional[Subscriber] = None,
+    ) -> Optional[List]:
+        """Return the deltas after `seq` that are for the `subscriber`, or
+        None if they can't be resumed because they're of another feed or
+        aren't kept anymore."""
+        if epoch != self.epoch or seq is None or seq > self.seq:
+            return None
+        if seq == self.seq:
+            return []
+
+        # The sequence numbers in the history are consecutive.
+        if not self._history or seq < self._history[0][0]["seq"] - 1:
+            return None
+        start = seq - self._history[0][0]["seq"] + 1
+        return [
+            delta
+            for delta, topics in itertools.islice(self._history, start, None)
+            if subscriber is None or subscriber.wants(topics)
+        ]
+
+    def resume(
+        self,
+        epoch: Optional[str] = None,
+        seq: Optional[int] = None,
+        subscriber: Optional[Subscriber] = None,
+    ) -> str:
+        """Return the first message for a `subscriber` that received the
+        deltas of `epoch` up to `seq`, or nothing yet."""
+        deltas = self.missed(epoch, seq, subscriber)
+        if deltas is None:
+            return self.snapshot(subscriber)
+        return _encode(
+            {"type": "deltas", "epoch": self.epoch, "seq": self.seq, "deltas": deltas}
+        )
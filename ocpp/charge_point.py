@@ -1,37 +1,111 @@
 import asyncio
+import contextlib
+import functools
+import glob
 import inspect
+import json
 import logging
+import os
 import re
-import time
 import uuid
-from dataclasses import Field, asdict, is_dataclass
-from typing import Any, Dict, List, Union, get_args, get_origin
-
-from ocpp.exceptions import NotImplementedError, NotSupportedError, OCPPError
-from ocpp.messages import Call, MessageType, unpack, validate_payload
-from ocpp.routing import create_route_map
+from dataclasses import Field, asdict, fields, is_dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Union, get_args, get_origin
+
+from ocpp.exceptions import (
+    FormatViolationError,
+    NotImplementedError,
+    NotSupportedError,
+    OCPPError,
+)
+from ocpp.hooks import (
+    CONVERTED,
+    HANDLED,
+    PARSED,
+    RECEIVED,
+    SENT,
+    SERIALIZED,
+    STAGES,
+    VALIDATED,
+    StageEvent,
+)
+from ocpp.messages import (
+    Call,
+    MessageType,
+    _read_schema_document,
+    _schemas_dir,
+    peek_response_unique_id,
+    unpack,
+)
+from ocpp.metrics import UNKNOWN
+from ocpp.routing import accepts_call_unique_id, create_route_table
+from ocpp.trace import message_trace as default_message_trace
+from ocpp.validation import INBOUND, OUTBOUND, ValidationPolicies
+from ocpp.writer import FrameWriter
 
 LOGGER = logging.getLogger("ocpp")
 
+# Used instead of a timer of `ocpp.metrics.Metrics` if no metrics are recorded.
+_NO_TIMER = contextlib.nullcontext()
+
+# The error codes of CallErrors defined by OCPP.
+_CALL_ERROR_CODES = frozenset(error.code for error in OCPPError.__subclasses__())
+
+
+def _metric_label(value, known):
+    """Return `value` if it's in `known`, otherwise `ocpp.metrics.UNKNOWN`.
+    Used for label values that are sent by the other side."""
+    try:
+        if value in known:
+            return value
+    except TypeError:
+        pass
+    return UNKNOWN
+
+
+# The maximum number of keys kept per translation cache. The vocabulary of
+# OCPP is finite, the limit only protects against payloads with arbitrary keys
+# like `customData` or the `data` field of DataTransfer.
+KEY_TRANSLATION_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=KEY_TRANSLATION_CACHE_SIZE)
+def _camel_to_snake_key(key):
+    key = key.replace("ocppCSMS", "ocpp_csms")
+    key = key.replace("V2X", "_v2x")
+    key = key.replace("V2X", "_v2x").replace("V2G", "_v2g")
+    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", key)
+    return re.sub("([a-z0-9])([A-Z])(?=\\S)", r"\1_\2", s1).lower()
+
+
+@functools.lru_cache(maxsize=KEY_TRANSLATION_CACHE_SIZE)
+def _snake_to_camel_key(key):
+    key = key.replace("soc", "SoC")
+    key = key.replace("_v2x", "V2X")
+    key = key.replace("ocpp_csms", "ocppCSMS")
+    key = key.replace("_url", "URL")
+    key = key.replace("soc", "SoC").replace("_SoCket", "Socket")
+    key = key.replace("_v2x", "V2X")
+    key = key.replace("soc_limit_reached", "SOCLimitReached")
+    key = key.replace("_v2x", "V2X").replace("_v2g", "V2G")
+    components = key.split("_")
+    return components[0] + "".join(x[:1].upper() + x[1:] for x in components[1:])
+
 
 def camel_to_snake_case(data):
     """
     Convert all keys of all dictionaries inside the given argument from
     camelCase to snake_case.
 
+    Translated keys are cached, see `key_translation_cache_info()`.
+
     Inspired by: https://stackoverflow.com/a/1176023/1073222
 
     """
     if isinstance(data, dict):
         snake_case_dict = {}
         for key, value in data.items():
-            key = key.replace("ocppCSMS", "ocpp_csms")
-            key = key.replace("V2X", "_v2x")
-            key = key.replace("V2X", "_v2x").replace("V2G", "_v2g")
-            s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", key)
-            key = re.sub("([a-z0-9])([A-Z])(?=\\S)", r"\1_\2", s1).lower()
-
-            snake_case_dict[key] = camel_to_snake_case(value)
+            snake_case_dict[_camel_to_snake_key(key)] = camel_to_snake_case(value)
 
         return snake_case_dict
 
@@ -50,22 +124,14 @@ def snake_to_camel_case(data):
     Convert all keys of all dictionaries inside given argument from
     snake_case to camelCase.
 
+    Translated keys are cached, see `key_translation_cache_info()`.
+
     Inspired by: https://stackoverflow.com/a/19053800/1073222
     """
     if isinstance(data, dict):
         camel_case_dict = {}
         for key, value in data.items():
-            key = key.replace("soc", "SoC")
-            key = key.replace("_v2x", "V2X")
-            key = key.replace("ocpp_csms", "ocppCSMS")
-            key = key.replace("_url", "URL")
-            key = key.replace("soc", "SoC").replace("_SoCket", "Socket")
-            key = key.replace("_v2x", "V2X")
-            key = key.replace("soc_limit_reached", "SOCLimitReached")
-            key = key.replace("_v2x", "V2X").replace("_v2g", "V2G")
-            components = key.split("_")
-            key = components[0] + "".join(x[:1].upper() + x[1:] for x in components[1:])
-            camel_case_dict[key] = snake_to_camel_case(value)
+            camel_case_dict[_snake_to_camel_key(key)] = snake_to_camel_case(value)
 
         return camel_case_dict
 
@@ -79,6 +145,45 @@ def snake_to_camel_case(data):
     return data
 
 
+def key_translation_cache_info():
+    """
+    Return the statistics of the caches used by `camel_to_snake_case()` and
+    `snake_to_camel_case()`. The values are `functools._CacheInfo` tuples with
+    the number of hits, misses and cached keys. A number of cached keys that
+    keeps growing towards the maximum size indicates that payloads contain
+    keys outside of the OCPP vocabulary.
+    """
+    return {
+        "camel_to_snake": _camel_to_snake_key.cache_info(),
+        "snake_to_camel": _snake_to_camel_key.cache_info(),
+    }
+
+
+def seed_key_translation_caches(ocpp_version="2.0.1"):
+    """
+    Fill the key translation caches with all property names found in the JSON
+    schemas of the given OCPP version. This avoids cache misses on the first
+    messages after startup.
+    """
+    schemas_dir = _schemas_dir(ocpp_version)
+
+    def collect_properties(schema):
+        if isinstance(schema, dict):
+            for key, value in schema.items():
+                if key == "properties" and isinstance(value, dict):
+                    yield from value
+                yield from collect_properties(value)
+        elif isinstance(schema, list):
+            for value in schema:
+                yield from collect_properties(value)
+
+    for path in sorted(glob.glob(os.path.join(schemas_dir, "*.json"))):
+        schema = json.loads(_read_schema_document(path))
+
+        for key in collect_properties(schema):
+            _snake_to_camel_key(_camel_to_snake_key(key))
+
+
 def _is_dataclass_instance(input: Any) -> bool:
     """Verify if given `input` is a dataclass."""
     return is_dataclass(input) and not isinstance(input, type)
@@ -137,13 +242,50 @@ def serialize_as_dict(dataclass):
             continue
 
         if isinstance(value, list):
-            for item in value:
-                if _is_dataclass_instance(item):
-                    serialized[field.name] = [serialize_as_dict(item)]
+            serialized[field.name] = [
+                serialize_as_dict(item) if _is_dataclass_instance(item) else item
+                for item in value
+            ]
 
     return serialized
 
 
+def serialize_as_camel_case(data):
+    """Serialize the given `data` as camelCase `dict` in a single pass.
+
+    This is equivalent to, but faster than:
+
+        snake_to_camel_case(remove_nones(serialize_as_dict(data)))
+
+    Dataclasses, also when nested in dictionaries or lists, are serialized
+    as `dict`. Values that are None are removed and the keys are translated
+    from snake_case to camelCase.
+
+    """
+    if isinstance(data, dict):
+        return {
+            _snake_to_camel_key(key): serialize_as_camel_case(value)
+            for key, value in data.items()
+            if value is not None
+        }
+
+    if isinstance(data, list):
+        return [serialize_as_camel_case(value) for value in data if value is not None]
+
+    if _is_dataclass_instance(data):
+        serialized = {}
+        for field in fields(data):
+            value = getattr(data, field.name)
+            if value is not None:
+                serialized[_snake_to_camel_key(field.name)] = serialize_as_camel_case(
+                    value
+                )
+
+        return serialized
+
+    return data
+
+
 def remove_nones(data: Union[List, Dict]) -> Union[List, Dict]:
     if isinstance(data, dict):
         return {k: remove_nones(v) for k, v in data.items() if v is not None}
@@ -193,7 +335,39 @@ class ChargePoint:
     initiated and received by the Central System
     """
 
-    def __init__(self, id, connection, response_timeout=30):
+    # The routes of all handlers decorated with @on() and @after(). The table
+    # is built once per subclass, see __init_subclass__(). It's shared by all
+    # instances of the class and therefore read-only.
+    _route_table: Mapping = MappingProxyType({})
+
+    # Module with payload converters per action, generated from the JSON
+    # schemas by scripts/schema_to_converters.py. Actions without a generated
+    # converter fall back to the generic functions of this module.
+    _converters = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._route_table = MappingProxyType(
+            {
+                action: MappingProxyType(route)
+                for action, route in create_route_table(cls).items()
+            }
+        )
+
+    def __init__(
+        self,
+        id,
+        connection,
+        response_timeout=30,
+        max_inflight_calls=1,
+        json_codec=None,
+        validation_policies=None,
+        skip_orphaned_responses=False,
+        send_bytes=False,
+        max_queued_frames=None,
+        message_trace=None,
+        metrics=None,
+    ):
         """
 
         Args:
@@ -202,6 +376,38 @@ class ChargePoint:
             connection: Connection to CP.
             response_timeout (int): When no response on a request is received
                 within this interval, a asyncio.TimeoutError is raised.
+            max_inflight_calls (int): Number of CALLs that may await a response
+                at the same time. The OCPP specification allows only 1, which
+                is the default. Only raise it for peers that accept pipelined
+                requests.
+            json_codec (ocpp.messages.JSONCodec): Codec used to decode and
+                encode the messages of this ChargePoint. If not given, the
+                codec configured with `ocpp.messages.set_json_codec()` is used.
+            validation_policies (ocpp.validation.ValidationPolicies): Decide
+                per action and direction which payloads are validated. If not
+                given, all payloads are validated. Routes registered with
+                `skip_schema_validation=True` are never validated.
+            skip_orphaned_responses (bool): Drop CallResults and CallErrors
+                for which no call() is waiting anymore, e.g. because it timed
+                out, without decoding them.
+            send_bytes (bool): Pass messages to `connection.send()` as UTF-8
+                encoded `bytes` instead of `str`. The connection must send
+                them as text frames, e.g. by calling `send(message,
+                text=True)` of websockets 13 or later. Received messages may
+                be `str`, `bytes`, `bytearray` or `memoryview` regardless of
+                this option.
+            max_queued_frames (int): If given, messages are sent by a
+                writer task per connection, see `ocpp.writer.FrameWriter`.
+                Sending waits when this number of messages is queued. By
+                default every message is sent by the coroutine sending it.
+                Call close() when the connection has ended to stop the
+                writer task.
+            message_trace (ocpp.trace.MessageTrace): Decides how much of the
+                received and sent messages is logged. If not given,
+                `ocpp.trace.message_trace` is used.
+            metrics (ocpp.metrics.Metrics): Registry in which counts and
+                durations of the handled messages are recorded. If not given,
+                nothing is recorded.
 
         """
         self.id = id
@@ -216,14 +422,51 @@ class ChargePoint:
 
         # A dictionary that hooks for Actions. So if the CS receives a it will
         # look up the Action into this map and execute the corresponding hooks
-        # if exists.
-        self.route_map = create_route_map(self)
+        # if exists. The map is shared by all instances of the class and
+        # can't be mutated. Assign a new map, e.g. one created with
+        # `ocpp.routing.create_route_map()`, to change the routes of a single
+        # instance.
+        self.route_map = self._route_table
+
+        if max_inflight_calls < 1:
+            raise ValueError("max_inflight_calls must be at least 1.")
+
+        # Limits the number of CALLs awaiting a response. Both a Lock and a
+        # Semaphore wake up waiters in FIFO order, so calls that can't be sent
+        # because the window is full are queued fairly.
+        self._call_lock = (
+            asyncio.Lock()
+            if max_inflight_calls == 1
+            else asyncio.Semaphore(max_inflight_calls)
+        )
 
-        self._call_lock = asyncio.Lock()
+        # A dictionary mapping the unique id of every outstanding CALL to a
+        # future. The self.start() task resolves the future with the
+        # CallResult or CallError, the self.call() task awaits it.
+        self._pending_calls: Dict[str, asyncio.Future] = {}
 
-        # A queue used to pass CallResults and CallErrors from
-        # the self.serve() task to the self.call() task.
-        self._response_queue = asyncio.Queue()
+        self._json_codec = json_codec
+
+        if validation_policies is None:
+            validation_policies = ValidationPolicies()
+        self._validation_policies = validation_policies
+
+        self._skip_orphaned_responses = skip_orphaned_responses
+
+        self._send_bytes = send_bytes
+
+        self._message_trace = (
+            message_trace if message_trace is not None else default_message_trace
+        )
+
+        self._metrics = metrics
+
+        # Hooks by stage of the message pipeline, see add_hook().
+        self._hooks = {}
+
+        self._writer = None
+        if max_queued_frames is not None:
+            self._writer = FrameWriter(connection, max_queued_frames)
 
         # Function used to generate unique ids for CALLs. By default
         # uuid.uuid4() is used, but it can be changed. This is meant primarily
@@ -233,20 +476,43 @@ class ChargePoint:
     async def start(self):
         while True:
             message = await self._connection.recv()
-            LOGGER.info("%s: receive message %s", self.id, message)
+            self._message_trace.received(self.id, message)
 
             await self.route_message(message)
 
+    async def close(self, flush=True):
+        """
+        Stop the writer task of a ChargePoint created with
+        `max_queued_frames`. By default the queued messages are sent first,
+        like `FrameWriter.close()` does. Pass `flush=False` to discard them,
+        e.g. after start() has returned because the connection was closed.
+        The connection itself isn't closed.
+        """
+        if self._writer is not None:
+            await self._writer.close(flush)
+
     async def route_message(self, raw_msg):
         """
         Route a message received from a CP.
 
         If the message is a of type Call the corresponding hooks are executed.
         If the message is of type CallResult or CallError the message is passed
-        to the call() function via the response_queue.
+        to the call() function by resolving the pending future with the same
+        unique id.
         """
+        context = None
+        if self._hooks:
+            context = {}
+            self._emit(context, RECEIVED, INBOUND, None, None, raw_msg)
+
+        if self._skip_orphaned_responses:
+            unique_id = peek_response_unique_id(raw_msg)
+            if unique_id is not None and unique_id not in self._pending_calls:
+                LOGGER.error("Ignoring response with unknown unique id: %s", unique_id)
+                return
+
         try:
-            msg = unpack(raw_msg)
+            msg = unpack(raw_msg, self._json_codec)
         except OCPPError as e:
             LOGGER.exception(
                 "Unable to parse message: '%s', it doesn't seem "
@@ -256,18 +522,30 @@ class ChargePoint:
             )
             return
 
+        if self._hooks:
+            action = getattr(msg, "action", None)
+            self._emit(context, PARSED, INBOUND, msg.unique_id, action, msg)
+
         if msg.message_type_id == MessageType.Call:
             try:
-                await self._handle_call(msg)
+                await self._handle_call(msg, context)
             except OCPPError as error:
                 LOGGER.exception("Error while handling request '%s'", msg)
-                response = msg.create_call_error(error).to_json()
-                await self._send(response)
+                call_error = msg.create_call_error(error)
+                # The action might be anything, e.g. if there's no route.
+                action = _metric_label(msg.action, self.route_map)
+                self._count_call_error(action, call_error)
+                await self._send_message(call_error, action, context)
 
         elif msg.message_type_id in [MessageType.CallResult, MessageType.CallError]:
-            self._response_queue.put_nowait(msg)
+            future = self._pending_calls.get(msg.unique_id)
+            if future is None or future.done():
+                LOGGER.error("Ignoring response with unknown unique id: %s", msg)
+                return
+
+            future.set_result(msg)
 
-    async def _handle_call(self, msg):
+    async def _handle_call(self, msg, context=None):
         """
         Execute all hooks installed for based on the Action of the message.
 
@@ -278,75 +556,126 @@ class ChargePoint:
 
         Next the '_after_action' hook is executed.
 
+        `context` is passed to the hooks of the pipeline stages, see
+        add_hook().
         """
+        if self._hooks and context is None:
+            context = {}
+
         try:
             handlers = self.route_map[msg.action]
-        except KeyError:
+        except (KeyError, TypeError):
+            # The other side can send any action. It's only used as label
+            # once there's a route for it.
+            if self._metrics is not None:
+                self._metrics.inc("ocpp_messages_received_total", UNKNOWN, "Call")
+            if not isinstance(msg.action, str):
+                raise FormatViolationError(
+                    details={"cause": "The action of a Call must be a string."}
+                )
             _raise_key_error(msg.action, self._ocpp_version)
             return
 
+        if self._metrics is not None:
+            self._metrics.inc("ocpp_messages_received_total", msg.action, "Call")
+
         if not handlers.get("_skip_schema_validation", False):
-            validate_payload(msg, self._ocpp_version)
+            self._validate_payload(msg, INBOUND, handlers.get("_on_action"))
+        if self._hooks:
+            self._emit(context, VALIDATED, INBOUND, msg.unique_id, msg.action, msg)
         # OCPP uses camelCase for the keys in the payload. It's more pythonic
         # to use snake_case for keyword arguments. Therefore the keys must be
         # 'translated'. Some examples:
         #
         # * chargePointVendor becomes charge_point_vendor
         # * firmwareVersion becomes firmwareVersion
-        snake_case_payload = camel_to_snake_case(msg.payload)
+        snake_case_payload = self._to_snake_case(
+            "CALL_TO_SNAKE_CASE", msg.action, msg.payload
+        )
+        if self._hooks:
+            self._emit(
+                context,
+                CONVERTED,
+                INBOUND,
+                msg.unique_id,
+                msg.action,
+                snake_case_payload,
+            )
+
+        # Handlers in the route table of the class are plain functions, the
+        # instance must be passed explicitly.
+        args = (self,) if handlers.get("_requires_instance", False) else ()
 
         try:
             handler = handlers["_on_action"]
         except KeyError:
             _raise_key_error(msg.action, self._ocpp_version)
-        handler_signature = inspect.signature(handler)
-        call_unique_id_required = "call_unique_id" in handler_signature.parameters
+        call_unique_id_required = accepts_call_unique_id(handlers, "_on_action")
         try:
-            # call_unique_id should be passed as kwarg only if is defined explicitly
-            # in the handler signature
-            if call_unique_id_required:
-                response = handler(**snake_case_payload, call_unique_id=msg.unique_id)
-            else:
-                response = handler(**snake_case_payload)
-            if inspect.isawaitable(response):
-                response = await response
+            with self._timer("ocpp_handler_duration_seconds", msg.action):
+                # call_unique_id should be passed as kwarg only if is defined
+                # explicitly in the handler signature
+                if call_unique_id_required:
+                    response = handler(
+                        *args, **snake_case_payload, call_unique_id=msg.unique_id
+                    )
+                else:
+                    response = handler(*args, **snake_case_payload)
+                if inspect.isawaitable(response):
+                    response = await response
         except Exception as e:
             LOGGER.exception("Error while handling request '%s'", msg)
-            response = msg.create_call_error(e).to_json()
-            await self._send(response)
+            call_error = msg.create_call_error(e)
+            self._count_call_error(msg.action, call_error)
+            await self._send_message(call_error, msg.action, context)
 
             return
 
-        temp_response_payload = serialize_as_dict(response)
-
-        # Remove nones ensures that we strip out optional arguments
-        # which were not set and have a default value of None
-        response_payload = remove_nones(temp_response_payload)
+        if self._hooks:
+            self._emit(context, HANDLED, INBOUND, msg.unique_id, msg.action, response)
 
         # The response payload must be 'translated' from snake_case to
         # camelCase. So:
         #
         # * charge_point_vendor becomes chargePointVendor
         # * firmware_version becomes firmwareVersion
-        camel_case_payload = snake_to_camel_case(response_payload)
+        camel_case_payload = self._to_camel_case(
+            "CALL_RESULT_TO_CAMEL_CASE", msg.action, response
+        )
+        if self._hooks:
+            self._emit(
+                context,
+                CONVERTED,
+                OUTBOUND,
+                msg.unique_id,
+                msg.action,
+                camel_case_payload,
+            )
 
         response = msg.create_call_result(camel_case_payload)
 
         if not handlers.get("_skip_schema_validation", False):
-            validate_payload(response, self._ocpp_version)
+            self._validate_payload(response, OUTBOUND)
+        if self._hooks:
+            self._emit(
+                context, VALIDATED, OUTBOUND, msg.unique_id, msg.action, response
+            )
 
-        await self._send(response.to_json())
+        if self._metrics is not None:
+            self._metrics.inc("ocpp_messages_sent_total", msg.action, "CallResult")
+        await self._send_message(response, msg.action, context)
 
         try:
             handler = handlers["_after_action"]
-            handler_signature = inspect.signature(handler)
-            call_unique_id_required = "call_unique_id" in handler_signature.parameters
+            call_unique_id_required = accepts_call_unique_id(handlers, "_after_action")
             # call_unique_id should be passed as kwarg only if is defined explicitly
             # in the handler signature
             if call_unique_id_required:
-                response = handler(**snake_case_payload, call_unique_id=msg.unique_id)
+                response = handler(
+                    *args, **snake_case_payload, call_unique_id=msg.unique_id
+                )
             else:
-                response = handler(**snake_case_payload)
+                response = handler(*args, **snake_case_payload)
             # Create task to avoid blocking when making a call inside the
             # after handler
             if inspect.isawaitable(response):
@@ -371,7 +700,9 @@ class ChargePoint:
 
         When waiting for a response no other Call message can be send. So this
         function will wait before response arrives or response timeout has
-        expired. This is in line the OCPP specification
+        expired. This is in line the OCPP specification. If the ChargePoint has
+        been created with `max_inflight_calls` larger than 1, up to that number
+        of Calls are send before waiting on a response.
 
         Suppress is used to maintain backwards compatibility. When set to True,
         if response is a CallError, then this call will be suppressed. When
@@ -379,8 +710,6 @@ class ChargePoint:
         CallError.
 
         """
-        camel_case_payload = snake_to_camel_case(serialize_as_dict(payload))
-
         unique_id = (
             unique_id if unique_id is not None else str(self._unique_id_generator())
         )
@@ -393,35 +722,82 @@ class ChargePoint:
         call = Call(
             unique_id=unique_id,
             action=action_name,
-            payload=remove_nones(camel_case_payload),
+            payload=self._to_camel_case("CALL_TO_CAMEL_CASE", action_name, payload),
         )
 
-        validate_payload(call, self._ocpp_version)
+        context = None
+        if self._hooks:
+            context = {}
+            self._emit(
+                context, CONVERTED, OUTBOUND, unique_id, action_name, call.payload
+            )
+
+        self._validate_payload(call, OUTBOUND)
+        if self._hooks:
+            self._emit(context, VALIDATED, OUTBOUND, unique_id, action_name, call)
 
         # Use a lock to prevent make sure that only 1 message can be send at a
-        # a time.
+        # a time, or at most `max_inflight_calls` messages when pipelining.
         async with self._call_lock:
-            await self._send(call.to_json())
-            try:
-                response = await self._get_specific_response(
-                    call.unique_id, self._response_timeout
+            if call.unique_id in self._pending_calls:
+                raise ValueError(
+                    f"A call with unique id '{call.unique_id}' is already awaiting "
+                    "a response."
                 )
+
+            # The future must be registered before the Call is sent, otherwise
+            # a fast response could be routed before anyone is waiting for it.
+            self._pending_calls[call.unique_id] = (
+                asyncio.get_running_loop().create_future()
+            )
+            try:
+                if self._metrics is not None:
+                    self._metrics.inc("ocpp_messages_sent_total", call.action, "Call")
+                await self._send_message(call, call.action, context)
+                with self._timer("ocpp_call_duration_seconds", call.action):
+                    response = await self._get_specific_response(
+                        call.unique_id, self._response_timeout
+                    )
             except asyncio.TimeoutError:
                 raise asyncio.TimeoutError(
                     f"Waited {self._response_timeout}s for response on "
-                    f"{call.to_json()}."
+                    f"{call.to_json(self._json_codec)}."
                 )
+            finally:
+                self._pending_calls.pop(call.unique_id, None)
+
+        if self._metrics is not None:
+            self._metrics.inc(
+                "ocpp_messages_received_total", call.action, type(response).__name__
+            )
 
         if response.message_type_id == MessageType.CallError:
             LOGGER.warning("Received a CALLError: %s'", response)
+            if self._metrics is not None:
+                self._metrics.inc(
+                    "ocpp_call_errors_total",
+                    call.action,
+                    _metric_label(response.error_code, _CALL_ERROR_CODES),
+                    INBOUND,
+                )
             if suppress:
                 return
             raise response.to_exception()
         else:
             response.action = call.action
-            validate_payload(response, self._ocpp_version)
+            self._validate_payload(response, INBOUND)
+            if self._hooks:
+                self._emit(
+                    context, VALIDATED, INBOUND, unique_id, call.action, response
+                )
 
-        snake_case_payload = camel_to_snake_case(response.payload)
+        snake_case_payload = self._to_snake_case(
+            "CALL_RESULT_TO_SNAKE_CASE", call.action, response.payload
+        )
+        if self._hooks:
+            self._emit(
+                context, CONVERTED, INBOUND, unique_id, call.action, snake_case_payload
+            )
         # Create the correct Payload instance based on the received payload. If
         # this method is called with a call.BootNotificationPayload, then it
         # will create a call_result.BootNotificationPayload. If this method is
@@ -430,28 +806,138 @@ class ChargePoint:
         cls = getattr(self._call_result, payload.__class__.__name__)  # noqa
         return cls(**snake_case_payload)
 
-    async def _get_specific_response(self, unique_id, timeout):
+    def _validate_payload(self, message, direction, handler=None):
         """
-        Return response with given unique ID or raise an asyncio.TimeoutError.
+        Validate the payload of a message that is received, `INBOUND`, or
+        sent, `OUTBOUND`, if the validation policy for its action wants so.
+        `handler` is the handler of a received Call.
+        """
+        with self._timer("ocpp_validation_duration_seconds", message.action, direction):
+            self._validation_policies.validate(
+                self.id, message, self._ocpp_version, direction, handler
+            )
+
+    def _to_snake_case(self, converters, action, payload):
+        """
+        Translate the camelCase `payload` of a message into a snake_case
+        `dict` using the generated converter for `action`. `converters` is the
+        name of the table in `self._converters`, e.g. 'CALL_TO_SNAKE_CASE'.
+        """
+        try:
+            convert = getattr(self._converters, converters)[action]
+        except (AttributeError, KeyError):
+            convert = camel_to_snake_case
+
+        with self._timer(
+            "ocpp_serialization_duration_seconds", action, "to_snake_case"
+        ):
+            return convert(payload)
+
+    def _to_camel_case(self, converters, action, payload):
+        """
+        Translate the dataclass `payload` into a camelCase `dict` without
+        None values using the generated converter for `action`. `converters`
+        is the name of the table in `self._converters`, e.g.
+        'CALL_TO_CAMEL_CASE'.
         """
-        wait_until = time.time() + timeout
         try:
-            # Wait for response of the Call message.
-            response = await asyncio.wait_for(self._response_queue.get(), timeout)
-        except asyncio.TimeoutError:
-            raise
+            convert = getattr(self._converters, converters)[action]
+        except (AttributeError, KeyError):
+            convert = serialize_as_camel_case
 
-        if response.unique_id == unique_id:
-            return response
+        with self._timer(
+            "ocpp_serialization_duration_seconds", action, "to_camel_case"
+        ):
+            return convert(payload)
 
-        LOGGER.error("Ignoring response with unknown unique id: %s", response)
-        timeout_left = wait_until - time.time()
+    async def _get_specific_response(self, unique_id, timeout):
+        """
+        Return response with given unique ID or raise an asyncio.TimeoutError.
+
+        The response is delivered by route_message() through the future that
+        has been registered in `self._pending_calls` for the unique ID.
+        """
+        return await asyncio.wait_for(self._pending_calls[unique_id], timeout)
+
+    def _serialize(self, message, action):
+        """Return the message as it's passed to `self._send()`. `action` is
+        the action of the message, or of the Call a CallError responds to."""
+        with self._timer("ocpp_serialization_duration_seconds", action, "encode"):
+            if self._send_bytes:
+                return message.to_bytes(self._json_codec)
+            return message.to_json(self._json_codec)
+
+    async def _send_message(self, message, action, context=None):
+        """Serialize and send the message. `action` is the action of the
+        message, or of the Call a CallError responds to."""
+        frame = self._serialize(message, action)
+        if self._hooks:
+            self._emit(context, SERIALIZED, OUTBOUND, message.unique_id, action, frame)
+
+        await self._send(frame)
+        if self._hooks:
+            self._emit(context, SENT, OUTBOUND, message.unique_id, action, frame)
+
+    def add_hook(self, hook, stages=STAGES):
+        """
+        Call `hook` with an `ocpp.hooks.StageEvent` whenever a message passes
+        one of the `stages` of the pipeline, by default all stages. The hook
+        must not block, it's called by the coroutine handling the message.
+        Exceptions raised by the hook are logged and otherwise ignored.
+        """
+        for stage in stages:
+            if stage not in STAGES:
+                raise ValueError(f"Unknown stage '{stage}'.")
+            self._hooks.setdefault(stage, []).append(hook)
+
+    def remove_hook(self, hook):
+        """Stop calling `hook` at any stage."""
+        for stage in list(self._hooks):
+            self._hooks[stage] = [h for h in self._hooks[stage] if h is not hook]
+            if not self._hooks[stage]:
+                del self._hooks[stage]
+
+    def _emit(self, context, stage, direction, unique_id, action, data):
+        """Call the hooks of the stage."""
+        hooks = self._hooks.get(stage)
+        if not hooks:
+            return
 
-        if timeout_left < 0:
-            raise asyncio.TimeoutError
+        event = StageEvent(stage, self.id, direction, unique_id, action, data, context)
+        for hook in hooks:
+            # A failing hook must not affect the handling of the message.
+            try:
+                hook(event)
+            except Exception:
+                LOGGER.exception("Error in hook %r at stage '%s'", hook, stage)
+
+    def _timer(self, name, *labels):
+        """Return a context manager that records the time spent in it in
+        the histogram `name` of `self._metrics`, if any."""
+        if self._metrics is None:
+            return _NO_TIMER
+        return self._metrics.time(name, *labels)
+
+    def _count_call_error(self, action, call_error):
+        if self._metrics is not None:
+            self._metrics.inc("ocpp_messages_sent_total", action, "CallError")
+            self._metrics.inc(
+                "ocpp_call_errors_total", action, call_error.error_code, OUTBOUND
+            )
 
-        return await self._get_specific_response(unique_id, timeout_left)
+    @property
+    def congested(self):
+        """
+        Whether the queue of outgoing messages is filling up. Handlers and
+        callers of call() can use it to hold back optional messages. Always
+        False if the ChargePoint has been created without
+        `max_queued_frames`.
+        """
+        return self._writer is not None and self._writer.congested
 
     async def _send(self, message):
-        LOGGER.info("%s: send %s", self.id, message)
-        await self._connection.send(message)
+        self._message_trace.sent(self.id, message)
+        if self._writer is not None:
+            await self._writer.send(message)
+        else:
+            await self._connection.send(message)
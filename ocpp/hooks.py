@@ -0,0 +1,136 @@
+"""
+Hooks that are called at the stages of the message pipeline of a
+`ChargePoint`.
+
+A Call received by `route_message()` passes these stages:
+
+* `RECEIVED`: the raw message has been received.
+* `PARSED`: the message has been unpacked.
+* `VALIDATED`: the payload has been validated, or the validation policy
+  skipped it.
+* `CONVERTED`: the payload has been converted to snake_case.
+* `HANDLED`: the handler returned its response.
+* `CONVERTED`, `VALIDATED`, `SERIALIZED` and `SENT` for the response.
+
+A Call sent by `call()` passes `CONVERTED`, `VALIDATED`, `SERIALIZED` and
+`SENT`, followed by `VALIDATED` and `CONVERTED` for the response. The response
+itself passes `RECEIVED` and `PARSED` in `route_message()`.
+
+A hook is a callable that takes a `StageEvent`. Register it for some or all
+stages with `ChargePoint.add_hook()`:
+
+    charge_point.add_hook(SpanExporter(open("spans.jsonl", "a")))
+
+If no hooks are registered, the pipeline doesn't create any events.
+
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+RECEIVED = "received"
+PARSED = "parsed"
+VALIDATED = "validated"
+CONVERTED = "converted"
+HANDLED = "handled"
+SERIALIZED = "serialized"
+SENT = "sent"
+
+STAGES = (RECEIVED, PARSED, VALIDATED, CONVERTED, HANDLED, SERIALIZED, SENT)
+
+
+class StageEvent:
+    """
+    A message reached a stage of the pipeline.
+
+    `data` depends on the stage: the raw message for RECEIVED and SENT, the
+    message for PARSED and VALIDATED, the converted payload for CONVERTED,
+    the return value of the handler for HANDLED and the encoded message for
+    SERIALIZED. `unique_id` and `action` are None if they aren't known yet.
+
+    `context` is a `dict` shared by all events of a single pass through the
+    pipeline, e.g. the handling of one Call. Hooks may use it to keep state.
+    """
+
+    __slots__ = (
+        "stage",
+        "charge_point_id",
+        "direction",
+        "unique_id",
+        "action",
+        "data",
+        "time_ns",
+        "context",
+    )
+
+    def __init__(
+        self,
+        stage: str,
+        charge_point_id,
+        direction: str,
+        unique_id,
+        action: Optional[str],
+        data: Any,
+        context: Dict,
+    ):
+        self.stage = stage
+        self.charge_point_id = charge_point_id
+        self.direction = direction
+        self.unique_id = unique_id
+        self.action = action
+        self.data = data
+        self.context = context
+        # Nanoseconds since the epoch.
+        self.time_ns = time.time_ns()
+
+    def __repr__(self):
+        return (
+            f"<StageEvent - stage={self.stage}, "
+            f"charge_point_id={self.charge_point_id}, "
+            f"direction={self.direction}, unique_id={self.unique_id}, "
+            f"action={self.action}>"
+        )
+
+
+class SpanExporter:
+    """
+    Hook that writes a span per stage to a file, one JSON object per line.
+    The spans have the fields of spans in the OpenTelemetry protocol (OTLP).
+    A span covers the time since the previous stage of the same pass through
+    the pipeline, all spans of a pass share the same trace id.
+    """
+
+    def __init__(self, file):
+        self._file = file
+
+    def __call__(self, event: StageEvent) -> None:
+        context = event.context
+        try:
+            trace_id = context["trace_id"]
+            start = context["last_time_ns"]
+        except KeyError:
+            trace_id = context["trace_id"] = os.urandom(16).hex()
+            start = event.time_ns
+        context["last_time_ns"] = event.time_ns
+
+        attributes = {
+            "ocpp.charge_point_id": event.charge_point_id,
+            "ocpp.direction": event.direction,
+            "ocpp.unique_id": event.unique_id,
+            "ocpp.action": event.action,
+        }
+        span = {
+            "traceId": trace_id,
+            "spanId": os.urandom(8).hex(),
+            "name": event.stage,
+            "startTimeUnixNano": start,
+            "endTimeUnixNano": event.time_ns,
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in attributes.items()
+                if value is not None
+            ],
+        }
+        self._file.write(json.dumps(span) + "\n")
@@ -5,8 +5,10 @@ from __future__ import annotations
 import decimal
 import json
 import os
+import re
+import tempfile
 from dataclasses import asdict, is_dataclass
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, Optional, Union
 
 from jsonschema import Draft4Validator
 from jsonschema.exceptions import ValidationError as SchemaValidationError
@@ -24,6 +26,9 @@ from ocpp.exceptions import (
 
 _validators: Dict[str, Draft4Validator] = {}
 
+# Class used to create validators from the JSON schemas.
+_validator_class = Draft4Validator
+
 
 class _DecimalEncoder(json.JSONEncoder):
     """Encode values of type `decimal.Decimal` using 1 decimal point.
@@ -62,6 +67,120 @@ class _DecimalEncoder(json.JSONEncoder):
                 raise e
 
 
+def _encode_default(obj):
+    """Encode the types that aren't supported by the JSON encoders in the same
+    way as `_DecimalEncoder`."""
+    if isinstance(obj, decimal.Decimal):
+        return float("%.1f" % obj)
+    try:
+        return obj.to_json()
+    except AttributeError:
+        raise TypeError(
+            f"Object of type {obj.__class__.__name__} is not JSON serializable"
+        )
+
+
+class JSONCodec:
+    """Encode and decode OCPP messages using the `json` module of the standard
+    library.
+
+    A codec has 3 methods: `loads()` takes a JSON document as `str`, `bytes`,
+    `bytearray` or `memoryview` and returns the decoded object, or raises a
+    `json.JSONDecodeError`. `dumps()` takes an object and returns a compact
+    JSON representation as `str`, `dumps_bytes()` returns it UTF-8 encoded as
+    `bytes`. Values of type `decimal.Decimal` are encoded like
+    `_DecimalEncoder` does.
+
+    The codec can be configured globally with `set_json_codec()` or per
+    ChargePoint.
+    """
+
+    def loads(self, data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps_bytes(self, obj):
+        return self.dumps(obj).encode("utf-8")
+
+    def dumps(self, obj):
+        return json.dumps(
+            obj,
+            # By default json.dumps() adds a white space after every separator.
+            # By setting the separator manually that can be avoided.
+            separators=(",", ":"),
+            cls=_DecimalEncoder,
+        )
+
+
+class OrjsonCodec(JSONCodec):
+    """Encode and decode OCPP messages using orjson.
+
+    orjson is significantly faster than the `json` module. Note that, unlike
+    `JSONCodec`, non-ASCII characters aren't escaped. Objects that orjson
+    can't encode, like integers larger than 64 bits, are encoded with the
+    `json` module.
+
+    Raises an ImportError if orjson isn't installed.
+    """
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data):
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError.
+        return self._orjson.loads(data)
+
+    def dumps_bytes(self, obj):
+        try:
+            return self._orjson.dumps(obj, default=_encode_default)
+        except TypeError:
+            return super().dumps(obj).encode("utf-8")
+
+    def dumps(self, obj):
+        return self.dumps_bytes(obj).decode("utf-8")
+
+
+_json_codec: JSONCodec = JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    """Return the codec that is used when no codec is passed explicitly."""
+    return _json_codec
+
+
+def set_json_codec(codec: JSONCodec) -> None:
+    """Set the codec that is used when no codec is passed explicitly.
+
+    For example, to use orjson for all messages:
+
+        set_json_codec(OrjsonCodec())
+
+    """
+    global _json_codec
+    _json_codec = codec
+
+
+def set_validator_class(validator_class) -> None:
+    """Set the class used to create validators from the JSON schemas.
+
+    The class is instantiated with a schema and must implement `validate()`
+    like `Draft4Validator`, the default. For example, to use validators
+    compiled into Python code:
+
+        from ocpp.schema_compiler import CompiledValidator
+
+        set_validator_class(CompiledValidator)
+
+    Validators that have been created already are discarded.
+    """
+    global _validator_class
+    _validator_class = validator_class
+    _validators.clear()
+
+
 class MessageType:
     """Number identifying the different types of OCPP messages."""
 
@@ -75,13 +194,16 @@ class MessageType:
     CallError = 4
 
 
-def unpack(msg):
+def unpack(msg, codec: Optional[JSONCodec] = None):
     """
     Unpacks a message into either a Call, CallError or CallResult.
+
+    The message is decoded with the given `codec` or, if it isn't given, with
+    the codec configured with `set_json_codec()`.
     """
     try:
-        msg = json.loads(msg)
-    except json.JSONDecodeError:
+        msg = (codec or _json_codec).loads(msg)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         raise FormatViolationError(
             details={"cause": "Message is not valid JSON", "ocpp_message": msg}
         )
@@ -97,38 +219,82 @@ def unpack(msg):
             }
         )
 
-    for cls in [Call, CallResult, CallError]:
-        try:
-            if msg[0] == cls.message_type_id:
-                return cls(*msg[1:])
-        except IndexError:
-            raise ProtocolError(
-                details={"cause": "Message does not contain MessageTypeId"}
-            )
-        except TypeError:
-            raise ProtocolError(details={"cause": "Message is missing elements."})
+    try:
+        cls = _message_classes[msg[0]]
+    except IndexError:
+        raise ProtocolError(details={"cause": "Message does not contain MessageTypeId"})
+    except (KeyError, TypeError):
+        # A TypeError is raised if the MessageTypeId isn't hashable.
+        raise PropertyConstraintViolationError(
+            details={"cause": f"MessageTypeId '{msg[0]}' isn't valid"}
+        )
+
+    try:
+        return cls(*msg[1:])
+    except TypeError:
+        raise ProtocolError(details={"cause": "Message is missing elements."})
+
+
+# Matches the start of a CallResult or CallError with a string as unique id.
+_RESPONSE_HEADER = re.compile(r'\s*\[\s*([34])\s*,\s*"([^"\\]*)"')
+_RESPONSE_HEADER_BYTES = re.compile(_RESPONSE_HEADER.pattern.encode("utf-8"))
 
-    raise PropertyConstraintViolationError(
-        details={"cause": f"MessageTypeId '{msg[0]}' isn't valid"}
-    )
+
+def peek_response_unique_id(msg) -> Optional[str]:
+    """
+    Return the unique id of a CallResult or CallError without decoding the
+    message. None is returned for Calls and for messages of which the unique
+    id can't be found cheaply, those must be unpacked to find out.
+    """
+    if isinstance(msg, str):
+        match = _RESPONSE_HEADER.match(msg)
+        return None if match is None else match.group(2)
+
+    # Only the unique id is decoded, not the complete message.
+    match = _RESPONSE_HEADER_BYTES.match(msg)
+    if match is None:
+        return None
+    try:
+        return match.group(2).decode("utf-8")
+    except UnicodeDecodeError:
+        return None
 
 
-def pack(msg):
+def pack(msg, codec: Optional[JSONCodec] = None, as_bytes: bool = False):
     """
     Returns the JSON representation of a Call, CallError or CallResult.
 
-    It just calls the 'to_json()' method of the message. But it is here mainly
-    to complement the 'unpack' function of this module.
+    It just calls the 'to_json()' method of the message, or 'to_bytes()' if
+    `as_bytes` is True. But it is here mainly to complement the 'unpack'
+    function of this module.
     """
-    return msg.to_json()
+    if as_bytes:
+        return msg.to_bytes(codec)
+    return msg.to_json(codec)
+
+
+def _schemas_dir(ocpp_version: str) -> str:
+    """Return the path of the directory with the JSON schemas of a version."""
+    dir, _ = os.path.split(os.path.realpath(__file__))
+    return os.path.join(dir, "v" + ocpp_version.replace(".", ""), "schemas")
+
+
+def _read_schema_document(path: str) -> str:
+    # The JSON schemas for OCPP 2.0 start with a byte order mark (BOM)
+    # character. If no encoding is given, reading the schema would fail with:
+    #
+    #     Unexpected UTF-8 BOM (decode using utf-8-sig):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return f.read()
 
 
 def get_validator(
     message_type_id: int, action: str, ocpp_version: str, parse_float: Callable = float
 ) -> Draft4Validator:
     """
-    Read schema from disk and return as `Draft4Validator`. Instances will be
-    cached for performance reasons.
+    Read schema from disk and return as `Draft4Validator`, or as instance of
+    the class set with `set_validator_class()`. Instances will be cached for
+    performance reasons.
 
     The `parse_float` argument can be used to set the conversion method that
     is used to parse floats. It must be a callable taking 1 argument. By
@@ -137,8 +303,6 @@ def get_validator(
     if ocpp_version not in ["1.6", "2.0", "2.0.1"]:
         raise ValueError
 
-    schemas_dir = "v" + ocpp_version.replace(".", "")
-
     schema_name = action
     if message_type_id == MessageType.CallResult:
         schema_name += "Response"
@@ -153,22 +317,105 @@ def get_validator(
     if cache_key in _validators:
         return _validators[cache_key]
 
-    dir, _ = os.path.split(os.path.realpath(__file__))
-    relative_path = f"{schemas_dir}/schemas/{schema_name}.json"
-    path = os.path.join(dir, relative_path)
-
-    # The JSON schemas for OCPP 2.0 start with a byte order mark (BOM)
-    # character. If no encoding is given, reading the schema would fail with:
-    #
-    #     Unexpected UTF-8 BOM (decode using utf-8-sig):
-    with open(path, "r", encoding="utf-8-sig") as f:
-        data = f.read()
-        validator = Draft4Validator(json.loads(data, parse_float=parse_float))
-        _validators[cache_key] = validator
+    path = os.path.join(_schemas_dir(ocpp_version), f"{schema_name}.json")
+    data = _read_schema_document(path)
+    validator = _validator_class(json.loads(data, parse_float=parse_float))
+    _validators[cache_key] = validator
 
     return _validators[cache_key]
 
 
+# The OCPP 1.6 schemas that must be parsed with `decimal.Decimal()` as float
+# parser. See validate_payload() for more details.
+_DECIMAL_SCHEMAS = {
+    "1.6": [
+        "SetChargingProfile",
+        "RemoteStartTransaction",
+        "GetCompositeScheduleResponse",
+    ]
+}
+
+
+def _write_bundle(bundle: str, data: Dict) -> None:
+    """Write the bundle atomically. Processes that start at the same time
+    read either no bundle or a complete one, never a partially written
+    file."""
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(bundle)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, bundle)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def preload_validators(ocpp_version: str, bundle: Optional[str] = None) -> int:
+    """
+    Create the validators for all JSON schemas of the given OCPP version, so
+    that the first message of every action doesn't have to wait for its
+    schema to be read from disk. Returns the number of validators.
+
+    If the path of a `bundle` is given, all schemas are read from that single
+    file. If the file doesn't exist yet, it's created from the schemas of the
+    version. The bundle must be removed after upgrading this library.
+    """
+    if ocpp_version not in ["1.6", "2.0", "2.0.1"]:
+        raise ValueError
+
+    decimal_schemas = _DECIMAL_SCHEMAS.get(ocpp_version, [])
+
+    if bundle is not None and os.path.exists(bundle):
+        with open(bundle, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data["ocpp_version"] != ocpp_version:
+            raise ValueError(
+                f"Bundle {bundle} contains schemas for OCPP {data['ocpp_version']}, "
+                f"not for OCPP {ocpp_version}."
+            )
+
+        schemas = data["schemas"]
+        decimal_documents = data["decimal_schemas"]
+    else:
+        schemas_dir = _schemas_dir(ocpp_version)
+        schemas = {}
+        decimal_documents = {}
+        for file_name in sorted(os.listdir(schemas_dir)):
+            name, extension = os.path.splitext(file_name)
+            if extension != ".json":
+                continue
+
+            document = _read_schema_document(os.path.join(schemas_dir, file_name))
+            if name in decimal_schemas:
+                decimal_documents[name] = document
+            else:
+                schemas[name] = json.loads(document)
+
+        if bundle is not None:
+            # JSON can't express that some schemas must be parsed with a
+            # different float parser. Therefore these schemas are stored as
+            # JSON documents in a string.
+            _write_bundle(
+                bundle,
+                {
+                    "ocpp_version": ocpp_version,
+                    "schemas": schemas,
+                    "decimal_schemas": decimal_documents,
+                },
+            )
+
+    for name, document in decimal_documents.items():
+        schemas[name] = json.loads(document, parse_float=decimal.Decimal)
+
+    for name, schema in schemas.items():
+        _validators[name + "_" + ocpp_version] = _validator_class(schema)
+
+    return len(schemas)
+
+
 def validate_payload(message: Union[Call, CallResult], ocpp_version: str) -> None:
     """Validate the payload of the message using JSON schemas."""
     if type(message) not in [Call, CallResult]:
@@ -243,8 +490,10 @@ def validate_payload(message: Union[Call, CallResult], ocpp_version: str) -> Non
         else:
             raise FormatViolationError(
                 details={
-                    "cause": f"Payload '{message.payload}' for action "
-                    f"'{message.action}' is not valid: {e}",
+                    # The payload is available via the message, formatting it
+                    # and the schema into the cause would be expensive.
+                    "cause": f"Payload for action '{message.action}' is not "
+                    f"valid: {e.message}",
                     "ocpp_message": message,
                 }
             )
@@ -279,6 +528,8 @@ class Call:
 
     message_type_id = 2
 
+    __slots__ = ("unique_id", "action", "payload")
+
     def __init__(self, unique_id, action, payload):
         self.unique_id = unique_id
         self.action = action
@@ -287,20 +538,17 @@ class Call:
         if is_dataclass(payload):
             self.payload = asdict(payload)
 
-    def to_json(self):
+    def to_json(self, codec: Optional[JSONCodec] = None):
         """Return a valid JSON representation of the instance."""
-        return json.dumps(
-            [
-                self.message_type_id,
-                self.unique_id,
-                self.action,
-                self.payload,
-            ],
-            # By default json.dumps() adds a white space after every separator.
-            # By setting the separator manually that can be avoided.
-            separators=(",", ":"),
-            cls=_DecimalEncoder,
-        )
+        return (codec or _json_codec).dumps(self._as_list())
+
+    def to_bytes(self, codec: Optional[JSONCodec] = None):
+        """Return the JSON representation of the instance as UTF-8 encoded
+        bytes."""
+        return (codec or _json_codec).dumps_bytes(self._as_list())
+
+    def _as_list(self):
+        return [self.message_type_id, self.unique_id, self.action, self.payload]
 
     def create_call_result(self, payload):
         call_result = CallResult(self.unique_id, payload)
@@ -361,6 +609,8 @@ class CallResult:
 
     message_type_id = 3
 
+    __slots__ = ("unique_id", "payload", "action")
+
     def __init__(self, unique_id, payload, action=None):
         self.unique_id = unique_id
         self.payload = payload
@@ -369,18 +619,14 @@ class CallResult:
         # to validate the message it is needed.
         self.action = action
 
-    def to_json(self):
-        return json.dumps(
-            [
-                self.message_type_id,
-                self.unique_id,
-                self.payload,
-            ],
-            # By default json.dumps() adds a white space after every separator.
-            # By setting the separator manually that can be avoided.
-            separators=(",", ":"),
-            cls=_DecimalEncoder,
-        )
+    def to_json(self, codec: Optional[JSONCodec] = None):
+        return (codec or _json_codec).dumps(self._as_list())
+
+    def to_bytes(self, codec: Optional[JSONCodec] = None):
+        return (codec or _json_codec).dumps_bytes(self._as_list())
+
+    def _as_list(self):
+        return [self.message_type_id, self.unique_id, self.payload]
 
     def __repr__(self):
         return (
@@ -407,26 +653,28 @@ class CallError:
 
     message_type_id = 4
 
+    __slots__ = ("unique_id", "error_code", "error_description", "error_details")
+
     def __init__(self, unique_id, error_code, error_description, error_details=None):
         self.unique_id = unique_id
         self.error_code = error_code
         self.error_description = error_description
         self.error_details = error_details
 
-    def to_json(self):
-        return json.dumps(
-            [
-                self.message_type_id,
-                self.unique_id,
-                self.error_code,
-                self.error_description,
-                self.error_details,
-            ],
-            # By default json.dumps() adds a white space after every separator.
-            # By setting the separator manually that can be avoided.
-            separators=(",", ":"),
-            cls=_DecimalEncoder,
-        )
+    def to_json(self, codec: Optional[JSONCodec] = None):
+        return (codec or _json_codec).dumps(self._as_list())
+
+    def to_bytes(self, codec: Optional[JSONCodec] = None):
+        return (codec or _json_codec).dumps_bytes(self._as_list())
+
+    def _as_list(self):
+        return [
+            self.message_type_id,
+            self.unique_id,
+            self.error_code,
+            self.error_description,
+            self.error_details,
+        ]
 
     def to_exception(self):
         """Return the exception that corresponds to the CallError."""
@@ -448,3 +696,11 @@ class CallError:
             f"error_description={self.error_description}, "
             f"error_details={self.error_details}>"
         )
+
+
+# The message classes by MessageTypeId.
+_message_classes = {
+    MessageType.Call: Call,
+    MessageType.CallResult: CallResult,
+    MessageType.CallError: CallError,
+}
@@ -0,0 +1,244 @@
+"""
+Metrics of the messages handled by charge points.
+
+A `ChargePoint` created with a `Metrics` registry records:
+
+* `ocpp_messages_received_total` and `ocpp_messages_sent_total`: the number
+  of messages by action and message type.
+* `ocpp_handler_duration_seconds`: the time taken by the handlers of Calls.
+* `ocpp_validation_duration_seconds`: the time taken by validating payloads.
+* `ocpp_serialization_duration_seconds`: the time taken by converting
+  payloads to snake_case and to camelCase and by encoding outbound messages,
+  by `stage`.
+* `ocpp_call_errors_total`: the number of CallErrors by error code.
+* `ocpp_call_duration_seconds`: the round trip time of call().
+
+Label values that are controlled by the other side, like the action of a
+received Call or the error code of a received CallError, are recorded as
+`UNKNOWN` unless they're known, so peers can't create new series at will.
+
+A registry can be shared by all charge points of a central system. Its
+contents are exported in the text format of Prometheus by `export()`, which
+`start_metrics_server()` serves over HTTP:
+
+    metrics = Metrics()
+    await start_metrics_server(metrics, port=9100)
+    charge_point = ChargePoint("CP_1", connection, metrics=metrics)
+
+"""
+
+import asyncio
+import bisect
+import time
+from typing import Dict, Sequence, Tuple
+
+# Label value of actions and error codes that aren't known.
+UNKNOWN = "unknown"
+
+# Upper bounds in seconds of the buckets of the histograms.
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# The type, description and label names of every metric.
+METRICS = {
+    "ocpp_messages_received_total": (
+        "counter",
+        "Number of messages received.",
+        ("action", "message_type"),
+    ),
+    "ocpp_messages_sent_total": (
+        "counter",
+        "Number of messages sent.",
+        ("action", "message_type"),
+    ),
+    "ocpp_call_errors_total": (
+        "counter",
+        "Number of CallErrors received or sent.",
+        ("action", "error_code", "direction"),
+    ),
+    "ocpp_handler_duration_seconds": (
+        "histogram",
+        "Time taken by the handlers of Calls.",
+        ("action",),
+    ),
+    "ocpp_validation_duration_seconds": (
+        "histogram",
+        "Time taken by validating payloads.",
+        ("action", "direction"),
+    ),
+    "ocpp_serialization_duration_seconds": (
+        "histogram",
+        "Time taken by converting and encoding payloads.",
+        ("action", "stage"),
+    ),
+    "ocpp_call_duration_seconds": (
+        "histogram",
+        "Time between sending a Call and receiving its response.",
+        ("action",),
+    ),
+}
+
+
+class Histogram:
+    """Counts of observations per bucket, like a Prometheus histogram."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # The last count is of observations larger than the largest bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Timer:
+    __slots__ = ("_metrics", "_name", "_labels", "_start")
+
+    def __init__(self, metrics, name, labels):
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Failures, like a call() that timed out, would distort the durations.
+        if exc_type is None:
+            self._metrics.observe(
+                self._name, time.perf_counter() - self._start, *self._labels
+            )
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    labels = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + labels + "}"
+
+
+class Metrics:
+    """Registry of the counters and histograms listed in `METRICS`."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counters: Dict[str, Dict[Tuple, int]] = {}
+        self.histograms: Dict[str, Dict[Tuple, Histogram]] = {}
+
+    def inc(self, name: str, *labels) -> None:
+        """Increment the counter with the given label values."""
+        # Label values are stored as str, so export() can sort them.
+        labels = tuple(map(str, labels))
+        counters = self.counters.setdefault(name, {})
+        counters[labels] = counters.get(labels, 0) + 1
+
+    def observe(self, name: str, seconds: float, *labels) -> None:
+        """Add an observation to the histogram with the given label values."""
+        labels = tuple(map(str, labels))
+        histograms = self.histograms.setdefault(name, {})
+        try:
+            histogram = histograms[labels]
+        except KeyError:
+            histogram = histograms[labels] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def time(self, name: str, *labels) -> _Timer:
+        """Return a context manager that observes the time spent in it,
+        unless it's left with an exception."""
+        return _Timer(self, name, labels)
+
+    def export(self) -> str:
+        """Return all metrics in the text format of Prometheus."""
+        lines = []
+        for name, (type, description, label_names) in METRICS.items():
+            if name not in self.counters and name not in self.histograms:
+                continue
+
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {type}")
+
+            for labels, value in sorted(self.counters.get(name, {}).items()):
+                lines.append(f"{name}{_format_labels(label_names, labels)} {value}")
+
+            for labels, histogram in sorted(self.histograms.get(name, {}).items()):
+                cumulative = 0
+                for bound, count in zip(
+                    histogram.buckets + (float("inf"),), histogram.counts
+                ):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    bucket_labels = _format_labels(
+                        label_names + ("le",), labels + (le,)
+                    )
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+
+                formatted = _format_labels(label_names, labels)
+                lines.append(f"{name}_sum{formatted} {histogram.sum!r}")
+                lines.append(f"{name}_count{formatted} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+async def start_metrics_server(
+    metrics: Metrics, host: str = "127.0.0.1", port: int = 9100
+) -> asyncio.AbstractServer:
+    """
+    Serve the metrics over HTTP at /metrics. By default the server only
+    listens on the loopback interface. Returns the `asyncio.Server`, close it
+    to stop serving.
+    """
+
+    async def handle(reader, writer):
+        try:
+            request_line = await reader.readline()
+            # Skip the headers of the request.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                status = "200 OK"
+                body = metrics.export().encode("utf-8")
+            else:
+                status = "404 Not Found"
+                body = b"Not Found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,268 @@
+"""
+A registry of the stations connected to a central system.
+
+Stations are looked up by id in O(1). Next to that the registry keeps
+secondary indexes, which are updated incrementally by the messages of the
+stations:
+
+* `on_boot_notification()`: the vendor and model of the station.
+* `on_status_notification()`: the status of every connector.
+* `on_heartbeat()`: the last time the station has been seen. The other
+  methods update it as well.
+
+Stations can be put in a group, e.g. a site, when they're registered. Queries
+combine the indexes and never scan the whole fleet:
+
+    registry = StationRegistry()
+    registry.register("CP_1", charge_point, group="Brussels")
+    registry.on_status_notification("CP_1", evse_id=1, connector_id=1,
+                                    connector_status="Occupied")
+
+    registry.query(status="Occupied", group="Brussels")  # {"CP_1"}
+
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+
+class StationRecord:
+    """What the registry knows about a single station."""
+
+    __slots__ = (
+        "id",
+        "connection",
+        "group",
+        "vendor",
+        "model",
+        "firmware_version",
+        "connectors",
+        "last_seen",
+    )
+
+    def __init__(self, id: str, connection: Any, group: Optional[str]):
+        self.id = id
+        self.connection = connection
+        self.group = group
+        self.vendor: Optional[str] = None
+        self.model: Optional[str] = None
+        self.firmware_version: Optional[str] = None
+        # Status by (evse id, connector id).
+        self.connectors: Dict[Tuple[int, int], str] = {}
+        self.last_seen: Optional[float] = None
+
+    def __repr__(self):
+        return (
+            f"<StationRecord - id={self.id}, group={self.group}, "
+            f"vendor={self.vendor}, model={self.model}, "
+            f"connectors={self.connectors}>"
+        )
+
+
+def _add(index: Dict[Any, Set], key, value) -> None:
+    try:
+        index[key].add(value)
+    except KeyError:
+        index[key] = {value}
+
+
+def _discard(index: Dict[Any, Set], key, value) -> None:
+    values = index.get(key)
+    if values is not None:
+        values.discard(value)
+        if not values:
+            del index[key]
+
+
+class StationRegistry:
+    """
+    Connected stations with indexes by group, vendor and model, connector
+    status and last-seen time.
+
+    Args:
+
+        clock (callable): Returns the current time in seconds, by default
+            `time.time()`.
+
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._stations: Dict[str, StationRecord] = {}
+
+        self._by_group: Dict[str, Set[str]] = {}
+        self._by_vendor: Dict[str, Set[str]] = {}
+        self._by_model: Dict[Tuple[str, str], Set[str]] = {}
+        # Number of connectors per station by status.
+        self._by_status: Dict[str, Dict[str, int]] = {}
+        # (station id, evse id, connector id) by status.
+        self._connectors_by_status: Dict[str, Set[Tuple[str, int, int]]] = {}
+        # Station ids ordered from least to most recently seen.
+        self._by_last_seen: "OrderedDict[str, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._stations)
+
+    def __contains__(self, station_id) -> bool:
+        return station_id in self._stations
+
+    def __iter__(self) -> Iterator[StationRecord]:
+        return iter(self._stations.values())
+
+    def get(self, station_id: str) -> Optional[StationRecord]:
+        return self._stations.get(station_id)
+
+    def register(
+        self, station_id: str, connection: Any = None, group: Optional[str] = None
+    ) -> StationRecord:
+        """Add a station that connected. A station that reconnects replaces
+        its previous record."""
+        if station_id in self._stations:
+            self.unregister(station_id)
+
+        record = self._stations[station_id] = StationRecord(
+            station_id, connection, group
+        )
+        if group is not None:
+            _add(self._by_group, group, station_id)
+        self.on_heartbeat(station_id)
+        return record
+
+    def unregister(self, station_id: str) -> Optional[StationRecord]:
+        """Remove a station that disconnected and return its record."""
+        record = self._stations.pop(station_id, None)
+        if record is None:
+            return None
+
+        if record.group is not None:
+            _discard(self._by_group, record.group, station_id)
+        self._unindex_model(record)
+        for (evse_id, connector_id), status in record.connectors.items():
+            self._unindex_status(station_id, evse_id, connector_id, status)
+        self._by_last_seen.pop(station_id, None)
+        return record
+
+    def on_boot_notification(self, station_id: str, charging_station: Dict) -> None:
+        """Index the vendor and model of the snake_case `charging_station` of
+        a BootNotification."""
+        record = self._stations[station_id]
+        self._unindex_model(record)
+
+        record.vendor = charging_station.get("vendor_name")
+        record.model = charging_station.get("model")
+        record.firmware_version = charging_station.get("firmware_version")
+        if record.vendor is not None:
+            _add(self._by_vendor, record.vendor, station_id)
+            _add(self._by_model, (record.vendor, record.model), station_id)
+        self.on_heartbeat(station_id)
+
+    def on_status_notification(
+        self, station_id: str, evse_id: int, connector_id: int, connector_status: str
+    ) -> None:
+        """Index the status of a connector."""
+        record = self._stations[station_id]
+        key = (evse_id, connector_id)
+        previous = record.connectors.get(key)
+        if previous != connector_status:
+            if previous is not None:
+                self._unindex_status(station_id, evse_id, connector_id, previous)
+
+            record.connectors[key] = connector_status
+            counts = self._by_status.setdefault(connector_status, {})
+            counts[station_id] = counts.get(station_id, 0) + 1
+            _add(
+                self._connectors_by_status,
+                connector_status,
+                (station_id, evse_id, connector_id),
+            )
+        self.on_heartbeat(station_id)
+
+    def on_heartbeat(self, station_id: str) -> None:
+        """Record that the station has been seen just now."""
+        record = self._stations.get(station_id)
+        if record is None:
+            return
+
+        record.last_seen = self._clock()
+        self._by_last_seen[station_id] = None
+        self._by_last_seen.move_to_end(station_id)
+
+    def _unindex_model(self, record: StationRecord) -> None:
+        if record.vendor is not None:
+            _discard(self._by_vendor, record.vendor, record.id)
+            _discard(self._by_model, (record.vendor, record.model), record.id)
+
+    def _unindex_status(self, station_id, evse_id, connector_id, status) -> None:
+        counts = self._by_status[status]
+        counts[station_id] -= 1
+        if not counts[station_id]:
+            del counts[station_id]
+            if not counts:
+                del self._by_status[status]
+        _discard(
+            self._connectors_by_status, status, (station_id, evse_id, connector_id)
+        )
+
+    def query(
+        self,
+        status: Optional[str] = None,
+        group: Optional[str] = None,
+        vendor: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Set[str]:
+        """
+        Return the ids of the stations that match all given criteria. A
+        station matches `status` if at least one of its connectors has that
+        status. `model` requires `vendor`. Without criteria all stations
+        match.
+        """
+        if model is not None and vendor is None:
+            raise ValueError("Querying by model requires the vendor.")
+
+        candidates = []
+        if status is not None:
+            candidates.append(self._by_status.get(status, {}).keys())
+        if group is not None:
+            candidates.append(self._by_group.get(group, ()))
+        if model is not None:
+            candidates.append(self._by_model.get((vendor, model), ()))
+        elif vendor is not None:
+            candidates.append(self._by_vendor.get(vendor, ()))
+
+        if not candidates:
+            return set(self._stations)
+
+        # Start with the smallest index, the others are only probed.
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        return {
+            station_id
+            for station_id in smallest
+            if all(station_id in other for other in others)
+        }
+
+    def connectors(self, status: str) -> Set[Tuple[str, int, int]]:
+        """Return the (station id, evse id, connector id) of all connectors
+        with the given status."""
+        return set(self._connectors_by_status.get(status, ()))
+
+    def count(self, status: str) -> int:
+        """Return the number of stations with a connector in `status`."""
+        return len(self._by_status.get(status, ()))
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of stations with a connector in each status."""
+        return {status: len(counts) for status, counts in self._by_status.items()}
+
+    def stale(self, seconds: float) -> List[str]:
+        """Return the ids of the stations that haven't been seen for more
+        than `seconds`, least recently seen first. The stations can be
+        unregistered while iterating over the list."""
+        threshold = self._clock() - seconds
+        stale = []
+        for station_id in self._by_last_seen:
+            if self._stations[station_id].last_seen >= threshold:
+                break
+            stale.append(station_id)
+        return stale
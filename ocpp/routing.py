@@ -1,4 +1,5 @@
 import functools
+import inspect
 
 routables = []
 
@@ -137,3 +138,66 @@ def create_route_map(obj):
                 continue
 
     return routes
+
+
+def create_route_table(cls):
+    """
+    Like `create_route_map()`, but for a class instead of an instance. The
+    returned dictionary holds the plain functions instead of bound methods,
+    so it can be built once and shared by all instances of the class. Every
+    route has an additional key '_requires_instance' to signal that the
+    handlers must be called with the instance as first argument. Also the
+    signature of every handler is inspected up front, see
+    `accepts_call_unique_id()`.
+
+    The attributes are looked up in the `__dict__` of the classes in the MRO
+    of `cls`, so descriptors like properties are never evaluated. An
+    attribute in a subclass overrides the attribute with the same name in its
+    bases, also when the override isn't decorated.
+
+    """
+    namespace = {}
+    for klass in reversed(cls.__mro__):
+        namespace.update(vars(klass))
+
+    routes = {}
+    for attr in namespace.values():
+        for option in ["_on_action", "_after_action"]:
+            try:
+                action = getattr(attr, option)
+            except AttributeError:
+                continue
+
+            if action not in routes:
+                routes[action] = {"_requires_instance": True}
+
+            if option == "_on_action":
+                routes[action]["_skip_schema_validation"] = getattr(
+                    attr, "_skip_schema_validation", False
+                )
+
+            routes[action][option] = attr
+            accepts_call_unique_id(routes[action], option)
+
+    return routes
+
+
+def accepts_call_unique_id(route, option):
+    """
+    Return whether the handler of the route for `option`, either '_on_action'
+    or '_after_action', has a parameter `call_unique_id`.
+
+    Inspecting the signature of a handler is relatively expensive. Therefore
+    the result is stored in the route under the key
+    '<option>_accepts_call_unique_id' and only computed if it isn't present
+    yet. A KeyError is raised if the route has no handler for `option`.
+    """
+    key = option + "_accepts_call_unique_id"
+    try:
+        return route[key]
+    except KeyError:
+        handler = route[option]
+
+    accepted = "call_unique_id" in inspect.signature(handler).parameters
+    route[key] = accepted
+    return accepted
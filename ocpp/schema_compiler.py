@@ -0,0 +1,298 @@
+"""
+Compile the JSON schemas of OCPP into plain Python functions.
+
+`jsonschema.Draft4Validator` interprets the schema for every message it
+validates. The functions generated by this module contain the checks of the
+schema as Python code, which is several times faster.
+
+The generated functions only tell whether a payload is valid. When a payload
+is invalid, `CompiledValidator` validates it once more using
+`Draft4Validator`. That results in exactly the same error, and thus the same
+OCPP error in `ocpp.messages.validate_payload()`, as when only
+`Draft4Validator` is used. As errors are rare, this costs very little.
+
+Only the keywords used by the OCPP schemas are supported. A `ValueError` is
+raised by `compile_schema()` when a schema contains another keyword. In that
+case `CompiledValidator` uses `Draft4Validator` for all payloads.
+
+"""
+
+import numbers
+from typing import Any, Callable, Dict
+
+from jsonschema import Draft4Validator
+
+# Keywords that don't constrain the payload. Note that Draft4Validator
+# doesn't check the 'format' keyword unless a format checker is given.
+_ANNOTATIONS = [
+    "$schema",
+    "$id",
+    "id",
+    "title",
+    "description",
+    "comment",
+    "javaType",
+    "default",
+    "format",
+    "definitions",
+]
+
+# Keywords that constrain the payload and are supported by the compiler.
+_KEYWORDS = [
+    "type",
+    "enum",
+    "maxLength",
+    "minimum",
+    "maximum",
+    "properties",
+    "required",
+    "additionalProperties",
+    "items",
+    "minItems",
+    "maxItems",
+    # Only applies when 'items' is a list of schemas, which isn't supported.
+    "additionalItems",
+]
+
+_TYPE_CHECKS = {
+    "object": "isinstance({var}, dict)",
+    "array": "isinstance({var}, list)",
+    "string": "isinstance({var}, str)",
+    "boolean": "isinstance({var}, bool)",
+    "integer": "isinstance({var}, int) and not isinstance({var}, bool)",
+    "number": "_is_number({var})",
+}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _is_empty(schema: Dict) -> bool:
+    """Return whether the schema accepts any payload."""
+    return all(keyword in _ANNOTATIONS + ["additionalItems"] for keyword in schema)
+
+
+class _Compiler:
+    def __init__(self, schema: Dict):
+        self.schema = schema
+        self.functions = []
+        self.constants = {}
+        # Function names of the definitions that have been compiled.
+        self.definitions = {}
+
+    def constant(self, value) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def compile(self) -> Callable[[Any], bool]:
+        entry_point = self.function(self.schema)
+        namespace = {"_is_number": _is_number, **self.constants}
+        exec("\n\n".join(self.functions), namespace)
+        return namespace[entry_point]
+
+    def definition(self, ref: str) -> str:
+        if not ref.startswith("#/definitions/"):
+            raise ValueError(f"Unsupported reference '{ref}'.")
+
+        name = ref.split("/")[-1]
+        if name not in self.definitions:
+            # Register the name before compiling to support recursive schemas.
+            self.definitions[name] = f"_check_{len(self.functions)}_{name}"
+            self.function(self.schema["definitions"][name], self.definitions[name])
+
+        return self.definitions[name]
+
+    def function(self, schema: Dict, name: str = None) -> str:
+        """Compile `schema` into a function and return the name of it."""
+        if name is None:
+            name = f"_check_{len(self.functions)}"
+        # Reserve a spot, the checks of the schema may add functions as well.
+        index = len(self.functions)
+        self.functions.append("")
+
+        lines = [f"def {name}(value):"]
+        lines += self.checks(schema, "value", "    ")
+        lines.append("    return True")
+
+        self.functions[index] = "\n".join(lines)
+        return name
+
+    def checks(self, schema: Dict, var: str, indent: str) -> list:
+        """Return lines that `return False` if `var` violates `schema`."""
+        if "$ref" in schema:
+            # In draft 4 all other keywords next to '$ref' are ignored.
+            return [
+                f"{indent}if not {self.definition(schema['$ref'])}({var}):",
+                f"{indent}    return False",
+            ]
+
+        lines = []
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+
+        for keyword in schema:
+            if keyword not in _ANNOTATIONS + _KEYWORDS:
+                raise ValueError(f"Unsupported keyword '{keyword}'.")
+
+        if types is not None:
+            check = " or ".join(
+                f"({_TYPE_CHECKS[type].format(var=var)})" for type in types
+            )
+            lines += [f"{indent}if not ({check}):", f"{indent}    return False"]
+
+        def only(type: str) -> bool:
+            """Return whether `var` can only be of the given type."""
+            return types == [type]
+
+        if "enum" in schema:
+            values = schema["enum"]
+            if all(isinstance(value, str) for value in values):
+                constant = self.constant(frozenset(values))
+                check = f"isinstance({var}, str) and {var} in {constant}"
+            else:
+                # Fall back to equality, like jsonschema, for other values.
+                constant = self.constant(list(values))
+                check = f"{var} in {constant}"
+            lines += [f"{indent}if not ({check}):", f"{indent}    return False"]
+
+        if "maxLength" in schema:
+            check = f"len({var}) > {int(schema['maxLength'])}"
+            if not only("string"):
+                check = f"isinstance({var}, str) and {check}"
+            lines += [f"{indent}if {check}:", f"{indent}    return False"]
+
+        for keyword, operator in [("minimum", "<"), ("maximum", ">")]:
+            if keyword in schema:
+                limit = self.constant(schema[keyword])
+                check = f"{var} {operator} {limit}"
+                if not (only("number") or only("integer")):
+                    check = f"_is_number({var}) and {check}"
+                lines += [f"{indent}if {check}:", f"{indent}    return False"]
+
+        # The keywords for objects and arrays are ignored for other types.
+        if only("object"):
+            lines += self.object_checks(schema, var, indent)
+        else:
+            object_lines = self.object_checks(schema, var, indent + "    ")
+            if object_lines:
+                lines += [f"{indent}if isinstance({var}, dict):"] + object_lines
+
+        if only("array"):
+            lines += self.array_checks(schema, var, indent)
+        else:
+            array_lines = self.array_checks(schema, var, indent + "    ")
+            if array_lines:
+                lines += [f"{indent}if isinstance({var}, list):"] + array_lines
+
+        return lines
+
+    def object_checks(self, schema: Dict, var: str, indent: str) -> list:
+        lines = []
+        properties = schema.get("properties", {})
+
+        additional_properties = schema.get("additionalProperties", True)
+        if additional_properties is False:
+            constant = self.constant(frozenset(properties))
+            lines += [
+                f"{indent}if not {var}.keys() <= {constant}:",
+                f"{indent}    return False",
+            ]
+        elif additional_properties is not True:
+            raise ValueError("Only booleans are supported for additionalProperties.")
+
+        for key in schema.get("required", []):
+            lines += [f"{indent}if {key!r} not in {var}:", f"{indent}    return False"]
+
+        for key, subschema in properties.items():
+            if _is_empty(subschema):
+                continue
+
+            function = self.function(subschema)
+            lines += [
+                f"{indent}if {key!r} in {var} and not {function}({var}[{key!r}]):",
+                f"{indent}    return False",
+            ]
+
+        return lines
+
+    def array_checks(self, schema: Dict, var: str, indent: str) -> list:
+        lines = []
+        if "minItems" in schema:
+            lines += [
+                f"{indent}if len({var}) < {int(schema['minItems'])}:",
+                f"{indent}    return False",
+            ]
+        if "maxItems" in schema:
+            lines += [
+                f"{indent}if len({var}) > {int(schema['maxItems'])}:",
+                f"{indent}    return False",
+            ]
+
+        items = schema.get("items", {})
+        if not isinstance(items, dict):
+            raise ValueError("Only a single schema is supported for items.")
+
+        if not _is_empty(items):
+            function = self.function(items)
+            lines += [
+                f"{indent}for item in {var}:",
+                f"{indent}    if not {function}(item):",
+                f"{indent}        return False",
+            ]
+
+        return lines
+
+
+def compile_schema(schema: Dict) -> Callable[[Any], bool]:
+    """
+    Compile the JSON schema into a function that takes a payload and returns
+    whether it's valid according to the schema.
+
+    A `ValueError` is raised if the schema contains keywords that aren't
+    supported.
+    """
+    return _Compiler(schema).compile()
+
+
+class CompiledValidator:
+    """
+    Validator with the same interface as `jsonschema.Draft4Validator` as far
+    as `ocpp.messages.validate_payload()` is concerned, but that uses a
+    compiled schema. Use it like so:
+
+        from ocpp.messages import set_validator_class
+        from ocpp.schema_compiler import CompiledValidator
+
+        set_validator_class(CompiledValidator)
+
+    """
+
+    def __init__(self, schema: Dict):
+        self.schema = schema
+        self._draft4_validator = None
+
+        try:
+            self._is_valid = compile_schema(schema)
+        except ValueError:
+            self._is_valid = None
+
+    def _get_draft4_validator(self) -> Draft4Validator:
+        if self._draft4_validator is None:
+            self._draft4_validator = Draft4Validator(self.schema)
+        return self._draft4_validator
+
+    def is_valid(self, instance) -> bool:
+        if self._is_valid is None:
+            return self._get_draft4_validator().is_valid(instance)
+        return self._is_valid(instance)
+
+    def validate(self, instance) -> None:
+        """Raise a `jsonschema.exceptions.ValidationError` if `instance` is
+        invalid."""
+        if self._is_valid is not None and self._is_valid(instance):
+            return
+
+        self._get_draft4_validator().validate(instance)
@@ -0,0 +1,114 @@
+"""
+Trace the messages that a `ChargePoint` receives and sends.
+
+Logging every raw message is expensive at scale. The trace level decides how
+much is logged per message:
+
+* `TRACE_OFF`: nothing.
+* `TRACE_HEADERS`: the type, unique id, action (or error code) and size of
+  the message.
+* `TRACE_PAYLOAD`: the complete message. This is the default.
+
+Nothing is formatted for messages that aren't logged. The level can be set
+for all charge points and overridden per charge point, e.g. to debug a single
+station while tracing is off for the rest of the fleet:
+
+    from ocpp.trace import TRACE_OFF, TRACE_PAYLOAD, message_trace
+
+    message_trace.set_level(TRACE_OFF)
+    message_trace.set_level(TRACE_PAYLOAD, charge_point_id="CP_1")
+
+Messages are logged at INFO level by the "ocpp" logger.
+
+"""
+
+import logging
+import re
+from typing import Dict, Optional
+
+LOGGER = logging.getLogger("ocpp")
+
+TRACE_OFF = 0
+TRACE_HEADERS = 1
+TRACE_PAYLOAD = 2
+
+_MESSAGE_TYPES = {"2": "Call", "3": "CallResult", "4": "CallError"}
+
+# Matches the MessageTypeId, the unique id and, for Calls and CallErrors, the
+# action or error code at the start of a message.
+_HEADER = re.compile(r'\s*\[\s*([234])\s*,\s*("[^"\\]*"|\d+)\s*(?:,\s*"([^"\\]*)")?')
+_HEADER_BYTES = re.compile(_HEADER.pattern.encode("utf-8"))
+
+
+def _headers(message):
+    """Return the type, unique id and action of a raw message."""
+    if isinstance(message, str):
+        match = _HEADER.match(message)
+    else:
+        match = _HEADER_BYTES.match(message)
+        if match is not None:
+            match = _HEADER.match(bytes(match.group(0)).decode("utf-8", "replace"))
+
+    if match is None:
+        return "?", "?", None
+
+    message_type, unique_id, action = match.groups()
+    return _MESSAGE_TYPES[message_type], unique_id.strip('"'), action
+
+
+class MessageTrace:
+    """Decide per charge point which part of the messages is logged."""
+
+    def __init__(self, level: int = TRACE_PAYLOAD, logger=LOGGER):
+        self.level = level
+        self.logger = logger
+        # Trace levels of individual charge points.
+        self._levels: Dict[str, int] = {}
+
+    def set_level(self, level: int, charge_point_id: Optional[str] = None) -> None:
+        """Set the trace level of all charge points or, if `charge_point_id`
+        is given, of a single charge point."""
+        if charge_point_id is None:
+            self.level = level
+        else:
+            self._levels[charge_point_id] = level
+
+    def reset_level(self, charge_point_id: str) -> None:
+        """Let the charge point use the trace level of all charge points."""
+        self._levels.pop(charge_point_id, None)
+
+    def get_level(self, charge_point_id) -> int:
+        if self._levels:
+            return self._levels.get(charge_point_id, self.level)
+        return self.level
+
+    def received(self, charge_point_id, message) -> None:
+        self._trace(charge_point_id, "receive", message)
+
+    def sent(self, charge_point_id, message) -> None:
+        self._trace(charge_point_id, "send", message)
+
+    def _trace(self, charge_point_id, direction: str, message) -> None:
+        level = self.get_level(charge_point_id)
+        if level == TRACE_OFF or not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        if level == TRACE_HEADERS:
+            message_type, unique_id, action = _headers(message)
+            self.logger.info(
+                "%s: %s %s unique_id=%s action=%s size=%d",
+                charge_point_id,
+                direction,
+                message_type,
+                unique_id,
+                action,
+                len(message),
+            )
+        elif direction == "receive":
+            self.logger.info("%s: receive message %s", charge_point_id, message)
+        else:
+            self.logger.info("%s: send %s", charge_point_id, message)
+
+
+# The trace used by charge points that aren't given a trace of their own.
+message_trace = MessageTrace()
@@ -0,0 +1,9963 @@
+"""
+Payload converters for the OCPP messages.
+
+This module has been generated from the JSON schemas by
+scripts/schema_to_converters.py. Don't edit it by hand.
+"""
+
+from ocpp.charge_point import (
+    _camel_to_snake_key,
+    _snake_to_camel_key,
+    camel_to_snake_case,
+    serialize_as_camel_case,
+)
+
+
+def _ac_charging_parameters_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _AC_CHARGING_PARAMETERS_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _ac_charging_parameters_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _AC_CHARGING_PARAMETERS_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _apn_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _APN_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _apn_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _APN_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _additional_info_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _ADDITIONAL_INFO_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _additional_info_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _ADDITIONAL_INFO_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _additional_info_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_additional_info_type_to_snake_case(value) for value in data]
+
+
+def _additional_info_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _additional_info_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _authorization_data_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _AUTHORIZATION_DATA_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _authorization_data_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _AUTHORIZATION_DATA_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _authorization_data_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_authorization_data_to_snake_case(value) for value in data]
+
+
+def _authorization_data_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _authorization_data_to_camel_case(value) for value in data if value is not None
+    ]
+
+
+def _authorize_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _AUTHORIZE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _authorize_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _AUTHORIZE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _authorize_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _AUTHORIZE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _authorize_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _AUTHORIZE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _boot_notification_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _BOOT_NOTIFICATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _boot_notification_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _BOOT_NOTIFICATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _boot_notification_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _BOOT_NOTIFICATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _boot_notification_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _BOOT_NOTIFICATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cancel_reservation_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CANCEL_RESERVATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cancel_reservation_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CANCEL_RESERVATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cancel_reservation_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CANCEL_RESERVATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cancel_reservation_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CANCEL_RESERVATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_hash_data_chain_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CERTIFICATE_HASH_DATA_CHAIN_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_hash_data_chain_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CERTIFICATE_HASH_DATA_CHAIN_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_hash_data_chain_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_certificate_hash_data_chain_type_to_snake_case(value) for value in data]
+
+
+def _certificate_hash_data_chain_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _certificate_hash_data_chain_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _certificate_hash_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CERTIFICATE_HASH_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_hash_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CERTIFICATE_HASH_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_hash_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_certificate_hash_data_type_to_snake_case(value) for value in data]
+
+
+def _certificate_hash_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _certificate_hash_data_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _certificate_signed_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CERTIFICATE_SIGNED_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_signed_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CERTIFICATE_SIGNED_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_signed_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CERTIFICATE_SIGNED_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _certificate_signed_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CERTIFICATE_SIGNED_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _change_availability_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHANGE_AVAILABILITY_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _change_availability_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHANGE_AVAILABILITY_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _change_availability_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHANGE_AVAILABILITY_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _change_availability_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHANGE_AVAILABILITY_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_limit_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHARGING_LIMIT_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_limit_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHARGING_LIMIT_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_needs_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHARGING_NEEDS_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_needs_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHARGING_NEEDS_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_profile_criterion_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHARGING_PROFILE_CRITERION_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_profile_criterion_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHARGING_PROFILE_CRITERION_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_profile_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHARGING_PROFILE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_profile_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHARGING_PROFILE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_profile_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_charging_profile_type_to_snake_case(value) for value in data]
+
+
+def _charging_profile_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _charging_profile_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _charging_schedule_period_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHARGING_SCHEDULE_PERIOD_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_schedule_period_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHARGING_SCHEDULE_PERIOD_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_schedule_period_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_charging_schedule_period_type_to_snake_case(value) for value in data]
+
+
+def _charging_schedule_period_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _charging_schedule_period_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _charging_schedule_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHARGING_SCHEDULE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_schedule_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHARGING_SCHEDULE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_schedule_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_charging_schedule_type_to_snake_case(value) for value in data]
+
+
+def _charging_schedule_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _charging_schedule_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _charging_station_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CHARGING_STATION_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _charging_station_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CHARGING_STATION_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_cache_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_CACHE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_cache_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_CACHE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_cache_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_CACHE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_cache_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_CACHE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_charging_profile_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_CHARGING_PROFILE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_charging_profile_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_CHARGING_PROFILE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_charging_profile_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_CHARGING_PROFILE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_charging_profile_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_CHARGING_PROFILE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_charging_profile_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_CHARGING_PROFILE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_charging_profile_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_CHARGING_PROFILE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_display_message_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_DISPLAY_MESSAGE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_display_message_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_DISPLAY_MESSAGE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_display_message_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_DISPLAY_MESSAGE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_display_message_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_DISPLAY_MESSAGE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_monitoring_result_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_MONITORING_RESULT_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_monitoring_result_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_MONITORING_RESULT_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_monitoring_result_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_clear_monitoring_result_type_to_snake_case(value) for value in data]
+
+
+def _clear_monitoring_result_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _clear_monitoring_result_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _clear_variable_monitoring_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_VARIABLE_MONITORING_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_variable_monitoring_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_VARIABLE_MONITORING_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_variable_monitoring_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEAR_VARIABLE_MONITORING_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _clear_variable_monitoring_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEAR_VARIABLE_MONITORING_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cleared_charging_limit_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEARED_CHARGING_LIMIT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cleared_charging_limit_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEARED_CHARGING_LIMIT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cleared_charging_limit_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CLEARED_CHARGING_LIMIT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cleared_charging_limit_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CLEARED_CHARGING_LIMIT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _component_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _COMPONENT_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _component_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _COMPONENT_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _component_variable_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _COMPONENT_VARIABLE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _component_variable_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _COMPONENT_VARIABLE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _component_variable_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_component_variable_type_to_snake_case(value) for value in data]
+
+
+def _component_variable_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _component_variable_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _composite_schedule_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _COMPOSITE_SCHEDULE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _composite_schedule_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _COMPOSITE_SCHEDULE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _consumption_cost_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CONSUMPTION_COST_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _consumption_cost_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CONSUMPTION_COST_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _consumption_cost_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_consumption_cost_type_to_snake_case(value) for value in data]
+
+
+def _consumption_cost_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _consumption_cost_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _cost_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _COST_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cost_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _COST_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cost_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_cost_type_to_snake_case(value) for value in data]
+
+
+def _cost_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [_cost_type_to_camel_case(value) for value in data if value is not None]
+
+
+def _cost_updated_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _COST_UPDATED_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cost_updated_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _COST_UPDATED_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cost_updated_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _COST_UPDATED_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _cost_updated_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _COST_UPDATED_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _custom_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CUSTOM_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _custom_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CUSTOM_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _customer_information_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CUSTOMER_INFORMATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _customer_information_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CUSTOMER_INFORMATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _customer_information_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _CUSTOMER_INFORMATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _customer_information_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _CUSTOMER_INFORMATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _dc_charging_parameters_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _DC_CHARGING_PARAMETERS_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _dc_charging_parameters_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _DC_CHARGING_PARAMETERS_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _data_transfer_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _DATA_TRANSFER_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _data_transfer_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _DATA_TRANSFER_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _data_transfer_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _DATA_TRANSFER_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _data_transfer_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _DATA_TRANSFER_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _delete_certificate_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _DELETE_CERTIFICATE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _delete_certificate_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _DELETE_CERTIFICATE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _delete_certificate_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _DELETE_CERTIFICATE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _delete_certificate_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _DELETE_CERTIFICATE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _evse_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _EVSE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _evse_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _EVSE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _event_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _EVENT_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _event_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _EVENT_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _event_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_event_data_type_to_snake_case(value) for value in data]
+
+
+def _event_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _event_data_type_to_camel_case(value) for value in data if value is not None
+    ]
+
+
+def _firmware_status_notification_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _firmware_status_notification_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _firmware_status_notification_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _firmware_status_notification_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _firmware_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _FIRMWARE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _firmware_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _FIRMWARE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get15118_ev_certificate_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET15118_EV_CERTIFICATE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get15118_ev_certificate_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET15118_EV_CERTIFICATE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get15118_ev_certificate_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET15118_EV_CERTIFICATE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get15118_ev_certificate_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET15118_EV_CERTIFICATE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_base_report_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_BASE_REPORT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_base_report_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_BASE_REPORT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_base_report_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_BASE_REPORT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_base_report_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_BASE_REPORT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_certificate_status_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_CERTIFICATE_STATUS_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_certificate_status_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_CERTIFICATE_STATUS_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_certificate_status_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_CERTIFICATE_STATUS_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_certificate_status_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_CERTIFICATE_STATUS_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_charging_profiles_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_CHARGING_PROFILES_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_charging_profiles_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_CHARGING_PROFILES_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_charging_profiles_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_CHARGING_PROFILES_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_charging_profiles_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_CHARGING_PROFILES_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_composite_schedule_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_COMPOSITE_SCHEDULE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_composite_schedule_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_COMPOSITE_SCHEDULE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_composite_schedule_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_COMPOSITE_SCHEDULE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_composite_schedule_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_COMPOSITE_SCHEDULE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_display_messages_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_DISPLAY_MESSAGES_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_display_messages_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_DISPLAY_MESSAGES_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_display_messages_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_DISPLAY_MESSAGES_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_display_messages_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_DISPLAY_MESSAGES_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_installed_certificate_ids_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_INSTALLED_CERTIFICATE_IDS_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_installed_certificate_ids_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_INSTALLED_CERTIFICATE_IDS_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_installed_certificate_ids_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_INSTALLED_CERTIFICATE_IDS_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_installed_certificate_ids_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_INSTALLED_CERTIFICATE_IDS_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_local_list_version_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_LOCAL_LIST_VERSION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_local_list_version_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_LOCAL_LIST_VERSION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_local_list_version_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_LOCAL_LIST_VERSION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_local_list_version_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_LOCAL_LIST_VERSION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_log_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_LOG_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_log_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_LOG_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_log_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_LOG_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_log_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_LOG_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_monitoring_report_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_MONITORING_REPORT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_monitoring_report_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_MONITORING_REPORT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_monitoring_report_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_MONITORING_REPORT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_monitoring_report_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_MONITORING_REPORT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_report_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_REPORT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_report_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_REPORT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_report_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_REPORT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_report_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_REPORT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_transaction_status_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_TRANSACTION_STATUS_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_transaction_status_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_TRANSACTION_STATUS_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_transaction_status_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_TRANSACTION_STATUS_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_transaction_status_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_TRANSACTION_STATUS_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variable_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_VARIABLE_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variable_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_VARIABLE_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variable_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_get_variable_data_type_to_snake_case(value) for value in data]
+
+
+def _get_variable_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _get_variable_data_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _get_variable_result_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_VARIABLE_RESULT_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variable_result_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_VARIABLE_RESULT_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variable_result_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_get_variable_result_type_to_snake_case(value) for value in data]
+
+
+def _get_variable_result_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _get_variable_result_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _get_variables_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_VARIABLES_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variables_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_VARIABLES_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variables_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _GET_VARIABLES_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _get_variables_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _GET_VARIABLES_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _heartbeat_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _HEARTBEAT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _heartbeat_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _HEARTBEAT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _heartbeat_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _HEARTBEAT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _heartbeat_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _HEARTBEAT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _id_token_info_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _ID_TOKEN_INFO_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _id_token_info_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _ID_TOKEN_INFO_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _id_token_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _ID_TOKEN_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _id_token_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _ID_TOKEN_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _install_certificate_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _INSTALL_CERTIFICATE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _install_certificate_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _INSTALL_CERTIFICATE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _install_certificate_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _INSTALL_CERTIFICATE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _install_certificate_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _INSTALL_CERTIFICATE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _log_parameters_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _LOG_PARAMETERS_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _log_parameters_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _LOG_PARAMETERS_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _log_status_notification_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _LOG_STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _log_status_notification_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _LOG_STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _log_status_notification_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _LOG_STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _log_status_notification_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _LOG_STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _message_content_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _MESSAGE_CONTENT_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _message_content_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _MESSAGE_CONTENT_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _message_info_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _MESSAGE_INFO_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _message_info_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _MESSAGE_INFO_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _message_info_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_message_info_type_to_snake_case(value) for value in data]
+
+
+def _message_info_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _message_info_type_to_camel_case(value) for value in data if value is not None
+    ]
+
+
+def _meter_value_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _METER_VALUE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _meter_value_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _METER_VALUE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _meter_value_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_meter_value_type_to_snake_case(value) for value in data]
+
+
+def _meter_value_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _meter_value_type_to_camel_case(value) for value in data if value is not None
+    ]
+
+
+def _meter_values_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _METER_VALUES_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _meter_values_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _METER_VALUES_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _meter_values_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _METER_VALUES_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _meter_values_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _METER_VALUES_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _modem_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _MODEM_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _modem_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _MODEM_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _monitoring_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _MONITORING_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _monitoring_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _MONITORING_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _monitoring_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_monitoring_data_type_to_snake_case(value) for value in data]
+
+
+def _monitoring_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _monitoring_data_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _network_connection_profile_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NETWORK_CONNECTION_PROFILE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _network_connection_profile_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NETWORK_CONNECTION_PROFILE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_charging_limit_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_CHARGING_LIMIT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_charging_limit_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_CHARGING_LIMIT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_charging_limit_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_CHARGING_LIMIT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_charging_limit_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_CHARGING_LIMIT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_customer_information_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_CUSTOMER_INFORMATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_customer_information_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_CUSTOMER_INFORMATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_customer_information_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_CUSTOMER_INFORMATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_customer_information_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_CUSTOMER_INFORMATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_display_messages_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_DISPLAY_MESSAGES_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_display_messages_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_DISPLAY_MESSAGES_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_display_messages_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_DISPLAY_MESSAGES_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_display_messages_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_DISPLAY_MESSAGES_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_needs_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_NEEDS_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_needs_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_NEEDS_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_needs_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_NEEDS_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_needs_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_NEEDS_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_schedule_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_SCHEDULE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_schedule_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_SCHEDULE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_schedule_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_SCHEDULE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_ev_charging_schedule_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_EV_CHARGING_SCHEDULE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_event_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_EVENT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_event_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_EVENT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_event_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_EVENT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_event_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_EVENT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_monitoring_report_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_MONITORING_REPORT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_monitoring_report_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_MONITORING_REPORT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_monitoring_report_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_MONITORING_REPORT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_monitoring_report_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_MONITORING_REPORT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_report_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_REPORT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_report_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_REPORT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_report_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _NOTIFY_REPORT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _notify_report_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _NOTIFY_REPORT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _ocsp_request_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _OCSP_REQUEST_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _ocsp_request_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _OCSP_REQUEST_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _ocsp_request_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_ocsp_request_data_type_to_snake_case(value) for value in data]
+
+
+def _ocsp_request_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _ocsp_request_data_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _publish_firmware_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _PUBLISH_FIRMWARE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _publish_firmware_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _PUBLISH_FIRMWARE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _publish_firmware_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _PUBLISH_FIRMWARE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _publish_firmware_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _PUBLISH_FIRMWARE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _publish_firmware_status_notification_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _PUBLISH_FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE[
+                key
+            ]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _publish_firmware_status_notification_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _PUBLISH_FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE[
+                key
+            ]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _publish_firmware_status_notification_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _PUBLISH_FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE[
+                key
+            ]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _publish_firmware_status_notification_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _PUBLISH_FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE[
+                key
+            ]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _relative_time_interval_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _RELATIVE_TIME_INTERVAL_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _relative_time_interval_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _RELATIVE_TIME_INTERVAL_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _report_charging_profiles_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _REPORT_CHARGING_PROFILES_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _report_charging_profiles_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _REPORT_CHARGING_PROFILES_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _report_charging_profiles_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _REPORT_CHARGING_PROFILES_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _report_charging_profiles_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _REPORT_CHARGING_PROFILES_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _report_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _REPORT_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _report_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _REPORT_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _report_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_report_data_type_to_snake_case(value) for value in data]
+
+
+def _report_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _report_data_type_to_camel_case(value) for value in data if value is not None
+    ]
+
+
+def _request_start_transaction_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _REQUEST_START_TRANSACTION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _request_start_transaction_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _REQUEST_START_TRANSACTION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _request_start_transaction_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _REQUEST_START_TRANSACTION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _request_start_transaction_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _REQUEST_START_TRANSACTION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _request_stop_transaction_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _REQUEST_STOP_TRANSACTION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _request_stop_transaction_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _REQUEST_STOP_TRANSACTION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _request_stop_transaction_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _REQUEST_STOP_TRANSACTION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _request_stop_transaction_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _REQUEST_STOP_TRANSACTION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reservation_status_update_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _RESERVATION_STATUS_UPDATE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reservation_status_update_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _RESERVATION_STATUS_UPDATE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reservation_status_update_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _RESERVATION_STATUS_UPDATE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reservation_status_update_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _RESERVATION_STATUS_UPDATE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reserve_now_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _RESERVE_NOW_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reserve_now_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _RESERVE_NOW_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reserve_now_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _RESERVE_NOW_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reserve_now_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _RESERVE_NOW_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reset_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _RESET_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reset_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _RESET_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reset_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _RESET_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _reset_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _RESET_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sales_tariff_entry_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SALES_TARIFF_ENTRY_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sales_tariff_entry_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SALES_TARIFF_ENTRY_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sales_tariff_entry_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_sales_tariff_entry_type_to_snake_case(value) for value in data]
+
+
+def _sales_tariff_entry_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _sales_tariff_entry_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _sales_tariff_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SALES_TARIFF_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sales_tariff_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SALES_TARIFF_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sampled_value_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SAMPLED_VALUE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sampled_value_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SAMPLED_VALUE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sampled_value_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_sampled_value_type_to_snake_case(value) for value in data]
+
+
+def _sampled_value_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _sampled_value_type_to_camel_case(value) for value in data if value is not None
+    ]
+
+
+def _security_event_notification_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SECURITY_EVENT_NOTIFICATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _security_event_notification_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SECURITY_EVENT_NOTIFICATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _security_event_notification_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SECURITY_EVENT_NOTIFICATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _security_event_notification_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SECURITY_EVENT_NOTIFICATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _send_local_list_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SEND_LOCAL_LIST_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _send_local_list_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SEND_LOCAL_LIST_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _send_local_list_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SEND_LOCAL_LIST_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _send_local_list_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SEND_LOCAL_LIST_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_charging_profile_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_CHARGING_PROFILE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_charging_profile_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_CHARGING_PROFILE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_charging_profile_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_CHARGING_PROFILE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_charging_profile_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_CHARGING_PROFILE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_display_message_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_DISPLAY_MESSAGE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_display_message_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_DISPLAY_MESSAGE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_display_message_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_DISPLAY_MESSAGE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_display_message_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_DISPLAY_MESSAGE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_base_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_MONITORING_BASE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_base_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_MONITORING_BASE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_base_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_MONITORING_BASE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_base_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_MONITORING_BASE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_MONITORING_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_MONITORING_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_set_monitoring_data_type_to_snake_case(value) for value in data]
+
+
+def _set_monitoring_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _set_monitoring_data_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _set_monitoring_level_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_MONITORING_LEVEL_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_level_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_MONITORING_LEVEL_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_level_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_MONITORING_LEVEL_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_level_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_MONITORING_LEVEL_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_result_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_MONITORING_RESULT_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_result_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_MONITORING_RESULT_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_monitoring_result_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_set_monitoring_result_type_to_snake_case(value) for value in data]
+
+
+def _set_monitoring_result_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _set_monitoring_result_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _set_network_profile_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_NETWORK_PROFILE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_network_profile_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_NETWORK_PROFILE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_network_profile_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_NETWORK_PROFILE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_network_profile_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_NETWORK_PROFILE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_data_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_VARIABLE_DATA_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_data_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_VARIABLE_DATA_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_data_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_set_variable_data_type_to_snake_case(value) for value in data]
+
+
+def _set_variable_data_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _set_variable_data_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _set_variable_monitoring_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_VARIABLE_MONITORING_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_monitoring_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_VARIABLE_MONITORING_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_monitoring_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_VARIABLE_MONITORING_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_monitoring_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_VARIABLE_MONITORING_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_result_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_VARIABLE_RESULT_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_result_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_VARIABLE_RESULT_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variable_result_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_set_variable_result_type_to_snake_case(value) for value in data]
+
+
+def _set_variable_result_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _set_variable_result_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _set_variables_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_VARIABLES_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variables_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_VARIABLES_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variables_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SET_VARIABLES_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _set_variables_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SET_VARIABLES_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sign_certificate_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SIGN_CERTIFICATE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sign_certificate_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SIGN_CERTIFICATE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sign_certificate_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SIGN_CERTIFICATE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _sign_certificate_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SIGN_CERTIFICATE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _signed_meter_value_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _SIGNED_METER_VALUE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _signed_meter_value_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _SIGNED_METER_VALUE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _status_info_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _STATUS_INFO_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _status_info_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _STATUS_INFO_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _status_notification_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _status_notification_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _status_notification_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _status_notification_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _transaction_event_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _TRANSACTION_EVENT_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _transaction_event_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _TRANSACTION_EVENT_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _transaction_event_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _TRANSACTION_EVENT_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _transaction_event_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _TRANSACTION_EVENT_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _transaction_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _TRANSACTION_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _transaction_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _TRANSACTION_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _trigger_message_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _TRIGGER_MESSAGE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _trigger_message_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _TRIGGER_MESSAGE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _trigger_message_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _TRIGGER_MESSAGE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _trigger_message_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _TRIGGER_MESSAGE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unit_of_measure_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _UNIT_OF_MEASURE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unit_of_measure_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _UNIT_OF_MEASURE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unlock_connector_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _UNLOCK_CONNECTOR_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unlock_connector_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _UNLOCK_CONNECTOR_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unlock_connector_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _UNLOCK_CONNECTOR_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unlock_connector_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _UNLOCK_CONNECTOR_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unpublish_firmware_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _UNPUBLISH_FIRMWARE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unpublish_firmware_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _UNPUBLISH_FIRMWARE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unpublish_firmware_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _UNPUBLISH_FIRMWARE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _unpublish_firmware_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _UNPUBLISH_FIRMWARE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _update_firmware_request_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _UPDATE_FIRMWARE_REQUEST_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _update_firmware_request_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _UPDATE_FIRMWARE_REQUEST_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _update_firmware_response_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _UPDATE_FIRMWARE_RESPONSE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _update_firmware_response_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _UPDATE_FIRMWARE_RESPONSE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _vpn_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _VPN_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _vpn_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _VPN_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_attribute_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _VARIABLE_ATTRIBUTE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_attribute_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _VARIABLE_ATTRIBUTE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_attribute_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_variable_attribute_type_to_snake_case(value) for value in data]
+
+
+def _variable_attribute_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _variable_attribute_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _variable_characteristics_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _VARIABLE_CHARACTERISTICS_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_characteristics_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _VARIABLE_CHARACTERISTICS_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_monitoring_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _VARIABLE_MONITORING_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_monitoring_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _VARIABLE_MONITORING_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_monitoring_type_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [_variable_monitoring_type_to_snake_case(value) for value in data]
+
+
+def _variable_monitoring_type_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [
+        _variable_monitoring_type_to_camel_case(value)
+        for value in data
+        if value is not None
+    ]
+
+
+def _variable_type_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {}
+    for key, value in data.items():
+        try:
+            key, convert = _VARIABLE_TYPE_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+def _variable_type_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = _VARIABLE_TYPE_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+
+
+_AC_CHARGING_PARAMETERS_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "energyAmount": ("energy_amount", None),
+    "evMinCurrent": ("ev_min_current", None),
+    "evMaxCurrent": ("ev_max_current", None),
+    "evMaxVoltage": ("ev_max_voltage", None),
+}
+
+
+_AC_CHARGING_PARAMETERS_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "energy_amount": ("energyAmount", None),
+    "ev_min_current": ("evMinCurrent", None),
+    "ev_max_current": ("evMaxCurrent", None),
+    "ev_max_voltage": ("evMaxVoltage", None),
+}
+
+
+_APN_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "apn": ("apn", None),
+    "apnUserName": ("apn_user_name", None),
+    "apnPassword": ("apn_password", None),
+    "simPin": ("sim_pin", None),
+    "preferredNetwork": ("preferred_network", None),
+    "useOnlyPreferredNetwork": ("use_only_preferred_network", None),
+    "apnAuthentication": ("apn_authentication", None),
+}
+
+
+_APN_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "apn": ("apn", None),
+    "apn_user_name": ("apnUserName", None),
+    "apn_password": ("apnPassword", None),
+    "sim_pin": ("simPin", None),
+    "preferred_network": ("preferredNetwork", None),
+    "use_only_preferred_network": ("useOnlyPreferredNetwork", None),
+    "apn_authentication": ("apnAuthentication", None),
+}
+
+
+_ADDITIONAL_INFO_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "additionalIdToken": ("additional_id_token", None),
+    "type": ("type", None),
+}
+
+
+_ADDITIONAL_INFO_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "additional_id_token": ("additionalIdToken", None),
+    "type": ("type", None),
+}
+
+
+_AUTHORIZATION_DATA_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "idToken": ("id_token", _id_token_type_to_snake_case),
+    "idTokenInfo": ("id_token_info", _id_token_info_type_to_snake_case),
+}
+
+
+_AUTHORIZATION_DATA_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id_token": ("idToken", _id_token_type_to_camel_case),
+    "id_token_info": ("idTokenInfo", _id_token_info_type_to_camel_case),
+}
+
+
+_AUTHORIZE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "idToken": ("id_token", _id_token_type_to_snake_case),
+    "certificate": ("certificate", None),
+    "iso15118CertificateHashData": (
+        "iso15118_certificate_hash_data",
+        _ocsp_request_data_type_list_to_snake_case,
+    ),
+}
+
+
+_AUTHORIZE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id_token": ("idToken", _id_token_type_to_camel_case),
+    "certificate": ("certificate", None),
+    "iso15118_certificate_hash_data": (
+        "iso15118CertificateHashData",
+        _ocsp_request_data_type_list_to_camel_case,
+    ),
+}
+
+
+_AUTHORIZE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "idTokenInfo": ("id_token_info", _id_token_info_type_to_snake_case),
+    "certificateStatus": ("certificate_status", None),
+}
+
+
+_AUTHORIZE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id_token_info": ("idTokenInfo", _id_token_info_type_to_camel_case),
+    "certificate_status": ("certificateStatus", None),
+}
+
+
+_BOOT_NOTIFICATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "chargingStation": ("charging_station", _charging_station_type_to_snake_case),
+    "reason": ("reason", None),
+}
+
+
+_BOOT_NOTIFICATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "charging_station": ("chargingStation", _charging_station_type_to_camel_case),
+    "reason": ("reason", None),
+}
+
+
+_BOOT_NOTIFICATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "currentTime": ("current_time", None),
+    "interval": ("interval", None),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_BOOT_NOTIFICATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "current_time": ("currentTime", None),
+    "interval": ("interval", None),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CANCEL_RESERVATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "reservationId": ("reservation_id", None),
+}
+
+
+_CANCEL_RESERVATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "reservation_id": ("reservationId", None),
+}
+
+
+_CANCEL_RESERVATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CANCEL_RESERVATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CERTIFICATE_HASH_DATA_CHAIN_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "certificateHashData": (
+        "certificate_hash_data",
+        _certificate_hash_data_type_to_snake_case,
+    ),
+    "certificateType": ("certificate_type", None),
+    "childCertificateHashData": (
+        "child_certificate_hash_data",
+        _certificate_hash_data_type_list_to_snake_case,
+    ),
+}
+
+
+_CERTIFICATE_HASH_DATA_CHAIN_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "certificate_hash_data": (
+        "certificateHashData",
+        _certificate_hash_data_type_to_camel_case,
+    ),
+    "certificate_type": ("certificateType", None),
+    "child_certificate_hash_data": (
+        "childCertificateHashData",
+        _certificate_hash_data_type_list_to_camel_case,
+    ),
+}
+
+
+_CERTIFICATE_HASH_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "hashAlgorithm": ("hash_algorithm", None),
+    "issuerNameHash": ("issuer_name_hash", None),
+    "issuerKeyHash": ("issuer_key_hash", None),
+    "serialNumber": ("serial_number", None),
+}
+
+
+_CERTIFICATE_HASH_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "hash_algorithm": ("hashAlgorithm", None),
+    "issuer_name_hash": ("issuerNameHash", None),
+    "issuer_key_hash": ("issuerKeyHash", None),
+    "serial_number": ("serialNumber", None),
+}
+
+
+_CERTIFICATE_SIGNED_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "certificateChain": ("certificate_chain", None),
+    "certificateType": ("certificate_type", None),
+}
+
+
+_CERTIFICATE_SIGNED_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "certificate_chain": ("certificateChain", None),
+    "certificate_type": ("certificateType", None),
+}
+
+
+_CERTIFICATE_SIGNED_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CERTIFICATE_SIGNED_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CHANGE_AVAILABILITY_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evse": ("evse", _evse_type_to_snake_case),
+    "operationalStatus": ("operational_status", None),
+}
+
+
+_CHANGE_AVAILABILITY_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse": ("evse", _evse_type_to_camel_case),
+    "operational_status": ("operationalStatus", None),
+}
+
+
+_CHANGE_AVAILABILITY_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CHANGE_AVAILABILITY_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CHARGING_LIMIT_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "chargingLimitSource": ("charging_limit_source", None),
+    "isGridCritical": ("is_grid_critical", None),
+}
+
+
+_CHARGING_LIMIT_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "charging_limit_source": ("chargingLimitSource", None),
+    "is_grid_critical": ("isGridCritical", None),
+}
+
+
+_CHARGING_NEEDS_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "acChargingParameters": (
+        "ac_charging_parameters",
+        _ac_charging_parameters_type_to_snake_case,
+    ),
+    "dcChargingParameters": (
+        "dc_charging_parameters",
+        _dc_charging_parameters_type_to_snake_case,
+    ),
+    "requestedEnergyTransfer": ("requested_energy_transfer", None),
+    "departureTime": ("departure_time", None),
+}
+
+
+_CHARGING_NEEDS_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "ac_charging_parameters": (
+        "acChargingParameters",
+        _ac_charging_parameters_type_to_camel_case,
+    ),
+    "dc_charging_parameters": (
+        "dcChargingParameters",
+        _dc_charging_parameters_type_to_camel_case,
+    ),
+    "requested_energy_transfer": ("requestedEnergyTransfer", None),
+    "departure_time": ("departureTime", None),
+}
+
+
+_CHARGING_PROFILE_CRITERION_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "chargingProfilePurpose": ("charging_profile_purpose", None),
+    "stackLevel": ("stack_level", None),
+    "chargingProfileId": ("charging_profile_id", None),
+    "chargingLimitSource": ("charging_limit_source", None),
+}
+
+
+_CHARGING_PROFILE_CRITERION_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "charging_profile_purpose": ("chargingProfilePurpose", None),
+    "stack_level": ("stackLevel", None),
+    "charging_profile_id": ("chargingProfileId", serialize_as_camel_case),
+    "charging_limit_source": ("chargingLimitSource", serialize_as_camel_case),
+}
+
+
+_CHARGING_PROFILE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "stackLevel": ("stack_level", None),
+    "chargingProfilePurpose": ("charging_profile_purpose", None),
+    "chargingProfileKind": ("charging_profile_kind", None),
+    "recurrencyKind": ("recurrency_kind", None),
+    "validFrom": ("valid_from", None),
+    "validTo": ("valid_to", None),
+    "chargingSchedule": (
+        "charging_schedule",
+        _charging_schedule_type_list_to_snake_case,
+    ),
+    "transactionId": ("transaction_id", None),
+}
+
+
+_CHARGING_PROFILE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "stack_level": ("stackLevel", None),
+    "charging_profile_purpose": ("chargingProfilePurpose", None),
+    "charging_profile_kind": ("chargingProfileKind", None),
+    "recurrency_kind": ("recurrencyKind", None),
+    "valid_from": ("validFrom", None),
+    "valid_to": ("validTo", None),
+    "charging_schedule": (
+        "chargingSchedule",
+        _charging_schedule_type_list_to_camel_case,
+    ),
+    "transaction_id": ("transactionId", None),
+}
+
+
+_CHARGING_SCHEDULE_PERIOD_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "startPeriod": ("start_period", None),
+    "limit": ("limit", None),
+    "numberPhases": ("number_phases", None),
+    "phaseToUse": ("phase_to_use", None),
+}
+
+
+_CHARGING_SCHEDULE_PERIOD_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "start_period": ("startPeriod", None),
+    "limit": ("limit", None),
+    "number_phases": ("numberPhases", None),
+    "phase_to_use": ("phaseToUse", None),
+}
+
+
+_CHARGING_SCHEDULE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "startSchedule": ("start_schedule", None),
+    "duration": ("duration", None),
+    "chargingRateUnit": ("charging_rate_unit", None),
+    "chargingSchedulePeriod": (
+        "charging_schedule_period",
+        _charging_schedule_period_type_list_to_snake_case,
+    ),
+    "minChargingRate": ("min_charging_rate", None),
+    "salesTariff": ("sales_tariff", _sales_tariff_type_to_snake_case),
+}
+
+
+_CHARGING_SCHEDULE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "start_schedule": ("startSchedule", None),
+    "duration": ("duration", None),
+    "charging_rate_unit": ("chargingRateUnit", None),
+    "charging_schedule_period": (
+        "chargingSchedulePeriod",
+        _charging_schedule_period_type_list_to_camel_case,
+    ),
+    "min_charging_rate": ("minChargingRate", None),
+    "sales_tariff": ("salesTariff", _sales_tariff_type_to_camel_case),
+}
+
+
+_CHARGING_STATION_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "serialNumber": ("serial_number", None),
+    "model": ("model", None),
+    "modem": ("modem", _modem_type_to_snake_case),
+    "vendorName": ("vendor_name", None),
+    "firmwareVersion": ("firmware_version", None),
+}
+
+
+_CHARGING_STATION_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "serial_number": ("serialNumber", None),
+    "model": ("model", None),
+    "modem": ("modem", _modem_type_to_camel_case),
+    "vendor_name": ("vendorName", None),
+    "firmware_version": ("firmwareVersion", None),
+}
+
+
+_CLEAR_CACHE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_CLEAR_CACHE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_CLEAR_CACHE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CLEAR_CACHE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CLEAR_CHARGING_PROFILE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "chargingProfileId": ("charging_profile_id", None),
+    "chargingProfileCriteria": (
+        "charging_profile_criteria",
+        _clear_charging_profile_type_to_snake_case,
+    ),
+}
+
+
+_CLEAR_CHARGING_PROFILE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "charging_profile_id": ("chargingProfileId", None),
+    "charging_profile_criteria": (
+        "chargingProfileCriteria",
+        _clear_charging_profile_type_to_camel_case,
+    ),
+}
+
+
+_CLEAR_CHARGING_PROFILE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CLEAR_CHARGING_PROFILE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CLEAR_CHARGING_PROFILE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evseId": ("evse_id", None),
+    "chargingProfilePurpose": ("charging_profile_purpose", None),
+    "stackLevel": ("stack_level", None),
+}
+
+
+_CLEAR_CHARGING_PROFILE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse_id": ("evseId", None),
+    "charging_profile_purpose": ("chargingProfilePurpose", None),
+    "stack_level": ("stackLevel", None),
+}
+
+
+_CLEAR_DISPLAY_MESSAGE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+}
+
+
+_CLEAR_DISPLAY_MESSAGE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+}
+
+
+_CLEAR_DISPLAY_MESSAGE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CLEAR_DISPLAY_MESSAGE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CLEAR_MONITORING_RESULT_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "id": ("id", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CLEAR_MONITORING_RESULT_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "id": ("id", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_CLEAR_VARIABLE_MONITORING_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+}
+
+
+_CLEAR_VARIABLE_MONITORING_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", serialize_as_camel_case),
+}
+
+
+_CLEAR_VARIABLE_MONITORING_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "clearMonitoringResult": (
+        "clear_monitoring_result",
+        _clear_monitoring_result_type_list_to_snake_case,
+    ),
+}
+
+
+_CLEAR_VARIABLE_MONITORING_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "clear_monitoring_result": (
+        "clearMonitoringResult",
+        _clear_monitoring_result_type_list_to_camel_case,
+    ),
+}
+
+
+_CLEARED_CHARGING_LIMIT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "chargingLimitSource": ("charging_limit_source", None),
+    "evseId": ("evse_id", None),
+}
+
+
+_CLEARED_CHARGING_LIMIT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "charging_limit_source": ("chargingLimitSource", None),
+    "evse_id": ("evseId", None),
+}
+
+
+_CLEARED_CHARGING_LIMIT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_CLEARED_CHARGING_LIMIT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_COMPONENT_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evse": ("evse", _evse_type_to_snake_case),
+    "name": ("name", None),
+    "instance": ("instance", None),
+}
+
+
+_COMPONENT_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse": ("evse", _evse_type_to_camel_case),
+    "name": ("name", None),
+    "instance": ("instance", None),
+}
+
+
+_COMPONENT_VARIABLE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+}
+
+
+_COMPONENT_VARIABLE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+}
+
+
+_COMPOSITE_SCHEDULE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "chargingSchedulePeriod": (
+        "charging_schedule_period",
+        _charging_schedule_period_type_list_to_snake_case,
+    ),
+    "evseId": ("evse_id", None),
+    "duration": ("duration", None),
+    "scheduleStart": ("schedule_start", None),
+    "chargingRateUnit": ("charging_rate_unit", None),
+}
+
+
+_COMPOSITE_SCHEDULE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "charging_schedule_period": (
+        "chargingSchedulePeriod",
+        _charging_schedule_period_type_list_to_camel_case,
+    ),
+    "evse_id": ("evseId", None),
+    "duration": ("duration", None),
+    "schedule_start": ("scheduleStart", None),
+    "charging_rate_unit": ("chargingRateUnit", None),
+}
+
+
+_CONSUMPTION_COST_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "startValue": ("start_value", None),
+    "cost": ("cost", _cost_type_list_to_snake_case),
+}
+
+
+_CONSUMPTION_COST_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "start_value": ("startValue", None),
+    "cost": ("cost", _cost_type_list_to_camel_case),
+}
+
+
+_COST_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "costKind": ("cost_kind", None),
+    "amount": ("amount", None),
+    "amountMultiplier": ("amount_multiplier", None),
+}
+
+
+_COST_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "cost_kind": ("costKind", None),
+    "amount": ("amount", None),
+    "amount_multiplier": ("amountMultiplier", None),
+}
+
+
+_COST_UPDATED_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "totalCost": ("total_cost", None),
+    "transactionId": ("transaction_id", None),
+}
+
+
+_COST_UPDATED_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "total_cost": ("totalCost", None),
+    "transaction_id": ("transactionId", None),
+}
+
+
+_COST_UPDATED_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_COST_UPDATED_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_CUSTOM_DATA_TYPE_TO_SNAKE_CASE = {
+    "vendorId": ("vendor_id", None),
+}
+
+
+_CUSTOM_DATA_TYPE_TO_CAMEL_CASE = {
+    "vendor_id": ("vendorId", None),
+}
+
+
+_CUSTOMER_INFORMATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "customerCertificate": (
+        "customer_certificate",
+        _certificate_hash_data_type_to_snake_case,
+    ),
+    "idToken": ("id_token", _id_token_type_to_snake_case),
+    "requestId": ("request_id", None),
+    "report": ("report", None),
+    "clear": ("clear", None),
+    "customerIdentifier": ("customer_identifier", None),
+}
+
+
+_CUSTOMER_INFORMATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "customer_certificate": (
+        "customerCertificate",
+        _certificate_hash_data_type_to_camel_case,
+    ),
+    "id_token": ("idToken", _id_token_type_to_camel_case),
+    "request_id": ("requestId", None),
+    "report": ("report", None),
+    "clear": ("clear", None),
+    "customer_identifier": ("customerIdentifier", None),
+}
+
+
+_CUSTOMER_INFORMATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_CUSTOMER_INFORMATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_DC_CHARGING_PARAMETERS_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evMaxCurrent": ("ev_max_current", None),
+    "evMaxVoltage": ("ev_max_voltage", None),
+    "energyAmount": ("energy_amount", None),
+    "evMaxPower": ("ev_max_power", None),
+    "stateOfCharge": ("state_of_charge", None),
+    "evEnergyCapacity": ("ev_energy_capacity", None),
+    "fullSoC": ("full_soc", None),
+    "bulkSoC": ("bulk_soc", None),
+}
+
+
+_DC_CHARGING_PARAMETERS_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "ev_max_current": ("evMaxCurrent", None),
+    "ev_max_voltage": ("evMaxVoltage", None),
+    "energy_amount": ("energyAmount", None),
+    "ev_max_power": ("evMaxPower", None),
+    "state_of_charge": ("stateOfCharge", None),
+    "ev_energy_capacity": ("evEnergyCapacity", None),
+    "full_soc": ("fullSoC", None),
+    "bulk_soc": ("bulkSoC", None),
+}
+
+
+_DATA_TRANSFER_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "messageId": ("message_id", None),
+    "data": ("data", camel_to_snake_case),
+    "vendorId": ("vendor_id", None),
+}
+
+
+_DATA_TRANSFER_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "message_id": ("messageId", None),
+    "data": ("data", serialize_as_camel_case),
+    "vendor_id": ("vendorId", None),
+}
+
+
+_DATA_TRANSFER_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "data": ("data", camel_to_snake_case),
+}
+
+
+_DATA_TRANSFER_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "data": ("data", serialize_as_camel_case),
+}
+
+
+_DELETE_CERTIFICATE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "certificateHashData": (
+        "certificate_hash_data",
+        _certificate_hash_data_type_to_snake_case,
+    ),
+}
+
+
+_DELETE_CERTIFICATE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "certificate_hash_data": (
+        "certificateHashData",
+        _certificate_hash_data_type_to_camel_case,
+    ),
+}
+
+
+_DELETE_CERTIFICATE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_DELETE_CERTIFICATE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_EVSE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "connectorId": ("connector_id", None),
+}
+
+
+_EVSE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "connector_id": ("connectorId", None),
+}
+
+
+_EVENT_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "eventId": ("event_id", None),
+    "timestamp": ("timestamp", None),
+    "trigger": ("trigger", None),
+    "cause": ("cause", None),
+    "actualValue": ("actual_value", None),
+    "techCode": ("tech_code", None),
+    "techInfo": ("tech_info", None),
+    "cleared": ("cleared", None),
+    "transactionId": ("transaction_id", None),
+    "component": ("component", _component_type_to_snake_case),
+    "variableMonitoringId": ("variable_monitoring_id", None),
+    "eventNotificationType": ("event_notification_type", None),
+    "variable": ("variable", _variable_type_to_snake_case),
+}
+
+
+_EVENT_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "event_id": ("eventId", None),
+    "timestamp": ("timestamp", None),
+    "trigger": ("trigger", None),
+    "cause": ("cause", None),
+    "actual_value": ("actualValue", None),
+    "tech_code": ("techCode", None),
+    "tech_info": ("techInfo", None),
+    "cleared": ("cleared", None),
+    "transaction_id": ("transactionId", None),
+    "component": ("component", _component_type_to_camel_case),
+    "variable_monitoring_id": ("variableMonitoringId", None),
+    "event_notification_type": ("eventNotificationType", None),
+    "variable": ("variable", _variable_type_to_camel_case),
+}
+
+
+_FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "requestId": ("request_id", None),
+}
+
+
+_FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "request_id": ("requestId", None),
+}
+
+
+_FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_FIRMWARE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "location": ("location", None),
+    "retrieveDateTime": ("retrieve_date_time", None),
+    "installDateTime": ("install_date_time", None),
+    "signingCertificate": ("signing_certificate", None),
+    "signature": ("signature", None),
+}
+
+
+_FIRMWARE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "location": ("location", None),
+    "retrieve_date_time": ("retrieveDateTime", None),
+    "install_date_time": ("installDateTime", None),
+    "signing_certificate": ("signingCertificate", None),
+    "signature": ("signature", None),
+}
+
+
+_GET15118_EV_CERTIFICATE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "iso15118SchemaVersion": ("iso15118_schema_version", None),
+    "action": ("action", None),
+    "exiRequest": ("exi_request", None),
+}
+
+
+_GET15118_EV_CERTIFICATE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "iso15118_schema_version": ("iso15118SchemaVersion", None),
+    "action": ("action", None),
+    "exi_request": ("exiRequest", None),
+}
+
+
+_GET15118_EV_CERTIFICATE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "exiResponse": ("exi_response", None),
+}
+
+
+_GET15118_EV_CERTIFICATE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "exi_response": ("exiResponse", None),
+}
+
+
+_GET_BASE_REPORT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "requestId": ("request_id", None),
+    "reportBase": ("report_base", None),
+}
+
+
+_GET_BASE_REPORT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "request_id": ("requestId", None),
+    "report_base": ("reportBase", None),
+}
+
+
+_GET_BASE_REPORT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_GET_BASE_REPORT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_GET_CERTIFICATE_STATUS_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "ocspRequestData": ("ocsp_request_data", _ocsp_request_data_type_to_snake_case),
+}
+
+
+_GET_CERTIFICATE_STATUS_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "ocsp_request_data": ("ocspRequestData", _ocsp_request_data_type_to_camel_case),
+}
+
+
+_GET_CERTIFICATE_STATUS_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "ocspResult": ("ocsp_result", None),
+}
+
+
+_GET_CERTIFICATE_STATUS_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "ocsp_result": ("ocspResult", None),
+}
+
+
+_GET_CHARGING_PROFILES_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "requestId": ("request_id", None),
+    "evseId": ("evse_id", None),
+    "chargingProfile": (
+        "charging_profile",
+        _charging_profile_criterion_type_to_snake_case,
+    ),
+}
+
+
+_GET_CHARGING_PROFILES_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "request_id": ("requestId", None),
+    "evse_id": ("evseId", None),
+    "charging_profile": (
+        "chargingProfile",
+        _charging_profile_criterion_type_to_camel_case,
+    ),
+}
+
+
+_GET_CHARGING_PROFILES_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_GET_CHARGING_PROFILES_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_GET_COMPOSITE_SCHEDULE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "duration": ("duration", None),
+    "chargingRateUnit": ("charging_rate_unit", None),
+    "evseId": ("evse_id", None),
+}
+
+
+_GET_COMPOSITE_SCHEDULE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "duration": ("duration", None),
+    "charging_rate_unit": ("chargingRateUnit", None),
+    "evse_id": ("evseId", None),
+}
+
+
+_GET_COMPOSITE_SCHEDULE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "schedule": ("schedule", _composite_schedule_type_to_snake_case),
+}
+
+
+_GET_COMPOSITE_SCHEDULE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "schedule": ("schedule", _composite_schedule_type_to_camel_case),
+}
+
+
+_GET_DISPLAY_MESSAGES_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "requestId": ("request_id", None),
+    "priority": ("priority", None),
+    "state": ("state", None),
+}
+
+
+_GET_DISPLAY_MESSAGES_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", serialize_as_camel_case),
+    "request_id": ("requestId", None),
+    "priority": ("priority", None),
+    "state": ("state", None),
+}
+
+
+_GET_DISPLAY_MESSAGES_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_GET_DISPLAY_MESSAGES_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_GET_INSTALLED_CERTIFICATE_IDS_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "certificateType": ("certificate_type", None),
+}
+
+
+_GET_INSTALLED_CERTIFICATE_IDS_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "certificate_type": ("certificateType", serialize_as_camel_case),
+}
+
+
+_GET_INSTALLED_CERTIFICATE_IDS_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "certificateHashDataChain": (
+        "certificate_hash_data_chain",
+        _certificate_hash_data_chain_type_list_to_snake_case,
+    ),
+}
+
+
+_GET_INSTALLED_CERTIFICATE_IDS_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "certificate_hash_data_chain": (
+        "certificateHashDataChain",
+        _certificate_hash_data_chain_type_list_to_camel_case,
+    ),
+}
+
+
+_GET_LOCAL_LIST_VERSION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_GET_LOCAL_LIST_VERSION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_GET_LOCAL_LIST_VERSION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "versionNumber": ("version_number", None),
+}
+
+
+_GET_LOCAL_LIST_VERSION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "version_number": ("versionNumber", None),
+}
+
+
+_GET_LOG_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "log": ("log", _log_parameters_type_to_snake_case),
+    "logType": ("log_type", None),
+    "requestId": ("request_id", None),
+    "retries": ("retries", None),
+    "retryInterval": ("retry_interval", None),
+}
+
+
+_GET_LOG_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "log": ("log", _log_parameters_type_to_camel_case),
+    "log_type": ("logType", None),
+    "request_id": ("requestId", None),
+    "retries": ("retries", None),
+    "retry_interval": ("retryInterval", None),
+}
+
+
+_GET_LOG_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "filename": ("filename", None),
+}
+
+
+_GET_LOG_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "filename": ("filename", None),
+}
+
+
+_GET_MONITORING_REPORT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "componentVariable": (
+        "component_variable",
+        _component_variable_type_list_to_snake_case,
+    ),
+    "requestId": ("request_id", None),
+    "monitoringCriteria": ("monitoring_criteria", None),
+}
+
+
+_GET_MONITORING_REPORT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "component_variable": (
+        "componentVariable",
+        _component_variable_type_list_to_camel_case,
+    ),
+    "request_id": ("requestId", None),
+    "monitoring_criteria": ("monitoringCriteria", serialize_as_camel_case),
+}
+
+
+_GET_MONITORING_REPORT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_GET_MONITORING_REPORT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_GET_REPORT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "componentVariable": (
+        "component_variable",
+        _component_variable_type_list_to_snake_case,
+    ),
+    "requestId": ("request_id", None),
+    "componentCriteria": ("component_criteria", None),
+}
+
+
+_GET_REPORT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "component_variable": (
+        "componentVariable",
+        _component_variable_type_list_to_camel_case,
+    ),
+    "request_id": ("requestId", None),
+    "component_criteria": ("componentCriteria", serialize_as_camel_case),
+}
+
+
+_GET_REPORT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_GET_REPORT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_GET_TRANSACTION_STATUS_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "transactionId": ("transaction_id", None),
+}
+
+
+_GET_TRANSACTION_STATUS_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "transaction_id": ("transactionId", None),
+}
+
+
+_GET_TRANSACTION_STATUS_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "ongoingIndicator": ("ongoing_indicator", None),
+    "messagesInQueue": ("messages_in_queue", None),
+}
+
+
+_GET_TRANSACTION_STATUS_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "ongoing_indicator": ("ongoingIndicator", None),
+    "messages_in_queue": ("messagesInQueue", None),
+}
+
+
+_GET_VARIABLE_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "attributeType": ("attribute_type", None),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+}
+
+
+_GET_VARIABLE_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "attribute_type": ("attributeType", None),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+}
+
+
+_GET_VARIABLE_RESULT_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "attributeStatusInfo": ("attribute_status_info", _status_info_type_to_snake_case),
+    "attributeStatus": ("attribute_status", None),
+    "attributeType": ("attribute_type", None),
+    "attributeValue": ("attribute_value", None),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+}
+
+
+_GET_VARIABLE_RESULT_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "attribute_status_info": ("attributeStatusInfo", _status_info_type_to_camel_case),
+    "attribute_status": ("attributeStatus", None),
+    "attribute_type": ("attributeType", None),
+    "attribute_value": ("attributeValue", None),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+}
+
+
+_GET_VARIABLES_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "getVariableData": (
+        "get_variable_data",
+        _get_variable_data_type_list_to_snake_case,
+    ),
+}
+
+
+_GET_VARIABLES_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "get_variable_data": (
+        "getVariableData",
+        _get_variable_data_type_list_to_camel_case,
+    ),
+}
+
+
+_GET_VARIABLES_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "getVariableResult": (
+        "get_variable_result",
+        _get_variable_result_type_list_to_snake_case,
+    ),
+}
+
+
+_GET_VARIABLES_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "get_variable_result": (
+        "getVariableResult",
+        _get_variable_result_type_list_to_camel_case,
+    ),
+}
+
+
+_HEARTBEAT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_HEARTBEAT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_HEARTBEAT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "currentTime": ("current_time", None),
+}
+
+
+_HEARTBEAT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "current_time": ("currentTime", None),
+}
+
+
+_ID_TOKEN_INFO_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "cacheExpiryDateTime": ("cache_expiry_date_time", None),
+    "chargingPriority": ("charging_priority", None),
+    "language1": ("language1", None),
+    "evseId": ("evse_id", None),
+    "groupIdToken": ("group_id_token", _id_token_type_to_snake_case),
+    "language2": ("language2", None),
+    "personalMessage": ("personal_message", _message_content_type_to_snake_case),
+}
+
+
+_ID_TOKEN_INFO_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "cache_expiry_date_time": ("cacheExpiryDateTime", None),
+    "charging_priority": ("chargingPriority", None),
+    "language1": ("language1", None),
+    "evse_id": ("evseId", serialize_as_camel_case),
+    "group_id_token": ("groupIdToken", _id_token_type_to_camel_case),
+    "language2": ("language2", None),
+    "personal_message": ("personalMessage", _message_content_type_to_camel_case),
+}
+
+
+_ID_TOKEN_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "additionalInfo": ("additional_info", _additional_info_type_list_to_snake_case),
+    "idToken": ("id_token", None),
+    "type": ("type", None),
+}
+
+
+_ID_TOKEN_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "additional_info": ("additionalInfo", _additional_info_type_list_to_camel_case),
+    "id_token": ("idToken", None),
+    "type": ("type", None),
+}
+
+
+_INSTALL_CERTIFICATE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "certificateType": ("certificate_type", None),
+    "certificate": ("certificate", None),
+}
+
+
+_INSTALL_CERTIFICATE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "certificate_type": ("certificateType", None),
+    "certificate": ("certificate", None),
+}
+
+
+_INSTALL_CERTIFICATE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_INSTALL_CERTIFICATE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_LOG_PARAMETERS_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "remoteLocation": ("remote_location", None),
+    "oldestTimestamp": ("oldest_timestamp", None),
+    "latestTimestamp": ("latest_timestamp", None),
+}
+
+
+_LOG_PARAMETERS_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "remote_location": ("remoteLocation", None),
+    "oldest_timestamp": ("oldestTimestamp", None),
+    "latest_timestamp": ("latestTimestamp", None),
+}
+
+
+_LOG_STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "requestId": ("request_id", None),
+}
+
+
+_LOG_STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "request_id": ("requestId", None),
+}
+
+
+_LOG_STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_LOG_STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_MESSAGE_CONTENT_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "format": ("format", None),
+    "language": ("language", None),
+    "content": ("content", None),
+}
+
+
+_MESSAGE_CONTENT_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "format": ("format", None),
+    "language": ("language", None),
+    "content": ("content", None),
+}
+
+
+_MESSAGE_INFO_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "display": ("display", _component_type_to_snake_case),
+    "id": ("id", None),
+    "priority": ("priority", None),
+    "state": ("state", None),
+    "startDateTime": ("start_date_time", None),
+    "endDateTime": ("end_date_time", None),
+    "transactionId": ("transaction_id", None),
+    "message": ("message", _message_content_type_to_snake_case),
+}
+
+
+_MESSAGE_INFO_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "display": ("display", _component_type_to_camel_case),
+    "id": ("id", None),
+    "priority": ("priority", None),
+    "state": ("state", None),
+    "start_date_time": ("startDateTime", None),
+    "end_date_time": ("endDateTime", None),
+    "transaction_id": ("transactionId", None),
+    "message": ("message", _message_content_type_to_camel_case),
+}
+
+
+_METER_VALUE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "sampledValue": ("sampled_value", _sampled_value_type_list_to_snake_case),
+    "timestamp": ("timestamp", None),
+}
+
+
+_METER_VALUE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "sampled_value": ("sampledValue", _sampled_value_type_list_to_camel_case),
+    "timestamp": ("timestamp", None),
+}
+
+
+_METER_VALUES_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evseId": ("evse_id", None),
+    "meterValue": ("meter_value", _meter_value_type_list_to_snake_case),
+}
+
+
+_METER_VALUES_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse_id": ("evseId", None),
+    "meter_value": ("meterValue", _meter_value_type_list_to_camel_case),
+}
+
+
+_METER_VALUES_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_METER_VALUES_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_MODEM_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "iccid": ("iccid", None),
+    "imsi": ("imsi", None),
+}
+
+
+_MODEM_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "iccid": ("iccid", None),
+    "imsi": ("imsi", None),
+}
+
+
+_MONITORING_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+    "variableMonitoring": (
+        "variable_monitoring",
+        _variable_monitoring_type_list_to_snake_case,
+    ),
+}
+
+
+_MONITORING_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+    "variable_monitoring": (
+        "variableMonitoring",
+        _variable_monitoring_type_list_to_camel_case,
+    ),
+}
+
+
+_NETWORK_CONNECTION_PROFILE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "apn": ("apn", _apn_type_to_snake_case),
+    "ocppVersion": ("ocpp_version", None),
+    "ocppTransport": ("ocpp_transport", None),
+    "ocppCsmsUrl": ("ocpp_csms_url", None),
+    "messageTimeout": ("message_timeout", None),
+    "securityProfile": ("security_profile", None),
+    "ocppInterface": ("ocpp_interface", None),
+    "vpn": ("vpn", _vpn_type_to_snake_case),
+}
+
+
+_NETWORK_CONNECTION_PROFILE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "apn": ("apn", _apn_type_to_camel_case),
+    "ocpp_version": ("ocppVersion", None),
+    "ocpp_transport": ("ocppTransport", None),
+    "ocpp_csms_url": ("ocppCsmsUrl", None),
+    "message_timeout": ("messageTimeout", None),
+    "security_profile": ("securityProfile", None),
+    "ocpp_interface": ("ocppInterface", None),
+    "vpn": ("vpn", _vpn_type_to_camel_case),
+}
+
+
+_NOTIFY_CHARGING_LIMIT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "chargingSchedule": (
+        "charging_schedule",
+        _charging_schedule_type_list_to_snake_case,
+    ),
+    "evseId": ("evse_id", None),
+    "chargingLimit": ("charging_limit", _charging_limit_type_to_snake_case),
+}
+
+
+_NOTIFY_CHARGING_LIMIT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "charging_schedule": (
+        "chargingSchedule",
+        _charging_schedule_type_list_to_camel_case,
+    ),
+    "evse_id": ("evseId", None),
+    "charging_limit": ("chargingLimit", _charging_limit_type_to_camel_case),
+}
+
+
+_NOTIFY_CHARGING_LIMIT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_NOTIFY_CHARGING_LIMIT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_NOTIFY_CUSTOMER_INFORMATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "data": ("data", None),
+    "tbc": ("tbc", None),
+    "seqNo": ("seq_no", None),
+    "generatedAt": ("generated_at", None),
+    "requestId": ("request_id", None),
+}
+
+
+_NOTIFY_CUSTOMER_INFORMATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "data": ("data", None),
+    "tbc": ("tbc", None),
+    "seq_no": ("seqNo", None),
+    "generated_at": ("generatedAt", None),
+    "request_id": ("requestId", None),
+}
+
+
+_NOTIFY_CUSTOMER_INFORMATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_NOTIFY_CUSTOMER_INFORMATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_NOTIFY_DISPLAY_MESSAGES_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "messageInfo": ("message_info", _message_info_type_list_to_snake_case),
+    "requestId": ("request_id", None),
+    "tbc": ("tbc", None),
+}
+
+
+_NOTIFY_DISPLAY_MESSAGES_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "message_info": ("messageInfo", _message_info_type_list_to_camel_case),
+    "request_id": ("requestId", None),
+    "tbc": ("tbc", None),
+}
+
+
+_NOTIFY_DISPLAY_MESSAGES_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_NOTIFY_DISPLAY_MESSAGES_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_NOTIFY_EV_CHARGING_NEEDS_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "maxScheduleTuples": ("max_schedule_tuples", None),
+    "chargingNeeds": ("charging_needs", _charging_needs_type_to_snake_case),
+    "evseId": ("evse_id", None),
+}
+
+
+_NOTIFY_EV_CHARGING_NEEDS_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "max_schedule_tuples": ("maxScheduleTuples", None),
+    "charging_needs": ("chargingNeeds", _charging_needs_type_to_camel_case),
+    "evse_id": ("evseId", None),
+}
+
+
+_NOTIFY_EV_CHARGING_NEEDS_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_NOTIFY_EV_CHARGING_NEEDS_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_NOTIFY_EV_CHARGING_SCHEDULE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "timeBase": ("time_base", None),
+    "chargingSchedule": ("charging_schedule", _charging_schedule_type_to_snake_case),
+    "evseId": ("evse_id", None),
+}
+
+
+_NOTIFY_EV_CHARGING_SCHEDULE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "time_base": ("timeBase", None),
+    "charging_schedule": ("chargingSchedule", _charging_schedule_type_to_camel_case),
+    "evse_id": ("evseId", None),
+}
+
+
+_NOTIFY_EV_CHARGING_SCHEDULE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_NOTIFY_EV_CHARGING_SCHEDULE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_NOTIFY_EVENT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "generatedAt": ("generated_at", None),
+    "tbc": ("tbc", None),
+    "seqNo": ("seq_no", None),
+    "eventData": ("event_data", _event_data_type_list_to_snake_case),
+}
+
+
+_NOTIFY_EVENT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "generated_at": ("generatedAt", None),
+    "tbc": ("tbc", None),
+    "seq_no": ("seqNo", None),
+    "event_data": ("eventData", _event_data_type_list_to_camel_case),
+}
+
+
+_NOTIFY_EVENT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_NOTIFY_EVENT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_NOTIFY_MONITORING_REPORT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "monitor": ("monitor", _monitoring_data_type_list_to_snake_case),
+    "requestId": ("request_id", None),
+    "tbc": ("tbc", None),
+    "seqNo": ("seq_no", None),
+    "generatedAt": ("generated_at", None),
+}
+
+
+_NOTIFY_MONITORING_REPORT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "monitor": ("monitor", _monitoring_data_type_list_to_camel_case),
+    "request_id": ("requestId", None),
+    "tbc": ("tbc", None),
+    "seq_no": ("seqNo", None),
+    "generated_at": ("generatedAt", None),
+}
+
+
+_NOTIFY_MONITORING_REPORT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_NOTIFY_MONITORING_REPORT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_NOTIFY_REPORT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "requestId": ("request_id", None),
+    "generatedAt": ("generated_at", None),
+    "reportData": ("report_data", _report_data_type_list_to_snake_case),
+    "tbc": ("tbc", None),
+    "seqNo": ("seq_no", None),
+}
+
+
+_NOTIFY_REPORT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "request_id": ("requestId", None),
+    "generated_at": ("generatedAt", None),
+    "report_data": ("reportData", _report_data_type_list_to_camel_case),
+    "tbc": ("tbc", None),
+    "seq_no": ("seqNo", None),
+}
+
+
+_NOTIFY_REPORT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_NOTIFY_REPORT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_OCSP_REQUEST_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "hashAlgorithm": ("hash_algorithm", None),
+    "issuerNameHash": ("issuer_name_hash", None),
+    "issuerKeyHash": ("issuer_key_hash", None),
+    "serialNumber": ("serial_number", None),
+    "responderURL": ("responder_url", None),
+}
+
+
+_OCSP_REQUEST_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "hash_algorithm": ("hashAlgorithm", None),
+    "issuer_name_hash": ("issuerNameHash", None),
+    "issuer_key_hash": ("issuerKeyHash", None),
+    "serial_number": ("serialNumber", None),
+    "responder_url": ("responderURL", None),
+}
+
+
+_PUBLISH_FIRMWARE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "location": ("location", None),
+    "retries": ("retries", None),
+    "checksum": ("checksum", None),
+    "requestId": ("request_id", None),
+    "retryInterval": ("retry_interval", None),
+}
+
+
+_PUBLISH_FIRMWARE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "location": ("location", None),
+    "retries": ("retries", None),
+    "checksum": ("checksum", None),
+    "request_id": ("requestId", None),
+    "retry_interval": ("retryInterval", None),
+}
+
+
+_PUBLISH_FIRMWARE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_PUBLISH_FIRMWARE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_PUBLISH_FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "location": ("location", None),
+    "requestId": ("request_id", None),
+}
+
+
+_PUBLISH_FIRMWARE_STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "location": ("location", serialize_as_camel_case),
+    "request_id": ("requestId", None),
+}
+
+
+_PUBLISH_FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_PUBLISH_FIRMWARE_STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_RELATIVE_TIME_INTERVAL_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "start": ("start", None),
+    "duration": ("duration", None),
+}
+
+
+_RELATIVE_TIME_INTERVAL_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "start": ("start", None),
+    "duration": ("duration", None),
+}
+
+
+_REPORT_CHARGING_PROFILES_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "requestId": ("request_id", None),
+    "chargingLimitSource": ("charging_limit_source", None),
+    "chargingProfile": ("charging_profile", _charging_profile_type_list_to_snake_case),
+    "tbc": ("tbc", None),
+    "evseId": ("evse_id", None),
+}
+
+
+_REPORT_CHARGING_PROFILES_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "request_id": ("requestId", None),
+    "charging_limit_source": ("chargingLimitSource", None),
+    "charging_profile": ("chargingProfile", _charging_profile_type_list_to_camel_case),
+    "tbc": ("tbc", None),
+    "evse_id": ("evseId", None),
+}
+
+
+_REPORT_CHARGING_PROFILES_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_REPORT_CHARGING_PROFILES_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_REPORT_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+    "variableAttribute": (
+        "variable_attribute",
+        _variable_attribute_type_list_to_snake_case,
+    ),
+    "variableCharacteristics": (
+        "variable_characteristics",
+        _variable_characteristics_type_to_snake_case,
+    ),
+}
+
+
+_REPORT_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+    "variable_attribute": (
+        "variableAttribute",
+        _variable_attribute_type_list_to_camel_case,
+    ),
+    "variable_characteristics": (
+        "variableCharacteristics",
+        _variable_characteristics_type_to_camel_case,
+    ),
+}
+
+
+_REQUEST_START_TRANSACTION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evseId": ("evse_id", None),
+    "groupIdToken": ("group_id_token", _id_token_type_to_snake_case),
+    "idToken": ("id_token", _id_token_type_to_snake_case),
+    "remoteStartId": ("remote_start_id", None),
+    "chargingProfile": ("charging_profile", _charging_profile_type_to_snake_case),
+}
+
+
+_REQUEST_START_TRANSACTION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse_id": ("evseId", None),
+    "group_id_token": ("groupIdToken", _id_token_type_to_camel_case),
+    "id_token": ("idToken", _id_token_type_to_camel_case),
+    "remote_start_id": ("remoteStartId", None),
+    "charging_profile": ("chargingProfile", _charging_profile_type_to_camel_case),
+}
+
+
+_REQUEST_START_TRANSACTION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "transactionId": ("transaction_id", None),
+}
+
+
+_REQUEST_START_TRANSACTION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "transaction_id": ("transactionId", None),
+}
+
+
+_REQUEST_STOP_TRANSACTION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "transactionId": ("transaction_id", None),
+}
+
+
+_REQUEST_STOP_TRANSACTION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "transaction_id": ("transactionId", None),
+}
+
+
+_REQUEST_STOP_TRANSACTION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_REQUEST_STOP_TRANSACTION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_RESERVATION_STATUS_UPDATE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "reservationId": ("reservation_id", None),
+    "reservationUpdateStatus": ("reservation_update_status", None),
+}
+
+
+_RESERVATION_STATUS_UPDATE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "reservation_id": ("reservationId", None),
+    "reservation_update_status": ("reservationUpdateStatus", None),
+}
+
+
+_RESERVATION_STATUS_UPDATE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_RESERVATION_STATUS_UPDATE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_RESERVE_NOW_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "expiryDateTime": ("expiry_date_time", None),
+    "connectorType": ("connector_type", None),
+    "idToken": ("id_token", _id_token_type_to_snake_case),
+    "evseId": ("evse_id", None),
+    "groupIdToken": ("group_id_token", _id_token_type_to_snake_case),
+}
+
+
+_RESERVE_NOW_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "expiry_date_time": ("expiryDateTime", None),
+    "connector_type": ("connectorType", None),
+    "id_token": ("idToken", _id_token_type_to_camel_case),
+    "evse_id": ("evseId", None),
+    "group_id_token": ("groupIdToken", _id_token_type_to_camel_case),
+}
+
+
+_RESERVE_NOW_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_RESERVE_NOW_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_RESET_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "type": ("type", None),
+    "evseId": ("evse_id", None),
+}
+
+
+_RESET_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "type": ("type", None),
+    "evse_id": ("evseId", None),
+}
+
+
+_RESET_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_RESET_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SALES_TARIFF_ENTRY_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "relativeTimeInterval": (
+        "relative_time_interval",
+        _relative_time_interval_type_to_snake_case,
+    ),
+    "ePriceLevel": ("e_price_level", None),
+    "consumptionCost": ("consumption_cost", _consumption_cost_type_list_to_snake_case),
+}
+
+
+_SALES_TARIFF_ENTRY_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "relative_time_interval": (
+        "relativeTimeInterval",
+        _relative_time_interval_type_to_camel_case,
+    ),
+    "e_price_level": ("ePriceLevel", None),
+    "consumption_cost": ("consumptionCost", _consumption_cost_type_list_to_camel_case),
+}
+
+
+_SALES_TARIFF_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "salesTariffDescription": ("sales_tariff_description", None),
+    "numEPriceLevels": ("num_e_price_levels", None),
+    "salesTariffEntry": (
+        "sales_tariff_entry",
+        _sales_tariff_entry_type_list_to_snake_case,
+    ),
+}
+
+
+_SALES_TARIFF_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "sales_tariff_description": ("salesTariffDescription", None),
+    "num_e_price_levels": ("numEPriceLevels", None),
+    "sales_tariff_entry": (
+        "salesTariffEntry",
+        _sales_tariff_entry_type_list_to_camel_case,
+    ),
+}
+
+
+_SAMPLED_VALUE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "value": ("value", None),
+    "context": ("context", None),
+    "measurand": ("measurand", None),
+    "phase": ("phase", None),
+    "location": ("location", None),
+    "signedMeterValue": ("signed_meter_value", _signed_meter_value_type_to_snake_case),
+    "unitOfMeasure": ("unit_of_measure", _unit_of_measure_type_to_snake_case),
+}
+
+
+_SAMPLED_VALUE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "value": ("value", None),
+    "context": ("context", None),
+    "measurand": ("measurand", None),
+    "phase": ("phase", None),
+    "location": ("location", None),
+    "signed_meter_value": ("signedMeterValue", _signed_meter_value_type_to_camel_case),
+    "unit_of_measure": ("unitOfMeasure", _unit_of_measure_type_to_camel_case),
+}
+
+
+_SECURITY_EVENT_NOTIFICATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "type": ("type", None),
+    "timestamp": ("timestamp", None),
+    "techInfo": ("tech_info", None),
+}
+
+
+_SECURITY_EVENT_NOTIFICATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "type": ("type", None),
+    "timestamp": ("timestamp", None),
+    "tech_info": ("techInfo", None),
+}
+
+
+_SECURITY_EVENT_NOTIFICATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_SECURITY_EVENT_NOTIFICATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_SEND_LOCAL_LIST_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "localAuthorizationList": (
+        "local_authorization_list",
+        _authorization_data_list_to_snake_case,
+    ),
+    "versionNumber": ("version_number", None),
+    "updateType": ("update_type", None),
+}
+
+
+_SEND_LOCAL_LIST_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "local_authorization_list": (
+        "localAuthorizationList",
+        _authorization_data_list_to_camel_case,
+    ),
+    "version_number": ("versionNumber", None),
+    "update_type": ("updateType", None),
+}
+
+
+_SEND_LOCAL_LIST_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_SEND_LOCAL_LIST_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SET_CHARGING_PROFILE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evseId": ("evse_id", None),
+    "chargingProfile": ("charging_profile", _charging_profile_type_to_snake_case),
+}
+
+
+_SET_CHARGING_PROFILE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse_id": ("evseId", None),
+    "charging_profile": ("chargingProfile", _charging_profile_type_to_camel_case),
+}
+
+
+_SET_CHARGING_PROFILE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_SET_CHARGING_PROFILE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SET_DISPLAY_MESSAGE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "message": ("message", _message_info_type_to_snake_case),
+}
+
+
+_SET_DISPLAY_MESSAGE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "message": ("message", _message_info_type_to_camel_case),
+}
+
+
+_SET_DISPLAY_MESSAGE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_SET_DISPLAY_MESSAGE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SET_MONITORING_BASE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "monitoringBase": ("monitoring_base", None),
+}
+
+
+_SET_MONITORING_BASE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "monitoring_base": ("monitoringBase", None),
+}
+
+
+_SET_MONITORING_BASE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_SET_MONITORING_BASE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SET_MONITORING_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "transaction": ("transaction", None),
+    "value": ("value", None),
+    "type": ("type", None),
+    "severity": ("severity", None),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+}
+
+
+_SET_MONITORING_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "transaction": ("transaction", None),
+    "value": ("value", None),
+    "type": ("type", None),
+    "severity": ("severity", None),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+}
+
+
+_SET_MONITORING_LEVEL_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "severity": ("severity", None),
+}
+
+
+_SET_MONITORING_LEVEL_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "severity": ("severity", None),
+}
+
+
+_SET_MONITORING_LEVEL_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_SET_MONITORING_LEVEL_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SET_MONITORING_RESULT_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+    "status": ("status", None),
+    "type": ("type", None),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+    "severity": ("severity", None),
+}
+
+
+_SET_MONITORING_RESULT_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+    "status": ("status", None),
+    "type": ("type", None),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+    "severity": ("severity", None),
+}
+
+
+_SET_NETWORK_PROFILE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "configurationSlot": ("configuration_slot", None),
+    "connectionData": (
+        "connection_data",
+        _network_connection_profile_type_to_snake_case,
+    ),
+}
+
+
+_SET_NETWORK_PROFILE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "configuration_slot": ("configurationSlot", None),
+    "connection_data": (
+        "connectionData",
+        _network_connection_profile_type_to_camel_case,
+    ),
+}
+
+
+_SET_NETWORK_PROFILE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_SET_NETWORK_PROFILE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SET_VARIABLE_DATA_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "attributeType": ("attribute_type", None),
+    "attributeValue": ("attribute_value", None),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+}
+
+
+_SET_VARIABLE_DATA_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "attribute_type": ("attributeType", None),
+    "attribute_value": ("attributeValue", None),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+}
+
+
+_SET_VARIABLE_MONITORING_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "setMonitoringData": (
+        "set_monitoring_data",
+        _set_monitoring_data_type_list_to_snake_case,
+    ),
+}
+
+
+_SET_VARIABLE_MONITORING_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "set_monitoring_data": (
+        "setMonitoringData",
+        _set_monitoring_data_type_list_to_camel_case,
+    ),
+}
+
+
+_SET_VARIABLE_MONITORING_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "setMonitoringResult": (
+        "set_monitoring_result",
+        _set_monitoring_result_type_list_to_snake_case,
+    ),
+}
+
+
+_SET_VARIABLE_MONITORING_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "set_monitoring_result": (
+        "setMonitoringResult",
+        _set_monitoring_result_type_list_to_camel_case,
+    ),
+}
+
+
+_SET_VARIABLE_RESULT_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "attributeType": ("attribute_type", None),
+    "attributeStatus": ("attribute_status", None),
+    "attributeStatusInfo": ("attribute_status_info", _status_info_type_to_snake_case),
+    "component": ("component", _component_type_to_snake_case),
+    "variable": ("variable", _variable_type_to_snake_case),
+}
+
+
+_SET_VARIABLE_RESULT_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "attribute_type": ("attributeType", None),
+    "attribute_status": ("attributeStatus", None),
+    "attribute_status_info": ("attributeStatusInfo", _status_info_type_to_camel_case),
+    "component": ("component", _component_type_to_camel_case),
+    "variable": ("variable", _variable_type_to_camel_case),
+}
+
+
+_SET_VARIABLES_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "setVariableData": (
+        "set_variable_data",
+        _set_variable_data_type_list_to_snake_case,
+    ),
+}
+
+
+_SET_VARIABLES_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "set_variable_data": (
+        "setVariableData",
+        _set_variable_data_type_list_to_camel_case,
+    ),
+}
+
+
+_SET_VARIABLES_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "setVariableResult": (
+        "set_variable_result",
+        _set_variable_result_type_list_to_snake_case,
+    ),
+}
+
+
+_SET_VARIABLES_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "set_variable_result": (
+        "setVariableResult",
+        _set_variable_result_type_list_to_camel_case,
+    ),
+}
+
+
+_SIGN_CERTIFICATE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "csr": ("csr", None),
+    "certificateType": ("certificate_type", None),
+}
+
+
+_SIGN_CERTIFICATE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "csr": ("csr", None),
+    "certificate_type": ("certificateType", None),
+}
+
+
+_SIGN_CERTIFICATE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_SIGN_CERTIFICATE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_SIGNED_METER_VALUE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "signedMeterData": ("signed_meter_data", None),
+    "signingMethod": ("signing_method", None),
+    "encodingMethod": ("encoding_method", None),
+    "publicKey": ("public_key", None),
+}
+
+
+_SIGNED_METER_VALUE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "signed_meter_data": ("signedMeterData", None),
+    "signing_method": ("signingMethod", None),
+    "encoding_method": ("encodingMethod", None),
+    "public_key": ("publicKey", None),
+}
+
+
+_STATUS_INFO_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "reasonCode": ("reason_code", None),
+    "additionalInfo": ("additional_info", None),
+}
+
+
+_STATUS_INFO_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "reason_code": ("reasonCode", None),
+    "additional_info": ("additionalInfo", None),
+}
+
+
+_STATUS_NOTIFICATION_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "timestamp": ("timestamp", None),
+    "connectorStatus": ("connector_status", None),
+    "evseId": ("evse_id", None),
+    "connectorId": ("connector_id", None),
+}
+
+
+_STATUS_NOTIFICATION_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "timestamp": ("timestamp", None),
+    "connector_status": ("connectorStatus", None),
+    "evse_id": ("evseId", None),
+    "connector_id": ("connectorId", None),
+}
+
+
+_STATUS_NOTIFICATION_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+}
+
+
+_STATUS_NOTIFICATION_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+}
+
+
+_TRANSACTION_EVENT_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "eventType": ("event_type", None),
+    "meterValue": ("meter_value", _meter_value_type_list_to_snake_case),
+    "timestamp": ("timestamp", None),
+    "triggerReason": ("trigger_reason", None),
+    "seqNo": ("seq_no", None),
+    "offline": ("offline", None),
+    "numberOfPhasesUsed": ("number_of_phases_used", None),
+    "cableMaxCurrent": ("cable_max_current", None),
+    "reservationId": ("reservation_id", None),
+    "transactionInfo": ("transaction_info", _transaction_type_to_snake_case),
+    "evse": ("evse", _evse_type_to_snake_case),
+    "idToken": ("id_token", _id_token_type_to_snake_case),
+}
+
+
+_TRANSACTION_EVENT_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "event_type": ("eventType", None),
+    "meter_value": ("meterValue", _meter_value_type_list_to_camel_case),
+    "timestamp": ("timestamp", None),
+    "trigger_reason": ("triggerReason", None),
+    "seq_no": ("seqNo", None),
+    "offline": ("offline", None),
+    "number_of_phases_used": ("numberOfPhasesUsed", None),
+    "cable_max_current": ("cableMaxCurrent", None),
+    "reservation_id": ("reservationId", None),
+    "transaction_info": ("transactionInfo", _transaction_type_to_camel_case),
+    "evse": ("evse", _evse_type_to_camel_case),
+    "id_token": ("idToken", _id_token_type_to_camel_case),
+}
+
+
+_TRANSACTION_EVENT_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "totalCost": ("total_cost", None),
+    "chargingPriority": ("charging_priority", None),
+    "idTokenInfo": ("id_token_info", _id_token_info_type_to_snake_case),
+    "updatedPersonalMessage": (
+        "updated_personal_message",
+        _message_content_type_to_snake_case,
+    ),
+}
+
+
+_TRANSACTION_EVENT_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "total_cost": ("totalCost", None),
+    "charging_priority": ("chargingPriority", None),
+    "id_token_info": ("idTokenInfo", _id_token_info_type_to_camel_case),
+    "updated_personal_message": (
+        "updatedPersonalMessage",
+        _message_content_type_to_camel_case,
+    ),
+}
+
+
+_TRANSACTION_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "transactionId": ("transaction_id", None),
+    "chargingState": ("charging_state", None),
+    "timeSpentCharging": ("time_spent_charging", None),
+    "stoppedReason": ("stopped_reason", None),
+    "remoteStartId": ("remote_start_id", None),
+}
+
+
+_TRANSACTION_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "transaction_id": ("transactionId", None),
+    "charging_state": ("chargingState", None),
+    "time_spent_charging": ("timeSpentCharging", None),
+    "stopped_reason": ("stoppedReason", None),
+    "remote_start_id": ("remoteStartId", None),
+}
+
+
+_TRIGGER_MESSAGE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evse": ("evse", _evse_type_to_snake_case),
+    "requestedMessage": ("requested_message", None),
+}
+
+
+_TRIGGER_MESSAGE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse": ("evse", _evse_type_to_camel_case),
+    "requested_message": ("requestedMessage", None),
+}
+
+
+_TRIGGER_MESSAGE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_TRIGGER_MESSAGE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_UNIT_OF_MEASURE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "unit": ("unit", None),
+    "multiplier": ("multiplier", None),
+}
+
+
+_UNIT_OF_MEASURE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "unit": ("unit", None),
+    "multiplier": ("multiplier", None),
+}
+
+
+_UNLOCK_CONNECTOR_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "evseId": ("evse_id", None),
+    "connectorId": ("connector_id", None),
+}
+
+
+_UNLOCK_CONNECTOR_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "evse_id": ("evseId", None),
+    "connector_id": ("connectorId", None),
+}
+
+
+_UNLOCK_CONNECTOR_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_UNLOCK_CONNECTOR_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_UNPUBLISH_FIRMWARE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "checksum": ("checksum", None),
+}
+
+
+_UNPUBLISH_FIRMWARE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "checksum": ("checksum", None),
+}
+
+
+_UNPUBLISH_FIRMWARE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+}
+
+
+_UNPUBLISH_FIRMWARE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+}
+
+
+_UPDATE_FIRMWARE_REQUEST_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "retries": ("retries", None),
+    "retryInterval": ("retry_interval", None),
+    "requestId": ("request_id", None),
+    "firmware": ("firmware", _firmware_type_to_snake_case),
+}
+
+
+_UPDATE_FIRMWARE_REQUEST_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "retries": ("retries", None),
+    "retry_interval": ("retryInterval", None),
+    "request_id": ("requestId", None),
+    "firmware": ("firmware", _firmware_type_to_camel_case),
+}
+
+
+_UPDATE_FIRMWARE_RESPONSE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "status": ("status", None),
+    "statusInfo": ("status_info", _status_info_type_to_snake_case),
+}
+
+
+_UPDATE_FIRMWARE_RESPONSE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "status": ("status", None),
+    "status_info": ("statusInfo", _status_info_type_to_camel_case),
+}
+
+
+_VPN_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "server": ("server", None),
+    "user": ("user", None),
+    "group": ("group", None),
+    "password": ("password", None),
+    "key": ("key", None),
+    "type": ("type", None),
+}
+
+
+_VPN_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "server": ("server", None),
+    "user": ("user", None),
+    "group": ("group", None),
+    "password": ("password", None),
+    "key": ("key", None),
+    "type": ("type", None),
+}
+
+
+_VARIABLE_ATTRIBUTE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "type": ("type", None),
+    "value": ("value", None),
+    "mutability": ("mutability", None),
+    "persistent": ("persistent", None),
+    "constant": ("constant", None),
+}
+
+
+_VARIABLE_ATTRIBUTE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "type": ("type", None),
+    "value": ("value", None),
+    "mutability": ("mutability", None),
+    "persistent": ("persistent", None),
+    "constant": ("constant", None),
+}
+
+
+_VARIABLE_CHARACTERISTICS_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "unit": ("unit", None),
+    "dataType": ("data_type", None),
+    "minLimit": ("min_limit", None),
+    "maxLimit": ("max_limit", None),
+    "valuesList": ("values_list", None),
+    "supportsMonitoring": ("supports_monitoring", None),
+}
+
+
+_VARIABLE_CHARACTERISTICS_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "unit": ("unit", None),
+    "data_type": ("dataType", None),
+    "min_limit": ("minLimit", None),
+    "max_limit": ("maxLimit", None),
+    "values_list": ("valuesList", None),
+    "supports_monitoring": ("supportsMonitoring", None),
+}
+
+
+_VARIABLE_MONITORING_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "id": ("id", None),
+    "transaction": ("transaction", None),
+    "value": ("value", None),
+    "type": ("type", None),
+    "severity": ("severity", None),
+}
+
+
+_VARIABLE_MONITORING_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "id": ("id", None),
+    "transaction": ("transaction", None),
+    "value": ("value", None),
+    "type": ("type", None),
+    "severity": ("severity", None),
+}
+
+
+_VARIABLE_TYPE_TO_SNAKE_CASE = {
+    "customData": ("custom_data", _custom_data_type_to_snake_case),
+    "name": ("name", None),
+    "instance": ("instance", None),
+}
+
+
+_VARIABLE_TYPE_TO_CAMEL_CASE = {
+    "custom_data": ("customData", _custom_data_type_to_camel_case),
+    "name": ("name", None),
+    "instance": ("instance", None),
+}
+
+
+CALL_TO_SNAKE_CASE = {
+    "Authorize": _authorize_request_to_snake_case,
+    "BootNotification": _boot_notification_request_to_snake_case,
+    "CancelReservation": _cancel_reservation_request_to_snake_case,
+    "CertificateSigned": _certificate_signed_request_to_snake_case,
+    "ChangeAvailability": _change_availability_request_to_snake_case,
+    "ClearCache": _clear_cache_request_to_snake_case,
+    "ClearChargingProfile": _clear_charging_profile_request_to_snake_case,
+    "ClearDisplayMessage": _clear_display_message_request_to_snake_case,
+    "ClearVariableMonitoring": _clear_variable_monitoring_request_to_snake_case,
+    "ClearedChargingLimit": _cleared_charging_limit_request_to_snake_case,
+    "CostUpdated": _cost_updated_request_to_snake_case,
+    "CustomerInformation": _customer_information_request_to_snake_case,
+    "DataTransfer": _data_transfer_request_to_snake_case,
+    "DeleteCertificate": _delete_certificate_request_to_snake_case,
+    "FirmwareStatusNotification": _firmware_status_notification_request_to_snake_case,
+    "Get15118EVCertificate": _get15118_ev_certificate_request_to_snake_case,
+    "GetBaseReport": _get_base_report_request_to_snake_case,
+    "GetCertificateStatus": _get_certificate_status_request_to_snake_case,
+    "GetChargingProfiles": _get_charging_profiles_request_to_snake_case,
+    "GetCompositeSchedule": _get_composite_schedule_request_to_snake_case,
+    "GetDisplayMessages": _get_display_messages_request_to_snake_case,
+    "GetInstalledCertificateIds": _get_installed_certificate_ids_request_to_snake_case,
+    "GetLocalListVersion": _get_local_list_version_request_to_snake_case,
+    "GetLog": _get_log_request_to_snake_case,
+    "GetMonitoringReport": _get_monitoring_report_request_to_snake_case,
+    "GetReport": _get_report_request_to_snake_case,
+    "GetTransactionStatus": _get_transaction_status_request_to_snake_case,
+    "GetVariables": _get_variables_request_to_snake_case,
+    "Heartbeat": _heartbeat_request_to_snake_case,
+    "InstallCertificate": _install_certificate_request_to_snake_case,
+    "LogStatusNotification": _log_status_notification_request_to_snake_case,
+    "MeterValues": _meter_values_request_to_snake_case,
+    "NotifyChargingLimit": _notify_charging_limit_request_to_snake_case,
+    "NotifyCustomerInformation": _notify_customer_information_request_to_snake_case,
+    "NotifyDisplayMessages": _notify_display_messages_request_to_snake_case,
+    "NotifyEVChargingNeeds": _notify_ev_charging_needs_request_to_snake_case,
+    "NotifyEVChargingSchedule": _notify_ev_charging_schedule_request_to_snake_case,
+    "NotifyEvent": _notify_event_request_to_snake_case,
+    "NotifyMonitoringReport": _notify_monitoring_report_request_to_snake_case,
+    "NotifyReport": _notify_report_request_to_snake_case,
+    "PublishFirmware": _publish_firmware_request_to_snake_case,
+    "PublishFirmwareStatusNotification": _publish_firmware_status_notification_request_to_snake_case,  # noqa: E501
+    "ReportChargingProfiles": _report_charging_profiles_request_to_snake_case,
+    "RequestStartTransaction": _request_start_transaction_request_to_snake_case,
+    "RequestStopTransaction": _request_stop_transaction_request_to_snake_case,
+    "ReservationStatusUpdate": _reservation_status_update_request_to_snake_case,
+    "ReserveNow": _reserve_now_request_to_snake_case,
+    "Reset": _reset_request_to_snake_case,
+    "SecurityEventNotification": _security_event_notification_request_to_snake_case,
+    "SendLocalList": _send_local_list_request_to_snake_case,
+    "SetChargingProfile": _set_charging_profile_request_to_snake_case,
+    "SetDisplayMessage": _set_display_message_request_to_snake_case,
+    "SetMonitoringBase": _set_monitoring_base_request_to_snake_case,
+    "SetMonitoringLevel": _set_monitoring_level_request_to_snake_case,
+    "SetNetworkProfile": _set_network_profile_request_to_snake_case,
+    "SetVariableMonitoring": _set_variable_monitoring_request_to_snake_case,
+    "SetVariables": _set_variables_request_to_snake_case,
+    "SignCertificate": _sign_certificate_request_to_snake_case,
+    "StatusNotification": _status_notification_request_to_snake_case,
+    "TransactionEvent": _transaction_event_request_to_snake_case,
+    "TriggerMessage": _trigger_message_request_to_snake_case,
+    "UnlockConnector": _unlock_connector_request_to_snake_case,
+    "UnpublishFirmware": _unpublish_firmware_request_to_snake_case,
+    "UpdateFirmware": _update_firmware_request_to_snake_case,
+}
+
+
+CALL_TO_CAMEL_CASE = {
+    "Authorize": _authorize_request_to_camel_case,
+    "BootNotification": _boot_notification_request_to_camel_case,
+    "CancelReservation": _cancel_reservation_request_to_camel_case,
+    "CertificateSigned": _certificate_signed_request_to_camel_case,
+    "ChangeAvailability": _change_availability_request_to_camel_case,
+    "ClearCache": _clear_cache_request_to_camel_case,
+    "ClearChargingProfile": _clear_charging_profile_request_to_camel_case,
+    "ClearDisplayMessage": _clear_display_message_request_to_camel_case,
+    "ClearVariableMonitoring": _clear_variable_monitoring_request_to_camel_case,
+    "ClearedChargingLimit": _cleared_charging_limit_request_to_camel_case,
+    "CostUpdated": _cost_updated_request_to_camel_case,
+    "CustomerInformation": _customer_information_request_to_camel_case,
+    "DataTransfer": _data_transfer_request_to_camel_case,
+    "DeleteCertificate": _delete_certificate_request_to_camel_case,
+    "FirmwareStatusNotification": _firmware_status_notification_request_to_camel_case,
+    "Get15118EVCertificate": _get15118_ev_certificate_request_to_camel_case,
+    "GetBaseReport": _get_base_report_request_to_camel_case,
+    "GetCertificateStatus": _get_certificate_status_request_to_camel_case,
+    "GetChargingProfiles": _get_charging_profiles_request_to_camel_case,
+    "GetCompositeSchedule": _get_composite_schedule_request_to_camel_case,
+    "GetDisplayMessages": _get_display_messages_request_to_camel_case,
+    "GetInstalledCertificateIds": _get_installed_certificate_ids_request_to_camel_case,
+    "GetLocalListVersion": _get_local_list_version_request_to_camel_case,
+    "GetLog": _get_log_request_to_camel_case,
+    "GetMonitoringReport": _get_monitoring_report_request_to_camel_case,
+    "GetReport": _get_report_request_to_camel_case,
+    "GetTransactionStatus": _get_transaction_status_request_to_camel_case,
+    "GetVariables": _get_variables_request_to_camel_case,
+    "Heartbeat": _heartbeat_request_to_camel_case,
+    "InstallCertificate": _install_certificate_request_to_camel_case,
+    "LogStatusNotification": _log_status_notification_request_to_camel_case,
+    "MeterValues": _meter_values_request_to_camel_case,
+    "NotifyChargingLimit": _notify_charging_limit_request_to_camel_case,
+    "NotifyCustomerInformation": _notify_customer_information_request_to_camel_case,
+    "NotifyDisplayMessages": _notify_display_messages_request_to_camel_case,
+    "NotifyEVChargingNeeds": _notify_ev_charging_needs_request_to_camel_case,
+    "NotifyEVChargingSchedule": _notify_ev_charging_schedule_request_to_camel_case,
+    "NotifyEvent": _notify_event_request_to_camel_case,
+    "NotifyMonitoringReport": _notify_monitoring_report_request_to_camel_case,
+    "NotifyReport": _notify_report_request_to_camel_case,
+    "PublishFirmware": _publish_firmware_request_to_camel_case,
+    "PublishFirmwareStatusNotification": _publish_firmware_status_notification_request_to_camel_case,  # noqa: E501
+    "ReportChargingProfiles": _report_charging_profiles_request_to_camel_case,
+    "RequestStartTransaction": _request_start_transaction_request_to_camel_case,
+    "RequestStopTransaction": _request_stop_transaction_request_to_camel_case,
+    "ReservationStatusUpdate": _reservation_status_update_request_to_camel_case,
+    "ReserveNow": _reserve_now_request_to_camel_case,
+    "Reset": _reset_request_to_camel_case,
+    "SecurityEventNotification": _security_event_notification_request_to_camel_case,
+    "SendLocalList": _send_local_list_request_to_camel_case,
+    "SetChargingProfile": _set_charging_profile_request_to_camel_case,
+    "SetDisplayMessage": _set_display_message_request_to_camel_case,
+    "SetMonitoringBase": _set_monitoring_base_request_to_camel_case,
+    "SetMonitoringLevel": _set_monitoring_level_request_to_camel_case,
+    "SetNetworkProfile": _set_network_profile_request_to_camel_case,
+    "SetVariableMonitoring": _set_variable_monitoring_request_to_camel_case,
+    "SetVariables": _set_variables_request_to_camel_case,
+    "SignCertificate": _sign_certificate_request_to_camel_case,
+    "StatusNotification": _status_notification_request_to_camel_case,
+    "TransactionEvent": _transaction_event_request_to_camel_case,
+    "TriggerMessage": _trigger_message_request_to_camel_case,
+    "UnlockConnector": _unlock_connector_request_to_camel_case,
+    "UnpublishFirmware": _unpublish_firmware_request_to_camel_case,
+    "UpdateFirmware": _update_firmware_request_to_camel_case,
+}
+
+
+CALL_RESULT_TO_SNAKE_CASE = {
+    "Authorize": _authorize_response_to_snake_case,
+    "BootNotification": _boot_notification_response_to_snake_case,
+    "CancelReservation": _cancel_reservation_response_to_snake_case,
+    "CertificateSigned": _certificate_signed_response_to_snake_case,
+    "ChangeAvailability": _change_availability_response_to_snake_case,
+    "ClearCache": _clear_cache_response_to_snake_case,
+    "ClearChargingProfile": _clear_charging_profile_response_to_snake_case,
+    "ClearDisplayMessage": _clear_display_message_response_to_snake_case,
+    "ClearVariableMonitoring": _clear_variable_monitoring_response_to_snake_case,
+    "ClearedChargingLimit": _cleared_charging_limit_response_to_snake_case,
+    "CostUpdated": _cost_updated_response_to_snake_case,
+    "CustomerInformation": _customer_information_response_to_snake_case,
+    "DataTransfer": _data_transfer_response_to_snake_case,
+    "DeleteCertificate": _delete_certificate_response_to_snake_case,
+    "FirmwareStatusNotification": _firmware_status_notification_response_to_snake_case,
+    "Get15118EVCertificate": _get15118_ev_certificate_response_to_snake_case,
+    "GetBaseReport": _get_base_report_response_to_snake_case,
+    "GetCertificateStatus": _get_certificate_status_response_to_snake_case,
+    "GetChargingProfiles": _get_charging_profiles_response_to_snake_case,
+    "GetCompositeSchedule": _get_composite_schedule_response_to_snake_case,
+    "GetDisplayMessages": _get_display_messages_response_to_snake_case,
+    "GetInstalledCertificateIds": _get_installed_certificate_ids_response_to_snake_case,
+    "GetLocalListVersion": _get_local_list_version_response_to_snake_case,
+    "GetLog": _get_log_response_to_snake_case,
+    "GetMonitoringReport": _get_monitoring_report_response_to_snake_case,
+    "GetReport": _get_report_response_to_snake_case,
+    "GetTransactionStatus": _get_transaction_status_response_to_snake_case,
+    "GetVariables": _get_variables_response_to_snake_case,
+    "Heartbeat": _heartbeat_response_to_snake_case,
+    "InstallCertificate": _install_certificate_response_to_snake_case,
+    "LogStatusNotification": _log_status_notification_response_to_snake_case,
+    "MeterValues": _meter_values_response_to_snake_case,
+    "NotifyChargingLimit": _notify_charging_limit_response_to_snake_case,
+    "NotifyCustomerInformation": _notify_customer_information_response_to_snake_case,
+    "NotifyDisplayMessages": _notify_display_messages_response_to_snake_case,
+    "NotifyEVChargingNeeds": _notify_ev_charging_needs_response_to_snake_case,
+    "NotifyEVChargingSchedule": _notify_ev_charging_schedule_response_to_snake_case,
+    "NotifyEvent": _notify_event_response_to_snake_case,
+    "NotifyMonitoringReport": _notify_monitoring_report_response_to_snake_case,
+    "NotifyReport": _notify_report_response_to_snake_case,
+    "PublishFirmware": _publish_firmware_response_to_snake_case,
+    "PublishFirmwareStatusNotification": _publish_firmware_status_notification_response_to_snake_case,  # noqa: E501
+    "ReportChargingProfiles": _report_charging_profiles_response_to_snake_case,
+    "RequestStartTransaction": _request_start_transaction_response_to_snake_case,
+    "RequestStopTransaction": _request_stop_transaction_response_to_snake_case,
+    "ReservationStatusUpdate": _reservation_status_update_response_to_snake_case,
+    "ReserveNow": _reserve_now_response_to_snake_case,
+    "Reset": _reset_response_to_snake_case,
+    "SecurityEventNotification": _security_event_notification_response_to_snake_case,
+    "SendLocalList": _send_local_list_response_to_snake_case,
+    "SetChargingProfile": _set_charging_profile_response_to_snake_case,
+    "SetDisplayMessage": _set_display_message_response_to_snake_case,
+    "SetMonitoringBase": _set_monitoring_base_response_to_snake_case,
+    "SetMonitoringLevel": _set_monitoring_level_response_to_snake_case,
+    "SetNetworkProfile": _set_network_profile_response_to_snake_case,
+    "SetVariableMonitoring": _set_variable_monitoring_response_to_snake_case,
+    "SetVariables": _set_variables_response_to_snake_case,
+    "SignCertificate": _sign_certificate_response_to_snake_case,
+    "StatusNotification": _status_notification_response_to_snake_case,
+    "TransactionEvent": _transaction_event_response_to_snake_case,
+    "TriggerMessage": _trigger_message_response_to_snake_case,
+    "UnlockConnector": _unlock_connector_response_to_snake_case,
+    "UnpublishFirmware": _unpublish_firmware_response_to_snake_case,
+    "UpdateFirmware": _update_firmware_response_to_snake_case,
+}
+
+
+CALL_RESULT_TO_CAMEL_CASE = {
+    "Authorize": _authorize_response_to_camel_case,
+    "BootNotification": _boot_notification_response_to_camel_case,
+    "CancelReservation": _cancel_reservation_response_to_camel_case,
+    "CertificateSigned": _certificate_signed_response_to_camel_case,
+    "ChangeAvailability": _change_availability_response_to_camel_case,
+    "ClearCache": _clear_cache_response_to_camel_case,
+    "ClearChargingProfile": _clear_charging_profile_response_to_camel_case,
+    "ClearDisplayMessage": _clear_display_message_response_to_camel_case,
+    "ClearVariableMonitoring": _clear_variable_monitoring_response_to_camel_case,
+    "ClearedChargingLimit": _cleared_charging_limit_response_to_camel_case,
+    "CostUpdated": _cost_updated_response_to_camel_case,
+    "CustomerInformation": _customer_information_response_to_camel_case,
+    "DataTransfer": _data_transfer_response_to_camel_case,
+    "DeleteCertificate": _delete_certificate_response_to_camel_case,
+    "FirmwareStatusNotification": _firmware_status_notification_response_to_camel_case,
+    "Get15118EVCertificate": _get15118_ev_certificate_response_to_camel_case,
+    "GetBaseReport": _get_base_report_response_to_camel_case,
+    "GetCertificateStatus": _get_certificate_status_response_to_camel_case,
+    "GetChargingProfiles": _get_charging_profiles_response_to_camel_case,
+    "GetCompositeSchedule": _get_composite_schedule_response_to_camel_case,
+    "GetDisplayMessages": _get_display_messages_response_to_camel_case,
+    "GetInstalledCertificateIds": _get_installed_certificate_ids_response_to_camel_case,
+    "GetLocalListVersion": _get_local_list_version_response_to_camel_case,
+    "GetLog": _get_log_response_to_camel_case,
+    "GetMonitoringReport": _get_monitoring_report_response_to_camel_case,
+    "GetReport": _get_report_response_to_camel_case,
+    "GetTransactionStatus": _get_transaction_status_response_to_camel_case,
+    "GetVariables": _get_variables_response_to_camel_case,
+    "Heartbeat": _heartbeat_response_to_camel_case,
+    "InstallCertificate": _install_certificate_response_to_camel_case,
+    "LogStatusNotification": _log_status_notification_response_to_camel_case,
+    "MeterValues": _meter_values_response_to_camel_case,
+    "NotifyChargingLimit": _notify_charging_limit_response_to_camel_case,
+    "NotifyCustomerInformation": _notify_customer_information_response_to_camel_case,
+    "NotifyDisplayMessages": _notify_display_messages_response_to_camel_case,
+    "NotifyEVChargingNeeds": _notify_ev_charging_needs_response_to_camel_case,
+    "NotifyEVChargingSchedule": _notify_ev_charging_schedule_response_to_camel_case,
+    "NotifyEvent": _notify_event_response_to_camel_case,
+    "NotifyMonitoringReport": _notify_monitoring_report_response_to_camel_case,
+    "NotifyReport": _notify_report_response_to_camel_case,
+    "PublishFirmware": _publish_firmware_response_to_camel_case,
+    "PublishFirmwareStatusNotification": _publish_firmware_status_notification_response_to_camel_case,  # noqa: E501
+    "ReportChargingProfiles": _report_charging_profiles_response_to_camel_case,
+    "RequestStartTransaction": _request_start_transaction_response_to_camel_case,
+    "RequestStopTransaction": _request_stop_transaction_response_to_camel_case,
+    "ReservationStatusUpdate": _reservation_status_update_response_to_camel_case,
+    "ReserveNow": _reserve_now_response_to_camel_case,
+    "Reset": _reset_response_to_camel_case,
+    "SecurityEventNotification": _security_event_notification_response_to_camel_case,
+    "SendLocalList": _send_local_list_response_to_camel_case,
+    "SetChargingProfile": _set_charging_profile_response_to_camel_case,
+    "SetDisplayMessage": _set_display_message_response_to_camel_case,
+    "SetMonitoringBase": _set_monitoring_base_response_to_camel_case,
+    "SetMonitoringLevel": _set_monitoring_level_response_to_camel_case,
+    "SetNetworkProfile": _set_network_profile_response_to_camel_case,
+    "SetVariableMonitoring": _set_variable_monitoring_response_to_camel_case,
+    "SetVariables": _set_variables_response_to_camel_case,
+    "SignCertificate": _sign_certificate_response_to_camel_case,
+    "StatusNotification": _status_notification_response_to_camel_case,
+    "TransactionEvent": _transaction_event_response_to_camel_case,
+    "TriggerMessage": _trigger_message_response_to_camel_case,
+    "UnlockConnector": _unlock_connector_response_to_camel_case,
+    "UnpublishFirmware": _unpublish_firmware_response_to_camel_case,
+    "UpdateFirmware": _update_firmware_response_to_camel_case,
+}
@@ -0,0 +1,385 @@
+"""
+Policies that decide which payloads are validated against the JSON schemas.
+
+Validating a payload is relatively expensive. A `ChargePoint` validates every
+payload by default, but it can be configured with `ValidationPolicies` to
+validate only part of the payloads of certain actions. For example, to fully
+validate all actions except the frequent MeterValues and Heartbeat:
+
+    policies = ValidationPolicies(
+        inbound={
+            "MeterValues": SampleValidate(100),
+            "Heartbeat": ValidateUntilTrusted(10),
+        },
+        outbound=ValidateInDebug(),
+    )
+    charge_point = ChargePoint("CP_1", connection, validation_policies=policies)
+
+A single `ValidationPolicies` can be shared by multiple charge points. The
+counters of the policies then cover the messages of all these charge points.
+
+"""
+
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
+
+from ocpp.messages import MessageType, get_validator, validate_payload
+from ocpp.schema_compiler import compile_schema
+
+LOGGER = logging.getLogger("ocpp")
+
+# Direction of messages received from the other side: Calls sent by the other
+# side and CallResults on Calls sent by us.
+INBOUND = "inbound"
+
+# Direction of messages sent to the other side: Calls sent by us and
+# CallResults on Calls sent by the other side.
+OUTBOUND = "outbound"
+
+
+@dataclass
+class ValidationCounters:
+    """Number of payloads of an action per outcome of the policy."""
+
+    valid: int = 0
+    invalid: int = 0
+    skipped: int = 0
+    # Payloads of which only the fields used by the handler have been checked,
+    # see LazyValidate.
+    partial: int = 0
+
+
+class ValidationPolicy:
+    """
+    Base class for validation policies. Subclasses decide whether a payload
+    is validated by overriding `should_validate()`.
+
+    The counters of the policy are available by action in `self.counters`.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, ValidationCounters] = {}
+
+    def should_validate(self, charge_point_id: str, action: str) -> bool:
+        raise NotImplementedError
+
+    def on_valid(self, charge_point_id: str, action: str) -> None:
+        """Called after a payload has been validated successfully."""
+        pass
+
+    def on_invalid(self, charge_point_id: str, action: str) -> None:
+        """Called after a payload has failed validation."""
+        pass
+
+    def _counters(self, action: str) -> ValidationCounters:
+        try:
+            return self.counters[action]
+        except KeyError:
+            counters = self.counters[action] = ValidationCounters()
+            return counters
+
+    def validate(
+        self,
+        charge_point_id: str,
+        message,
+        ocpp_version: str,
+        handler: Optional[Callable] = None,
+    ) -> None:
+        """
+        Validate the payload of the message if the policy wants so. The
+        exceptions of `ocpp.messages.validate_payload()` are raised when the
+        payload is invalid.
+
+        `handler` is the function that will handle a received Call, if any.
+        """
+        counters = self._counters(message.action)
+
+        if not self.should_validate(charge_point_id, message.action):
+            counters.skipped += 1
+            return
+
+        try:
+            validate_payload(message, ocpp_version)
+        except Exception:
+            counters.invalid += 1
+            self.on_invalid(charge_point_id, message.action)
+            raise
+
+        counters.valid += 1
+        self.on_valid(charge_point_id, message.action)
+
+
+class AlwaysValidate(ValidationPolicy):
+    """Validate every payload. This is the default policy."""
+
+    def should_validate(self, charge_point_id: str, action: str) -> bool:
+        return True
+
+
+class NeverValidate(ValidationPolicy):
+    """Validate no payload at all."""
+
+    def should_validate(self, charge_point_id: str, action: str) -> bool:
+        return False
+
+
+class SampleValidate(ValidationPolicy):
+    """Validate 1 in every `n` payloads of an action, starting with the
+    first."""
+
+    def __init__(self, n: int):
+        super().__init__()
+        if n < 1:
+            raise ValueError("n must be at least 1.")
+        self.n = n
+
+    def should_validate(self, charge_point_id: str, action: str) -> bool:
+        counters = self.counters[action]
+        seen = counters.valid + counters.invalid + counters.skipped
+        return seen % self.n == 0
+
+
+class ValidateUntilTrusted(ValidationPolicy):
+    """
+    Validate the payloads of an action until a charge point has sent `k`
+    valid payloads of that action. From then on the charge point is trusted
+    and only 1 in every `revalidate_every` of its payloads of that action is
+    validated, so a charge point that starts sending invalid payloads, e.g.
+    after a firmware update, is still caught.
+
+    A payload of the charge point that fails validation ends the trust in
+    the charge point for all actions: its payloads are validated again until
+    it has earned trust anew.
+    """
+
+    def __init__(self, k: int, revalidate_every: int = 100):
+        super().__init__()
+        if revalidate_every < 1:
+            raise ValueError("revalidate_every must be at least 1.")
+        self.k = k
+        self.revalidate_every = revalidate_every
+        # Trust by charge point: per action the number of valid payloads and
+        # the number of payloads since the action has been trusted. Keyed by
+        # charge point first, so reset() is a single lookup.
+        self._trust: Dict[str, Dict[str, List[int]]] = {}
+
+    def _counts(self, charge_point_id: str, action: str) -> List[int]:
+        try:
+            actions = self._trust[charge_point_id]
+        except KeyError:
+            actions = self._trust[charge_point_id] = {}
+        try:
+            return actions[action]
+        except KeyError:
+            counts = actions[action] = [0, 0]
+            return counts
+
+    def should_validate(self, charge_point_id: str, action: str) -> bool:
+        counts = self._counts(charge_point_id, action)
+        if counts[0] < self.k:
+            return True
+
+        counts[1] += 1
+        return counts[1] % self.revalidate_every == 0
+
+    def on_valid(self, charge_point_id: str, action: str) -> None:
+        self._counts(charge_point_id, action)[0] += 1
+
+    def on_invalid(self, charge_point_id: str, action: str) -> None:
+        self.reset(charge_point_id)
+
+    def reset(self, charge_point_id: str) -> None:
+        """Stop trusting the charge point, e.g. after it reconnected."""
+        self._trust.pop(charge_point_id, None)
+
+
+class ValidateInDebug(ValidationPolicy):
+    """
+    Validate payloads only in debug mode. It's meant for outbound payloads,
+    which are created by our own code: mistakes are caught during
+    development while production skips the validation.
+
+    By default debug mode follows `__debug__`, which is False if Python runs
+    with the -O option.
+    """
+
+    def __init__(self, debug: bool = __debug__):
+        super().__init__()
+        self.debug = debug
+
+    def should_validate(self, charge_point_id: str, action: str) -> bool:
+        return self.debug
+
+
+class LazyValidate(ValidationPolicy):
+    """
+    Check only the fields of a received Call that its handler takes as named
+    parameters: required fields must be present and fields must be of the
+    type of the schema. Nested objects aren't inspected and fields that are
+    only passed via `**kwargs` aren't checked at all. If the check fails,
+    the payload is validated completely, so the same OCPP errors are raised as
+    by `ocpp.messages.validate_payload()`.
+
+    The complete validation of payloads that pass the check is:
+
+    * sampled inline, if a policy is passed as `full`, e.g.
+      `LazyValidate(full=SampleValidate(100))`. Failures result in a
+      CallError like with any other policy.
+    * deferred, if `batch_size` is given. Payloads are then validated in
+      batches by the event loop after `batch_size` payloads have been
+      collected, or when `validate_deferred()` is called. The response has
+      been sent by then, so failures are only logged and counted.
+    * skipped, if neither is given.
+
+    Messages without handler, like CallResults, are always validated
+    completely.
+    """
+
+    def __init__(
+        self, full: Optional[ValidationPolicy] = None, batch_size: Optional[int] = None
+    ):
+        super().__init__()
+        if full is not None and batch_size is not None:
+            raise ValueError("Pass either full or batch_size, not both.")
+
+        self.full = full
+        self.batch_size = batch_size
+        self._deferred: List[tuple] = []
+        # Checks of the fields that handlers take by action, version and
+        # handler.
+        self._checks: Dict[tuple, Callable] = {}
+
+    def should_validate(self, charge_point_id: str, action: str) -> bool:
+        return True
+
+    def _check(self, message, ocpp_version: str, handler: Callable) -> Callable:
+        key = (message.action, ocpp_version, handler)
+        try:
+            return self._checks[key]
+        except KeyError:
+            pass
+
+        # Avoid a circular import.
+        from ocpp.charge_point import _camel_to_snake_key
+
+        schema = get_validator(
+            message.message_type_id, message.action, ocpp_version
+        ).schema
+        properties = {
+            _camel_to_snake_key(name): name for name in schema.get("properties", {})
+        }
+        parameters = [
+            properties[name]
+            for name, parameter in inspect.signature(handler).parameters.items()
+            if name in properties
+            and parameter.kind not in [parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD]
+        ]
+
+        subschema = {"type": "object", "properties": {}, "required": []}
+        for name in parameters:
+            definition = schema["properties"][name]
+            if "$ref" in definition:
+                definition = schema["definitions"][definition["$ref"].split("/")[-1]]
+            if "type" in definition:
+                subschema["properties"][name] = {"type": definition["type"]}
+            if name in schema.get("required", []):
+                subschema["required"].append(name)
+
+        check = self._checks[key] = compile_schema(subschema)
+        return check
+
+    def validate(
+        self,
+        charge_point_id: str,
+        message,
+        ocpp_version: str,
+        handler: Optional[Callable] = None,
+    ) -> None:
+        if handler is None or message.message_type_id != MessageType.Call:
+            return super().validate(charge_point_id, message, ocpp_version)
+
+        if not self._check(message, ocpp_version, handler)(message.payload):
+            # Validate the complete payload to raise the appropriate error.
+            return super().validate(charge_point_id, message, ocpp_version)
+
+        self._counters(message.action).partial += 1
+
+        if self.full is not None:
+            self.full.validate(charge_point_id, message, ocpp_version)
+        elif self.batch_size is not None:
+            self._deferred.append((charge_point_id, message, ocpp_version))
+            if len(self._deferred) == self.batch_size:
+                try:
+                    asyncio.get_running_loop().call_soon(self.validate_deferred)
+                except RuntimeError:
+                    self.validate_deferred()
+
+    def validate_deferred(self) -> None:
+        """Validate all payloads of which validation has been deferred."""
+        deferred, self._deferred = self._deferred, []
+        for charge_point_id, message, ocpp_version in deferred:
+            try:
+                super().validate(charge_point_id, message, ocpp_version)
+            except Exception as e:
+                LOGGER.warning(
+                    "%s: deferred validation of %s failed: %s",
+                    charge_point_id,
+                    message,
+                    e,
+                )
+
+
+class ValidationPolicies:
+    """
+    The validation policies of a charge point per direction and action.
+
+    `inbound` and `outbound` are either a policy used for all actions in
+    that direction, or a `dict` with a policy per action. Actions without a
+    policy of their own use `default`, which validates every payload if it
+    isn't given.
+    """
+
+    def __init__(
+        self,
+        inbound: Union[ValidationPolicy, Dict[str, ValidationPolicy], None] = None,
+        outbound: Union[ValidationPolicy, Dict[str, ValidationPolicy], None] = None,
+        default: Optional[ValidationPolicy] = None,
+    ):
+        self.default = default if default is not None else AlwaysValidate()
+        self._policies: Dict[str, Dict[str, ValidationPolicy]] = {}
+        self._defaults: Dict[str, ValidationPolicy] = {}
+
+        for direction, policies in [(INBOUND, inbound), (OUTBOUND, outbound)]:
+            if isinstance(policies, ValidationPolicy):
+                self._defaults[direction] = policies
+                policies = None
+            else:
+                self._defaults[direction] = self.default
+            self._policies[direction] = dict(policies or {})
+
+    def get(self, action: str, direction: str) -> ValidationPolicy:
+        """Return the policy for the action in the direction."""
+        try:
+            return self._policies[direction][action]
+        except KeyError:
+            return self._defaults[direction]
+
+    def set(self, action: str, direction: str, policy: ValidationPolicy) -> None:
+        """Set the policy for the action in the direction."""
+        self._policies[direction][action] = policy
+
+    def validate(
+        self,
+        charge_point_id: str,
+        message,
+        ocpp_version: str,
+        direction: str,
+        handler: Optional[Callable] = None,
+    ) -> None:
+        """Validate the message according to the policy of its action."""
+        self.get(message.action, direction).validate(
+            charge_point_id, message, ocpp_version, handler
+        )
@@ -0,0 +1,160 @@
+"""
+Write the frames of a connection from a dedicated task.
+
+Awaiting `connection.send()` for every message couples the coroutine that
+creates a message to the speed of the connection: a slow charge point stalls
+the handler that is serving it. A `FrameWriter` decouples the two with a
+bounded queue. Frames are put on the queue and a single task per connection
+sends them. All frames that are queued when the task wakes up are sent in one
+drain cycle.
+
+When the queue is full, `FrameWriter.send()` waits until there is room
+again. That is the backpressure of the connection. Use `congested` to find
+out whether the queue is filling up, e.g. to skip optional messages.
+
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+LOGGER = logging.getLogger("ocpp")
+
+
+class FrameWriter:
+    """
+    Queue frames for a connection and send them from a writer task.
+
+    The writer task is started when the first frame is sent, which must
+    happen while an event loop is running. If sending a frame fails, the
+    writer task stops and the exception is raised by the following calls to
+    `send()`.
+
+    Args:
+
+        connection: Connection with an async `send()` method.
+        max_queue_size (int): Maximum number of frames waiting to be sent.
+        high_water_mark (int): Number of queued frames from which the
+            connection is `congested`. By default 3/4 of `max_queue_size`.
+
+    """
+
+    def __init__(
+        self,
+        connection,
+        max_queue_size: int = 100,
+        high_water_mark: Optional[int] = None,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1.")
+
+        self._connection = connection
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue_size)
+        self.high_water_mark = (
+            high_water_mark
+            if high_water_mark is not None
+            else max(1, max_queue_size * 3 // 4)
+        )
+
+        self._task: Optional[asyncio.Task] = None
+        self._exception: Optional[BaseException] = None
+
+        # Number of frames sent and of drain cycles used to send them.
+        self.frames = 0
+        self.drains = 0
+
+    @property
+    def queue_size(self) -> int:
+        """Number of frames waiting to be sent."""
+        return self._queue.qsize()
+
+    @property
+    def congested(self) -> bool:
+        """Whether the number of queued frames reached the high water mark."""
+        return self._queue.qsize() >= self.high_water_mark
+
+    def _start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def send(self, frame) -> None:
+        """Queue the frame, wait for room in the queue if it's full."""
+        if self._exception is not None:
+            raise self._exception
+
+        self._start()
+        await self._queue.put(frame)
+
+        # The writer task might have stopped while waiting for room.
+        if self._exception is not None:
+            self._discard()
+            raise self._exception
+
+    def send_nowait(self, frame) -> None:
+        """Queue the frame or raise `asyncio.QueueFull` if the queue is
+        full."""
+        if self._exception is not None:
+            raise self._exception
+
+        self._start()
+        self._queue.put_nowait(frame)
+
+    async def flush(self) -> None:
+        """Wait until all queued frames have been sent."""
+        if self._exception is not None:
+            raise self._exception
+        await self._queue.join()
+
+    async def close(self, flush: bool = True) -> None:
+        """Stop the writer task. If `flush` is True, the queued frames are
+        sent first, otherwise they are discarded."""
+        if self._task is None:
+            return
+
+        if flush and self._exception is None:
+            await self._queue.join()
+        elif self._queue.qsize():
+            LOGGER.warning(
+                "Discarding %d frames that haven't been sent", self._queue.qsize()
+            )
+        self._discard()
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _discard(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            self._queue.task_done()
+
+    async def _run(self) -> None:
+        while True:
+            frames = [await self._queue.get()]
+            while True:
+                try:
+                    frames.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                for frame in frames:
+                    await self._connection.send(frame)
+            except Exception as e:
+                LOGGER.error("Failed to send frame, stopping writer: %s", e)
+                self._exception = e
+                return
+            finally:
+                for _ in frames:
+                    self._queue.task_done()
+                if self._exception is not None:
+                    self._discard()
+
+            self.frames += len(frames)
+            self.drains += 1
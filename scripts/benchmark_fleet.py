@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Measure the dispatch throughput of a central system serving a fleet of
+simulated charge points in a single process.
+
+Every station is connected to its own CSMS-side charge point through a
+loopback connection of `ocpp.loopback`, so no sockets are involved. All
+stations send a BootNotification followed by a number of MeterValues and the
+time until all responses have arrived is measured.
+
+Usage:
+
+    $ PYTHONPATH=. python scripts/benchmark_fleet.py --stations 10000
+
+The results are written to stdout as JSON.
+
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+
+from benchmark_pipeline import CentralSystem, git_commit, payload_dataclass
+
+from ocpp.loopback import connect_charge_points
+from ocpp.messages import preload_validators
+from ocpp.v201 import ChargePoint
+
+
+async def run_station(station, messages):
+    await station.call(payload_dataclass("BootNotification"))
+    for _ in range(messages):
+        await station.call(payload_dataclass("MeterValues"))
+
+
+async def run(stations, messages):
+    charge_points = [
+        connect_charge_points(CentralSystem, ChargePoint, f"CP_{i}")
+        for i in range(stations)
+    ]
+    tasks = [asyncio.ensure_future(cp.start()) for pair in charge_points for cp in pair]
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(run_station(station, messages) for _, station in charge_points)
+    )
+    duration = time.perf_counter() - start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    calls = stations * (messages + 1)
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "stations": stations,
+        "calls": calls,
+        "seconds": round(duration, 3),
+        "calls_per_second": round(calls / duration, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-s", "--stations", type=int, default=1000)
+    parser.add_argument(
+        "-m", "--messages", type=int, default=10, help="MeterValues per station"
+    )
+    args = parser.parse_args()
+
+    # Measure the dispatch, not loading the schemas.
+    preload_validators("2.0.1")
+    results = asyncio.run(run(args.stations, args.messages))
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
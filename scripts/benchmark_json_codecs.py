@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Compare the JSON codecs of `ocpp.messages` on realistic OCPP 2.0.1 messages.
+
+For every codec that can be loaded, this measures decoding a frame with
+`unpack()` and encoding a message with `to_json()`, both for frames of type
+`str` and of type `bytes`. It also verifies that all codecs decode each
+other's output to the same message.
+
+Usage:
+
+    $ PYTHONPATH=. python scripts/benchmark_json_codecs.py [number]
+
+`number` is the number of repetitions per measurement, 10000 by default.
+
+"""
+
+import sys
+import timeit
+
+import benchmark_payloads
+
+from ocpp.messages import JSONCodec, OrjsonCodec, unpack
+
+
+def load_codecs():
+    codecs = {"json": JSONCodec()}
+    try:
+        codecs["orjson"] = OrjsonCodec()
+    except ImportError:
+        print("orjson is not installed, skipping it.")
+    return codecs
+
+
+def messages():
+    for action in benchmark_payloads.CALLS:
+        yield f"{action}Request", benchmark_payloads.call(action)
+        yield f"{action}Response", benchmark_payloads.call_result(action)
+
+
+def benchmark(codecs, number):
+    print(
+        f"{'message':<28}{'codec':<8}{'unpack (µs)':>14}{'to_json (µs)':>14}"
+        f"{'unpack bytes':>14}{'to_bytes':>14}"
+    )
+    for name, message in messages():
+        reference = JSONCodec().loads(message.to_json(JSONCodec()))
+        for codec_name, codec in codecs.items():
+            frame = message.to_json(codec)
+            assert JSONCodec().loads(frame) == reference
+
+            unpack_time = timeit.timeit(lambda: unpack(frame, codec), number=number)
+            to_json_time = timeit.timeit(lambda: message.to_json(codec), number=number)
+
+            frame = message.to_bytes(codec)
+            assert JSONCodec().loads(frame) == reference
+
+            unpack_bytes_time = timeit.timeit(
+                lambda: unpack(frame, codec), number=number
+            )
+            to_bytes_time = timeit.timeit(
+                lambda: message.to_bytes(codec), number=number
+            )
+            print(
+                f"{name:<28}{codec_name:<8}"
+                f"{unpack_time / number * 1e6:>14.2f}"
+                f"{to_json_time / number * 1e6:>14.2f}"
+                f"{unpack_bytes_time / number * 1e6:>14.2f}"
+                f"{to_bytes_time / number * 1e6:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    benchmark(load_codecs(), number)
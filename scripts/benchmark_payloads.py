@@ -0,0 +1,144 @@
+"""
+Realistic OCPP 2.0.1 payloads used by the benchmark scripts.
+
+All payloads are camelCase, as they are send over the wire, and valid
+according to the JSON schemas in ocpp/v201/schemas. Run this module to verify
+that:
+
+    $ PYTHONPATH=. python scripts/benchmark_payloads.py
+
+"""
+
+import copy
+
+from ocpp.messages import Call, CallResult, validate_payload
+
+TIMESTAMP = "2024-03-01T12:00:00.000Z"
+
+BOOT_NOTIFICATION = {
+    "reason": "PowerUp",
+    "chargingStation": {
+        "serialNumber": "SN-000123456",
+        "model": "ICU Eve Mini",
+        "vendorName": "ICU",
+        "firmwareVersion": "#1:3.4.0-2990#N:217H;1.0-223",
+        "modem": {"iccid": "89310410106543789301", "imsi": "310410123456789"},
+    },
+}
+
+
+def _sampled_value(value, measurand, unit, phase=None):
+    sampled_value = {
+        "value": value,
+        "context": "Sample.Periodic",
+        "measurand": measurand,
+        "location": "Outlet",
+        "unitOfMeasure": {"unit": unit},
+    }
+    if phase is not None:
+        sampled_value["phase"] = phase
+    return sampled_value
+
+
+_SAMPLED_VALUES = [
+    _sampled_value(15234.5, "Energy.Active.Import.Register", "Wh"),
+    _sampled_value(11040.0, "Power.Active.Import", "W"),
+    _sampled_value(16.0, "Current.Import", "A", "L1"),
+    _sampled_value(16.1, "Current.Import", "A", "L2"),
+    _sampled_value(15.9, "Current.Import", "A", "L3"),
+    _sampled_value(230.2, "Voltage", "V", "L1-N"),
+    _sampled_value(229.8, "Voltage", "V", "L2-N"),
+    _sampled_value(231.0, "Voltage", "V", "L3-N"),
+]
+
+METER_VALUES = {
+    "evseId": 1,
+    "meterValue": [{"timestamp": TIMESTAMP, "sampledValue": _SAMPLED_VALUES}],
+}
+
+TRANSACTION_EVENT = {
+    "eventType": "Updated",
+    "timestamp": TIMESTAMP,
+    "triggerReason": "MeterValuePeriodic",
+    "seqNo": 42,
+    "offline": False,
+    "transactionInfo": {
+        "transactionId": "f0c1d2e3-a4b5-4c6d-8e9f-0a1b2c3d4e5f",
+        "chargingState": "Charging",
+        "timeSpentCharging": 3600,
+    },
+    "idToken": {"idToken": "04E8A1B2C3D4E5", "type": "ISO14443"},
+    "evse": {"id": 1, "connectorId": 1},
+    "meterValue": [{"timestamp": TIMESTAMP, "sampledValue": _SAMPLED_VALUES}],
+}
+
+
+def _report_data(component, variable, value, data_type="decimal"):
+    return {
+        "component": {"name": component, "evse": {"id": 1}},
+        "variable": {"name": variable},
+        "variableAttribute": [
+            {
+                "type": "Actual",
+                "value": value,
+                "mutability": "ReadWrite",
+                "persistent": True,
+                "constant": False,
+            }
+        ],
+        "variableCharacteristics": {
+            "dataType": data_type,
+            "supportsMonitoring": True,
+        },
+    }
+
+
+NOTIFY_REPORT = {
+    "requestId": 1,
+    "generatedAt": TIMESTAMP,
+    "seqNo": 0,
+    "tbc": False,
+    "reportData": [
+        _report_data(f"Component{i}", f"Variable{i}", str(i * 10)) for i in range(25)
+    ],
+}
+
+# Payloads of Calls by action.
+CALLS = {
+    "BootNotification": BOOT_NOTIFICATION,
+    "MeterValues": METER_VALUES,
+    "TransactionEvent": TRANSACTION_EVENT,
+    "NotifyReport": NOTIFY_REPORT,
+}
+
+# Payloads of the corresponding CallResults by action.
+CALL_RESULTS = {
+    "BootNotification": {
+        "currentTime": TIMESTAMP,
+        "interval": 300,
+        "status": "Accepted",
+    },
+    "MeterValues": {},
+    "TransactionEvent": {
+        "totalCost": 12.5,
+        "idTokenInfo": {"status": "Accepted"},
+    },
+    "NotifyReport": {},
+}
+
+
+def call(action, unique_id="19223201"):
+    """Return a Call with a copy of the payload for `action`."""
+    return Call(unique_id, action, copy.deepcopy(CALLS[action]))
+
+
+def call_result(action, unique_id="19223201"):
+    """Return a CallResult with a copy of the payload for `action`."""
+    return CallResult(unique_id, copy.deepcopy(CALL_RESULTS[action]), action)
+
+
+if __name__ == "__main__":
+    for action in CALLS:
+        validate_payload(call(action), "2.0.1")
+        validate_payload(call_result(action), "2.0.1")
+        print(f"{action}: valid")
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+"""
+Measure every stage of the message pipeline on realistic OCPP 2.0.1 messages.
+
+The stages are benchmarked one by one for the BootNotification, MeterValues,
+TransactionEvent and NotifyReport payloads of `benchmark_payloads`:
+
+* `unpack`: decode a Call.
+* `validate_payload`: validate the payload of the Call.
+* `camel_to_snake_case`: convert the payload of the Call to snake_case.
+* `serialize_as_dict`: serialize the payload dataclass of the Call.
+* `remove_nones`: remove the None values of the serialized dataclass.
+* `snake_to_camel_case`: convert the result of `remove_nones` to camelCase.
+* `to_json`: encode the Call.
+
+Next to that, two benchmarks cover the pipeline end-to-end over a loopback
+connection of `ocpp.loopback`: `_handle_call` handles the Call with a handler
+of a central system, `call` sends the Call from a charge point to the central
+system and waits for the response.
+
+The results are written as JSON, so the results of two commits can be
+compared:
+
+    $ PYTHONPATH=. python scripts/benchmark_pipeline.py -o before.json
+    $ git checkout other-branch
+    $ PYTHONPATH=. python scripts/benchmark_pipeline.py -o after.json \\
+        --compare before.json
+
+`--compare` prints the ratio of the times of both runs and exits with status
+1 if a benchmark became slower than `--threshold`, 1.1 by default.
+
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+import benchmark_payloads
+
+from ocpp.charge_point import (
+    camel_to_snake_case,
+    remove_nones,
+    serialize_as_dict,
+    snake_to_camel_case,
+)
+from ocpp.loopback import connect_charge_points, loopback_pair
+from ocpp.messages import unpack, validate_payload
+from ocpp.routing import on
+from ocpp.v201 import ChargePoint, call, call_result
+
+STAGES = (
+    "unpack",
+    "validate_payload",
+    "camel_to_snake_case",
+    "serialize_as_dict",
+    "remove_nones",
+    "snake_to_camel_case",
+    "to_json",
+)
+
+
+class CentralSystem(ChargePoint):
+    """Responds to the Calls of the benchmark with the prepared payloads."""
+
+    @on("BootNotification")
+    def on_boot_notification(self, **kwargs):
+        return call_result.BootNotification(
+            **camel_to_snake_case(benchmark_payloads.CALL_RESULTS["BootNotification"])
+        )
+
+    @on("MeterValues")
+    def on_meter_values(self, **kwargs):
+        return call_result.MeterValues()
+
+    @on("TransactionEvent")
+    def on_transaction_event(self, **kwargs):
+        return call_result.TransactionEvent(
+            **camel_to_snake_case(benchmark_payloads.CALL_RESULTS["TransactionEvent"])
+        )
+
+    @on("NotifyReport")
+    def on_notify_report(self, **kwargs):
+        return call_result.NotifyReport()
+
+
+def payload_dataclass(action):
+    """Return the payload of the Call for `action` as dataclass."""
+    payload = camel_to_snake_case(benchmark_payloads.CALLS[action])
+    return getattr(call, action)(**payload)
+
+
+def measure(func, number, repeat):
+    """Return the minimum and median time in µs of a single call of `func`."""
+    times = [
+        t / number * 1e6 for t in timeit.repeat(func, number=number, repeat=repeat)
+    ]
+    return min(times), statistics.median(times)
+
+
+def measure_async(loop, coroutine_function, number, repeat):
+    """Like `measure()`, but for a function that returns an awaitable."""
+
+    async def run():
+        start = time.perf_counter()
+        for _ in range(number):
+            await coroutine_function()
+        return time.perf_counter() - start
+
+    times = [loop.run_until_complete(run()) / number * 1e6 for _ in range(repeat)]
+    return min(times), statistics.median(times)
+
+
+def benchmark_stages(action, number, repeat):
+    message = benchmark_payloads.call(action)
+    frame = message.to_json()
+    dataclass = payload_dataclass(action)
+    serialized = serialize_as_dict(dataclass)
+    without_nones = remove_nones(serialized)
+
+    # The schemas are loaded once, not by the measurement.
+    validate_payload(message, "2.0.1")
+
+    stages = {
+        "unpack": lambda: unpack(frame),
+        "validate_payload": lambda: validate_payload(message, "2.0.1"),
+        "camel_to_snake_case": lambda: camel_to_snake_case(message.payload),
+        "serialize_as_dict": lambda: serialize_as_dict(dataclass),
+        "remove_nones": lambda: remove_nones(serialized),
+        "snake_to_camel_case": lambda: snake_to_camel_case(without_nones),
+        "to_json": lambda: message.to_json(),
+    }
+    for stage in STAGES:
+        yield stage, measure(stages[stage], number, repeat)
+
+
+def benchmark_end_to_end(loop, action, number, repeat):
+    # Nobody receives the responses, they stay in the queue of the loopback
+    # connection.
+    central_system = CentralSystem("CSMS", loopback_pair()[0])
+    message = benchmark_payloads.call(action)
+    yield "_handle_call", measure_async(
+        loop, lambda: central_system._handle_call(message), number, repeat
+    )
+
+    central_system, charge_point = connect_charge_points(
+        CentralSystem, ChargePoint, "CP_1"
+    )
+    tasks = [loop.create_task(cp.start()) for cp in (central_system, charge_point)]
+    payload = payload_dataclass(action)
+    try:
+        yield "call", measure_async(
+            loop, lambda: charge_point.call(payload, unique_id="1"), number, repeat
+        )
+    finally:
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def run(number, repeat):
+    loop = asyncio.new_event_loop()
+    results = []
+    try:
+        for action in benchmark_payloads.CALLS:
+            for name, (best, median) in [
+                *benchmark_stages(action, number, repeat),
+                *benchmark_end_to_end(loop, action, number, repeat),
+            ]:
+                results.append(
+                    {
+                        "benchmark": name,
+                        "action": action,
+                        "min_us": round(best, 3),
+                        "median_us": round(median, 3),
+                    }
+                )
+    finally:
+        loop.close()
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "number": number,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold):
+    """Print the ratio of the median times of both runs and return the
+    number of benchmarks that became slower than `threshold`."""
+    before = {
+        (result["benchmark"], result["action"]): result["median_us"]
+        for result in baseline["results"]
+    }
+    regressions = 0
+
+    print(
+        f"{'benchmark':<22}{'action':<20}{'before (µs)':>14}{'after (µs)':>14}"
+        f"{'ratio':>8}",
+        file=sys.stderr,
+    )
+    for result in current["results"]:
+        key = (result["benchmark"], result["action"])
+        if key not in before:
+            continue
+
+        ratio = result["median_us"] / before[key]
+        flag = ""
+        if ratio > threshold:
+            regressions += 1
+            flag = "  slower"
+        print(
+            f"{key[0]:<22}{key[1]:<20}{before[key]:>14.2f}"
+            f"{result['median_us']:>14.2f}{ratio:>8.2f}{flag}",
+            file=sys.stderr,
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-n", "--number", type=int, default=1000, help="calls per measurement"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="measurements per benchmark"
+    )
+    parser.add_argument(
+        "-o", "--output", help="write the results to this file instead of stdout"
+    )
+    parser.add_argument("--compare", help="results of an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.1)
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(baseline, results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+"""
+Generate payload converters from the OCPP JSON schemas.
+
+For every schema two converters are created: one that translates a camelCase
+payload into a snake_case `dict`, and one that translates a snake_case `dict`
+or dataclass into a camelCase `dict` without None values. The structure of the
+payload is known from the schema, so the converters only descend into fields
+that hold objects or arrays of objects. Fields that aren't described by the
+schema are handed to the generic converters of `ocpp.charge_point`.
+
+Usage:
+
+    $ PYTHONPATH=. python scripts/schema_to_converters.py ocpp/v201/schemas
+
+This writes `converters.py` to the current working directory. Format it with
+`black` before copying it to `ocpp/v201/converters.py`.
+
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from ocpp.charge_point import _camel_to_snake_key
+
+HEADER = '''"""
+Payload converters for the OCPP messages.
+
+This module has been generated from the JSON schemas by
+scripts/schema_to_converters.py. Don't edit it by hand.
+"""
+from ocpp.charge_point import (
+    _camel_to_snake_key,
+    _snake_to_camel_key,
+    camel_to_snake_case,
+    serialize_as_camel_case,
+)
+'''
+
+TO_SNAKE_CASE = """
+
+def {name}_to_snake_case(data):
+    if not isinstance(data, dict):
+        return camel_to_snake_case(data)
+
+    result = {{}}
+    for key, value in data.items():
+        try:
+            key, convert = {table}_TO_SNAKE_CASE[key]
+        except KeyError:
+            result[_camel_to_snake_key(key)] = camel_to_snake_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+"""
+
+TO_CAMEL_CASE = """
+
+def {name}_to_camel_case(data):
+    if hasattr(data, "__dataclass_fields__"):
+        data = vars(data)
+    elif not isinstance(data, dict):
+        return serialize_as_camel_case(data)
+
+    result = {{}}
+    for key, value in data.items():
+        if value is None:
+            continue
+        try:
+            key, convert = {table}_TO_CAMEL_CASE[key]
+        except KeyError:
+            result[_snake_to_camel_key(key)] = serialize_as_camel_case(value)
+            continue
+        result[key] = value if convert is None else convert(value)
+    return result
+"""
+
+LIST_TO_SNAKE_CASE = """
+
+def {name}_list_to_snake_case(data):
+    if not isinstance(data, list):
+        return camel_to_snake_case(data)
+    return [{name}_to_snake_case(value) for value in data]
+"""
+
+LIST_TO_CAMEL_CASE = """
+
+def {name}_list_to_camel_case(data):
+    if not isinstance(data, list):
+        return serialize_as_camel_case(data)
+    return [{name}_to_camel_case(value) for value in data if value is not None]
+"""
+
+
+class Converter:
+    """The converters of a single object in a schema."""
+
+    def __init__(self, name):
+        # Name of the generated functions, e.g. '_boot_notification_request'.
+        self.name = "_" + _camel_to_snake_key(name)
+        self.table = self.name.upper()
+        self.fields = []
+        self.has_list = False
+
+    def add_field(self, property, kind, target=None):
+        """
+        Add a property of the object. `kind` is either 'scalar', 'object',
+        'list', 'scalar_list' or 'generic'. For objects and lists of objects,
+        `target` is the Converter of the object. Properties of kind 'generic'
+        have no known structure, like the `data` of a DataTransfer.
+        """
+        snake_case = _camel_to_snake_key(property)
+        if any(field[1] == snake_case for field in self.fields):
+            raise ValueError(f"{self.name} has multiple fields named {snake_case}")
+
+        self.fields.append((property, snake_case, kind, target))
+
+    def _converter_names(self, kind, target, direction):
+        if kind == "object":
+            return f"{target.name}_to_{direction}"
+        if kind == "list":
+            return f"{target.name}_list_to_{direction}"
+        if kind == "generic" and direction == "snake_case":
+            return "camel_to_snake_case"
+        if kind in ["scalar_list", "generic"] and direction == "camel_case":
+            return "serialize_as_camel_case"
+        return "None"
+
+    def functions(self):
+        output = TO_SNAKE_CASE.format(name=self.name, table=self.table)
+        output += TO_CAMEL_CASE.format(name=self.name, table=self.table)
+        if self.has_list:
+            output += LIST_TO_SNAKE_CASE.format(name=self.name)
+            output += LIST_TO_CAMEL_CASE.format(name=self.name)
+        return output
+
+    def tables(self):
+        to_snake_case = f"\n\n{self.table}_TO_SNAKE_CASE = {{\n"
+        to_camel_case = f"\n\n{self.table}_TO_CAMEL_CASE = {{\n"
+        for property, snake_case, kind, target in self.fields:
+            convert = self._converter_names(kind, target, "snake_case")
+            to_snake_case += f'    "{property}": ("{snake_case}", {convert}),\n'
+            convert = self._converter_names(kind, target, "camel_case")
+            to_camel_case += f'    "{snake_case}": ("{property}", {convert}),\n'
+
+        return to_snake_case + "}\n" + to_camel_case + "}\n"
+
+
+SCALAR_TYPES = ["string", "integer", "number", "boolean"]
+
+# All converters by name. Definitions with the same name are shared by
+# multiple schemas, e.g. 'CustomDataType' and 'StatusInfoType'.
+converters = {}
+
+calls = {}
+call_results = {}
+
+
+def resolve(schema, definition):
+    """Follow `$ref` of the definition and return the referenced definition
+    together with its name."""
+    try:
+        name = definition["$ref"].split("/")[-1]
+    except KeyError:
+        return None, definition
+
+    return name, schema["definitions"][name]
+
+
+def create_converter(schema, name, definition):
+    if name in converters:
+        return converters[name]
+
+    converter = Converter(name)
+    converters[name] = converter
+
+    for property, property_definition in definition.get("properties", {}).items():
+        ref, property_definition = resolve(schema, property_definition)
+        type = property_definition.get("type")
+
+        if type == "object" and "properties" in property_definition:
+            target = create_converter(schema, ref or property, property_definition)
+            converter.add_field(property, "object", target)
+        elif type == "array":
+            item_ref, item_definition = resolve(schema, property_definition["items"])
+            if item_definition.get("type") == "object":
+                target = create_converter(schema, item_ref, item_definition)
+                target.has_list = True
+                converter.add_field(property, "list", target)
+            elif item_definition.get("type") in SCALAR_TYPES:
+                converter.add_field(property, "scalar_list")
+            else:
+                converter.add_field(property, "generic")
+        elif type in SCALAR_TYPES:
+            converter.add_field(property, "scalar")
+        else:
+            converter.add_field(property, "generic")
+
+    return converter
+
+
+def parse_schema(path):
+    # The JSON schemas for OCPP 2.0 start with a byte order mark (BOM).
+    with open(path, "r", encoding="utf-8-sig") as f:
+        schema = json.loads(f.read())
+
+    name = Path(path).stem
+    converter = create_converter(schema, name, schema)
+
+    if name.endswith("Request"):
+        calls[name[: -len("Request")]] = converter
+    elif name.endswith("Response"):
+        call_results[name[: -len("Response")]] = converter
+
+
+def action_table(name, actions, direction):
+    output = f"\n\n{name} = {{\n"
+    for action, converter in sorted(actions.items()):
+        line = f'    "{action}": {converter.name}_to_{direction},'
+        if len(line) > 88:
+            line += "  # noqa: E501"
+        output += line + "\n"
+    return output + "}\n"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Pass path to folder with schemas")
+        sys.exit(-1)
+
+    p = Path(sys.argv[1])
+    for schema in sorted(p.glob("*.json")):
+        parse_schema(schema)
+
+    with open("converters.py", "wb+") as f:
+        f.write(HEADER.encode("utf-8"))
+
+        for name in sorted(converters):
+            f.write(converters[name].functions().encode("utf-8"))
+
+        for name in sorted(converters):
+            f.write(converters[name].tables().encode("utf-8"))
+
+        f.write(action_table("CALL_TO_SNAKE_CASE", calls, "snake_case").encode())
+        f.write(action_table("CALL_TO_CAMEL_CASE", calls, "camel_case").encode())
+        f.write(
+            action_table(
+                "CALL_RESULT_TO_SNAKE_CASE", call_results, "snake_case"
+            ).encode()
+        )
+        f.write(
+            action_table(
+                "CALL_RESULT_TO_CAMEL_CASE", call_results, "camel_case"
+            ).encode()
+        )
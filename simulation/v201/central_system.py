@@ -1,35 +1,180 @@
 import asyncio
+import json
 import logging
+import os
 import websockets
-import json
 from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
 
+from ocpp.broadcast import DISCONNECT, Broadcaster, Coalescer, StateFeed
+from ocpp.messages import preload_validators
+from ocpp.metrics import Metrics, start_metrics_server
+from ocpp.registry import StationRegistry
 from ocpp.routing import on
 from ocpp.v201 import ChargePoint as cp
 from ocpp.v201 import call_result
 from ocpp.v201.enums import RegistrationStatusType
+from ocpp.validation import LazyValidate, SampleValidate, ValidationPolicies
 
 logging.basicConfig(level=logging.INFO)
 
-connected_charge_points = {}
-connected_react_clients = {}
 
-async def forward_message_to_react_clients(message):
-    # Forward the received message to all connected React clients
-    for rc_ws in connected_react_clients.values():
-        await rc_ws.send(message)
+def load_site_groups(path):
+    # Read the site of every station from a file like
+    # {"Brussels": ["CP_1", "CP_2"], "Ghent": ["CP_3"]}
+    try:
+        with open(path) as f:
+            sites = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {
+        station_id: site
+        for site, station_ids in sites.items()
+        for station_id in station_ids
+    }
+
+
+site_groups = load_site_groups(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'site_groups.json')
+)
+
+# The connected charge points, indexed by connector status, vendor and model
+# and last-seen time.
+registry = StationRegistry()
+# The React clients. Every client has its own queue, a client with a full
+# queue is disconnected. It resumes from the last delta it received when it
+# reconnects.
+react_clients = Broadcaster(max_queue_size=100, policy=DISCONNECT)
+
+# Id of the object in the dashboard feed with the aggregates of the fleet.
+FLEET = "_fleet"
+
+# The message type that updates each field of a station on the dashboard.
+FIELD_MESSAGE_TYPES = {
+    "connected": "Heartbeat",
+    "connectorStatus": "StatusNotification",
+    "meterValues": "MeterValues",
+}
+
+
+def dashboard_topics(station_id, fields):
+    # React clients subscribe to stations, site groups, message types or to
+    # the aggregates of the fleet only.
+    if station_id == FLEET:
+        return [("aggregate",)]
+
+    topics = [("station", station_id)]
+    group = site_groups.get(station_id)
+    if group is not None:
+        topics.append(("group", group))
+    topics.extend(
+        ("type", FIELD_MESSAGE_TYPES[name])
+        for name in fields
+        if name in FIELD_MESSAGE_TYPES
+    )
+    return topics
+
+
+def subscription_topics(query):
+    # Parse the topics of a React client from its query string, e.g.
+    # ?stations=CP_1,CP_2&groups=Brussels&types=StatusNotification&aggregate=1
+    # Without topics, the client receives everything.
+    topics = set()
+    for parameter, topic in [('stations', 'station'), ('groups', 'group'), ('types', 'type')]:
+        for values in query.get(parameter, []):
+            topics.update((topic, value) for value in values.split(',') if value)
+    if query.get('aggregate'):
+        topics.add(("aggregate",))
+    return topics or None
+
+
+# The state of the stations shown by the dashboard. Clients get a snapshot
+# when they connect, followed by deltas of the fields that changed. Deltas
+# only reach the clients that subscribed to one of their topics.
+dashboard = StateFeed(react_clients.publish, topics=dashboard_topics)
+
+# The changed fields of every station are passed to the dashboard 4 times per
+# second at most.
+dashboard_updates = Coalescer(
+    lambda fields, station_id: dashboard.update(station_id, fields),
+    rate=4,
+    merge=True,
+)
+
+# Metrics of all charge points, served at http://127.0.0.1:9100/metrics.
+metrics = Metrics()
+
+# The frequent messages of the charge points are only checked for the fields
+# their handlers use, 1 in 10 is validated completely.
+validation_policies = ValidationPolicies(
+    inbound={
+        action: LazyValidate(full=SampleValidate(10))
+        for action in ["Heartbeat", "MeterValues", "StatusNotification"]
+    }
+)
+
+# The latest reading in kWh of the energy register of every station and the
+# sum of these readings.
+station_energy = {}
+fleet_energy = 0
+
+# Factor to convert a reading of the energy register into kWh, by unit.
+ENERGY_UNITS = {"Wh": 0.001, "kWh": 1}
+
+
+def latest_energy_reading(meter_value):
+    # Return the latest reading of the Energy.Active.Import.Register in kWh,
+    # or None if the meter values have none. A sampled value without
+    # measurand is a reading of that register, its default unit is Wh.
+    latest = None
+    for value in meter_value:
+        for sample in value["sampled_value"]:
+            if sample.get("measurand", "Energy.Active.Import.Register") != (
+                "Energy.Active.Import.Register"
+            ):
+                continue
+            unit_of_measure = sample.get("unit_of_measure") or {}
+            factor = ENERGY_UNITS.get(unit_of_measure.get("unit", "Wh"))
+            if factor is None:
+                continue
+            reading = (
+                sample["value"]
+                * factor
+                * 10 ** unit_of_measure.get("multiplier", 0)
+            )
+            if latest is None or value["timestamp"] >= latest[0]:
+                latest = (value["timestamp"], reading)
+    return latest[1] if latest is not None else None
+
+
+def update_dashboard(station_id, **fields):
+    # Update the fields of the station on the dashboard of all connected React
+    # clients. This never waits, not even for a slow client.
+    dashboard_updates.update(station_id, fields)
+
+
+def update_fleet():
+    # The aggregates are taken from the indexes of the registry, not by
+    # scanning all stations.
+    update_dashboard(
+        FLEET,
+        stations=len(registry),
+        connectorStatus=registry.counts(),
+        energy=fleet_energy,
+    )
 
 async def forward_stop_transaction(station_id):
     # Forward the stop transaction message to the corresponding charging point
-    cp_ws = connected_charge_points.get(station_id)
-    if cp_ws:
-        await cp_ws.send('{"messageType": "StopTransaction"}')
+    record = registry.get(station_id)
+    if record:
+        await record.connection.send('{"messageType": "StopTransaction"}')
     else:
-        logging.warning(f"No connected charging point found for station ID: {station_id}")
+        logging.warning("No connected charging point found for station ID: %s", station_id)
 
 class ChargePoint(cp):
     @on('BootNotification')
     async def on_boot_notification(self, charging_station, reason, **kwargs):
+        registry.on_boot_notification(self.id, charging_station)
         return call_result.BootNotification(
             current_time=datetime.utcnow().isoformat(),
             interval=10,
@@ -39,56 +184,59 @@ class ChargePoint(cp):
     @on("Heartbeat")
     async def on_heartbeat(self):
         charge_point_id = self.id
-        logging.info(f"Received Heartbeat from Charge Point {charge_point_id}")
-        # Forward heartbeat notification with charge point ID to React clients
-        for rc_ws in connected_react_clients.values():
-            await rc_ws.send('{"messageType": "Heartbeat", "chargePointId": "' + charge_point_id + '"}')
+        logging.info("Received Heartbeat from Charge Point %s", charge_point_id)
+        registry.on_heartbeat(charge_point_id)
+        # Only a change of the connection status is sent to the React clients
+        update_dashboard(charge_point_id, connected=True)
         return call_result.Heartbeat(
             current_time=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S") + "Z"
         )
 
     @on("MeterValues")
     async def on_meter_values(self, evse_id, meter_value, **kwargs):
-        logging.info(f"Received MeterValues from Charge Point {self.id}:")
-        logging.info(f"EVSE ID: {evse_id}")
-        logging.info(f"meter_value: {meter_value}")
-        
-        json_data = {
-            "messageType" : "MeterValues",
-            "stationId": self.id,
-            "meterValues": meter_value
-        }
-
-        json_string = json.dumps(json_data)
-
-        await forward_message_to_react_clients(json_string)
-        
+        global fleet_energy
+
+        logging.info("Received MeterValues from Charge Point %s:", self.id)
+        logging.info("EVSE ID: %s", evse_id)
+        logging.info("meter_value: %s", meter_value)
+        registry.on_heartbeat(self.id)
+
+        # The dashboard shows the first sampled value of every meter value
+        meter_values = [
+            {
+                "timestamp": value["timestamp"],
+                "value": value["sampled_value"][0]["value"],
+                "unitOfMeasure": value["sampled_value"][0]
+                .get("unit_of_measure", {})
+                .get("unit"),
+            }
+            for value in meter_value
+        ]
+        update_dashboard(self.id, meterValues=meter_values)
+
+        energy = latest_energy_reading(meter_value)
+        if energy is not None:
+            fleet_energy += energy - station_energy.get(self.id, 0)
+            station_energy[self.id] = energy
+            update_fleet()
+
         return call_result.MeterValues()
     
     @on("StatusNotification")
     async def on_status_notification(self, timestamp, connector_status, evse_id, connector_id, **kwargs):
-        logging.info(f"Received StatusNotification from Charge Point {self.id}")
-        logging.info(f"Timestamp: {timestamp}, Status: {connector_status}, EVSE ID: {evse_id}, Connector ID: {connector_id}")
+        logging.info("Received StatusNotification from Charge Point %s", self.id)
+        logging.info("Timestamp: %s, Status: %s, EVSE ID: %s, Connector ID: %s", timestamp, connector_status, evse_id, connector_id)
+        registry.on_status_notification(self.id, evse_id, connector_id, connector_status)
 
-        json_data = {
-            "messageType": "StatusNotification",
-            "stationId": self.id,
-            "timestamp": timestamp,
-            "connectorStatus": connector_status,
-            "evseId": evse_id,
-            "connectorId": connector_id
-        }
-
-        json_string = json.dumps(json_data)
-
-        await forward_message_to_react_clients(json_string)
+        update_dashboard(self.id, connectorStatus=connector_status)
+        update_fleet()
 
         return call_result.StatusNotification()
 
     @on("StopTransaction")
     async def on_stop_transaction(self):
 
-        logging.info(f"Received StopTransaction from Charge Point {self.id}")
+        logging.info("Received StopTransaction from Charge Point %s", self.id)
 
         return call_result.RequestStopTransaction()
 
@@ -109,7 +257,11 @@ async def on_connect(websocket, path):
         return await websocket.close()
 
 
-    path_components = path.strip('/').split('_')
+    # React clients that reconnect pass the position in the dashboard feed
+    # they resume from as ?epoch=...&seq=...
+    url = urlsplit(path)
+    query = parse_qs(url.query)
+    path_components = url.path.strip('/').split('_')
     if len(path_components) != 2:
         logging.error("Invalid path format. Closing connection.")
         return await websocket.close()
@@ -117,42 +269,71 @@ async def on_connect(websocket, path):
     client_type, client_id = path_components
 
     if client_type == 'CP':  # Charging point client
-        cp_instance = ChargePoint(client_id, websocket)
-        connected_charge_points[client_id] = cp_instance
-        await cp_instance.start()
+        cp_instance = ChargePoint(
+            client_id,
+            websocket,
+            validation_policies=validation_policies,
+            max_queued_frames=100,
+            metrics=metrics,
+        )
+        registry.register(client_id, cp_instance, group=site_groups.get(client_id))
+        update_dashboard(client_id, connected=True)
+        update_fleet()
+        try:
+            await cp_instance.start()
+        finally:
+            # start() raises when the connection has been closed, so the
+            # queued frames can't be sent anymore.
+            await cp_instance.close(flush=False)
+            # Leave the record alone if the station reconnected in the
+            # meantime.
+            record = registry.get(client_id)
+            if record is not None and record.connection is cp_instance:
+                registry.unregister(client_id)
+                update_dashboard(client_id, connected=False)
+                update_fleet()
     elif client_type == 'RC':  # React client
-        connected_react_clients[client_id] = websocket
-        logging.info(f"React client connected: {client_id}")
+        epoch = query.get('epoch', [None])[0]
+        seq = query.get('seq', [''])[0]
+        subscriber = react_clients.subscribe(
+            client_id, websocket, topics=subscription_topics(query)
+        )
+        # Queued before any delta that's published after it.
+        subscriber.put(
+            dashboard.resume(epoch, int(seq) if seq.isdigit() else None, subscriber)
+        )
+        logging.info("React client connected: %s", client_id)
 
     while True:
         try:
             message = await websocket.recv()
             sender_client_id = client_id if client_type == 'CP' else f"RC_{client_id}"
-            if client_type == 'CP':
-
-                for rc_ws in connected_react_clients.values():
-                    await rc_ws.send(f"From CP {sender_client_id}: {message}")
-            else:
+            if client_type == 'RC':
                 cp_id = sender_client_id.split('_')[1]
-                cp_ws = connected_charge_points.get(cp_id)
-                if cp_ws:
-                    await cp_ws.send(f"From RC {sender_client_id}: {message}")
+                record = registry.get(cp_id)
+                if record:
+                    await record.connection.send(f"From RC {sender_client_id}: {message}")
                 else:
-                    logging.warning(f"No connected charging point found for RC {sender_client_id}")
+                    logging.warning("No connected charging point found for RC %s", sender_client_id)
                     
-            logging.info(f"Received message from {sender_client_id}: {message}")
+            logging.info("Received message from %s: %s", sender_client_id, message)
 
         except websockets.exceptions.ConnectionClosed:
             if client_type == 'CP':
-                logging.info(f"Connection closed for Charge Point: {client_id}")
-                del connected_charge_points[client_id]
+                logging.info("Connection closed for Charge Point: %s", client_id)
+                registry.unregister(client_id)
             elif client_type == 'RC':
-                logging.info(f"Connection closed for React client: {client_id}")
-                del connected_react_clients[client_id]
+                logging.info("Connection closed for React client: %s", client_id)
+                await react_clients.unsubscribe(client_id, subscriber)
             break
 
 
 async def main():
+    # Avoid reading the schemas from disk while handling the first messages.
+    preload_validators("2.0.1")
+
+    await start_metrics_server(metrics, "127.0.0.1", 9100)
+
     server = await websockets.serve(
         on_connect,
         '0.0.0.0',
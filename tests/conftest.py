@@ -2,6 +2,15 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from ocpp.routing import on
+from ocpp.v201 import ChargePoint, call_result
+
+
+class HeartbeatCentralSystem(ChargePoint):
+    @on("Heartbeat")
+    def on_heartbeat(self, **kwargs):
+        return call_result.Heartbeat(current_time="2018-05-29T17:37:05Z")
+
 
 @pytest.fixture
 def connection():
@@ -12,3 +21,10 @@ def connection():
     connection.send = AsyncMock()
 
     return connection
+
+
+@pytest.fixture
+def heartbeat_central_system_class():
+    """A v201 ChargePoint class that responds to Heartbeats with a fixed
+    current time."""
+    return HeartbeatCentralSystem
@@ -0,0 +1,314 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ocpp.broadcast import (
+    COALESCE,
+    DISCONNECT,
+    DROP_OLDEST,
+    Broadcaster,
+    Coalescer,
+    StateFeed,
+)
+
+
+class SlowConnection:
+    """Connection of which send() blocks until it's released."""
+
+    def __init__(self):
+        self.sent = []
+        self.released = asyncio.Event()
+        self.close = AsyncMock()
+
+    async def send(self, message):
+        await self.released.wait()
+        self.sent.append(message)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_publish_does_not_wait_for_slow_subscribers():
+    broadcaster = Broadcaster()
+    slow = SlowConnection()
+    fast = SlowConnection()
+    fast.released.set()
+    broadcaster.subscribe("slow", slow)
+    broadcaster.subscribe("fast", fast)
+
+    broadcaster.publish("1")
+    broadcaster.publish("2")
+    await settle()
+
+    assert fast.sent == ["1", "2"]
+    assert slow.sent == []
+
+    slow.released.set()
+    await settle()
+    assert slow.sent == ["1", "2"]
+
+    await broadcaster.unsubscribe("slow")
+    await broadcaster.unsubscribe("fast")
+    slow.close.assert_awaited_once()
+    assert len(broadcaster) == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    broadcaster = Broadcaster(max_queue_size=2, policy=DROP_OLDEST)
+    connection = SlowConnection()
+    subscriber = broadcaster.subscribe("dashboard", connection)
+
+    # The first message is taken by the writer task and waits in send().
+    broadcaster.publish("1")
+    await settle()
+    for message in ["2", "3", "4"]:
+        broadcaster.publish(message)
+
+    assert subscriber.dropped == 1
+    connection.released.set()
+    await settle()
+    assert connection.sent == ["1", "3", "4"]
+    await broadcaster.unsubscribe("dashboard")
+
+
+@pytest.mark.asyncio
+async def test_coalesce():
+    broadcaster = Broadcaster(max_queue_size=2, policy=COALESCE)
+    connection = SlowConnection()
+    subscriber = broadcaster.subscribe("dashboard", connection)
+
+    broadcaster.publish("CP_1 Available", key="CP_1")
+    await settle()
+    broadcaster.publish("CP_1 Occupied", key="CP_1")
+    broadcaster.publish("CP_2 Available", key="CP_2")
+    broadcaster.publish("CP_1 Faulted", key="CP_1")
+    # Without a queued message with the same key the oldest is dropped.
+    broadcaster.publish("CP_3 Available", key="CP_3")
+
+    assert (subscriber.coalesced, subscriber.dropped) == (1, 1)
+    connection.released.set()
+    await settle()
+    assert connection.sent == ["CP_1 Available", "CP_2 Available", "CP_3 Available"]
+    await broadcaster.unsubscribe("dashboard")
+
+
+@pytest.mark.asyncio
+async def test_disconnect():
+    broadcaster = Broadcaster(max_queue_size=1)
+    connection = SlowConnection()
+    subscriber = broadcaster.subscribe("dashboard", connection, policy=DISCONNECT)
+
+    broadcaster.publish("1")
+    await settle()
+    broadcaster.publish("2")
+    broadcaster.publish("3")
+    await settle()
+
+    assert "dashboard" not in broadcaster
+    assert subscriber.closed
+    connection.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failing_subscriber_is_removed():
+    broadcaster = Broadcaster()
+    connection = AsyncMock()
+    connection.send.side_effect = ConnectionError
+    broadcaster.subscribe("dashboard", connection)
+
+    broadcaster.publish("1")
+    await settle()
+    broadcaster.publish("2")
+
+    assert "dashboard" not in broadcaster
+    connection.send.assert_awaited_once_with("1")
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        Broadcaster(policy="unknown")
+
+
+@pytest.mark.asyncio
+async def test_coalescer():
+    published = []
+    coalescer = Coalescer(lambda message, key: published.append((key, message)), 20)
+
+    coalescer.update("CP_1", "Available")
+    coalescer.update("CP_2", "Available")
+    coalescer.update("CP_1", "Occupied")
+    assert published == []
+
+    await asyncio.sleep(0.01)
+    assert published == [("CP_1", "Occupied"), ("CP_2", "Available")]
+
+    # The next flush waits for the interval.
+    coalescer.update("CP_1", "Faulted")
+    coalescer.update("CP_1", "Available")
+    await asyncio.sleep(0.01)
+    assert len(published) == 2
+    await asyncio.sleep(0.06)
+    assert published[2:] == [("CP_1", "Available")]
+
+    assert coalescer.latest == {"CP_1": "Available", "CP_2": "Available"}
+    assert (coalescer.updates, coalescer.published) == (5, 3)
+
+    coalescer.remove("CP_2")
+    coalescer.update("CP_1", "Occupied")
+    coalescer.close(flush=False)
+    await asyncio.sleep(0.06)
+    assert len(published) == 3
+    assert coalescer.latest == {"CP_1": "Occupied"}
+
+
+@pytest.mark.asyncio
+async def test_coalescer_close_flushes():
+    publish = Mock()
+    coalescer = Coalescer(publish)
+
+    coalescer.update("CP_1", "Available")
+    coalescer.close()
+
+    publish.assert_called_once_with("Available", "CP_1")
+
+
+@pytest.mark.asyncio
+async def test_coalescer_merge():
+    publish = Mock()
+    coalescer = Coalescer(publish, merge=True)
+
+    coalescer.update("CP_1", {"connected": True, "connectorStatus": "Available"})
+    coalescer.update("CP_1", {"connectorStatus": "Occupied"})
+    coalescer.flush()
+    coalescer.update("CP_1", {"connected": False})
+    coalescer.close()
+
+    assert [c.args for c in publish.call_args_list] == [
+        ({"connected": True, "connectorStatus": "Occupied"}, "CP_1"),
+        ({"connected": False}, "CP_1"),
+    ]
+    assert coalescer.latest == {
+        "CP_1": {"connected": False, "connectorStatus": "Occupied"}
+    }
+
+
+def test_state_feed():
+    published = []
+    feed = StateFeed(published.append)
+
+    feed.update("CP_1", {"connected": True})
+    feed.update("CP_1", {"connected": True, "connectorStatus": "Occupied"})
+    # Unchanged fields aren't published.
+    feed.update("CP_1", {"connected": True})
+    feed.update("CP_2", {"connected": True})
+    feed.remove("CP_2")
+    feed.remove("CP_3")
+
+    assert [json.loads(message) for message in published] == [
+        {"type": "delta", "id": "CP_1", "fields": {"connected": True}, "seq": 1},
+        {
+            "type": "delta",
+            "id": "CP_1",
+            "fields": {"connectorStatus": "Occupied"},
+            "seq": 2,
+        },
+        {"type": "delta", "id": "CP_2", "fields": {"connected": True}, "seq": 3},
+        {"type": "delta", "id": "CP_2", "removed": True, "seq": 4},
+    ]
+    assert json.loads(feed.resume()) == {
+        "type": "snapshot",
+        "epoch": feed.epoch,
+        "seq": 4,
+        "objects": {"CP_1": {"connected": True, "connectorStatus": "Occupied"}},
+    }
+
+
+def test_state_feed_resume():
+    feed = StateFeed(Mock(), history=3)
+    for status in ["Available", "Occupied", "Faulted", "Available", "Occupied"]:
+        feed.update("CP_1", {"connectorStatus": status})
+
+    resumed = json.loads(feed.resume(feed.epoch, 3))
+    assert resumed["type"] == "deltas"
+    assert resumed["seq"] == 5
+    assert [delta["seq"] for delta in resumed["deltas"]] == [4, 5]
+
+    assert feed.missed(feed.epoch, 5) == []
+    assert [delta["seq"] for delta in feed.missed(feed.epoch, 2)] == [3, 4, 5]
+
+    # Deltas that aren't kept anymore, of another feed or from the future.
+    for epoch, seq in [(feed.epoch, 1), ("other", 3), (feed.epoch, 6)]:
+        assert feed.missed(epoch, seq) is None
+        assert json.loads(feed.resume(epoch, seq))["type"] == "snapshot"
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_after_reconnect():
+    broadcaster = Broadcaster()
+    old = broadcaster.subscribe("dashboard", AsyncMock())
+    new = broadcaster.subscribe("dashboard", AsyncMock())
+
+    await broadcaster.unsubscribe("dashboard", old)
+
+    assert old.closed
+    assert not new.closed
+    assert "dashboard" in broadcaster
+
+
+@pytest.mark.asyncio
+async def test_publish_to_topics():
+    broadcaster = Broadcaster()
+    everything = broadcaster.subscribe("everything", AsyncMock())
+    ghent = broadcaster.subscribe("ghent", AsyncMock(), topics=[("group", "Ghent")])
+    cp_1 = broadcaster.subscribe(
+        "cp_1", AsyncMock(), topics=[("station", "CP_1"), ("group", "Ghent")]
+    )
+
+    broadcaster.publish("CP_1", topics=[("station", "CP_1"), ("group", "Brussels")])
+    broadcaster.publish("CP_3", topics=[("station", "CP_3"), ("group", "Ghent")])
+    broadcaster.publish("all")
+
+    assert [entry[1] for entry in everything._queue] == ["CP_1", "CP_3", "all"]
+    assert [entry[1] for entry in ghent._queue] == ["CP_3", "all"]
+    assert [entry[1] for entry in cp_1._queue] == ["CP_1", "CP_3", "all"]
+
+    await broadcaster.unsubscribe("cp_1")
+    await broadcaster.unsubscribe("ghent")
+    assert broadcaster._by_topic == {}
+    await broadcaster.unsubscribe("everything")
+
+
+def test_state_feed_with_topics():
+    publish = Mock()
+    broadcaster = Broadcaster()
+    feed = StateFeed(
+        publish,
+        topics=lambda id, fields: [("station", id)]
+        + [("field", name) for name in fields],
+    )
+
+    feed.update("CP_1", {"connected": True})
+    feed.update("CP_2", {"connected": True})
+    feed.update("CP_2", {"connectorStatus": "Occupied"})
+    feed.remove("CP_1")
+
+    assert publish.call_args_list[2].kwargs == {
+        "topics": (("station", "CP_2"), ("field", "connectorStatus"))
+    }
+
+    cp_2 = broadcaster.subscribe("cp_2", None, topics=[("station", "CP_2")])
+    assert json.loads(feed.resume(subscriber=cp_2))["objects"] == {
+        "CP_2": {"connected": True, "connectorStatus": "Occupied"}
+    }
+
+    status = broadcaster.subscribe(
+        "status", None, topics=[("field", "connectorStatus")]
+    )
+    assert [delta["seq"] for delta in feed.missed(feed.epoch, 0, status)] == [3]
+    assert [delta["seq"] for delta in feed.missed(feed.epoch, 0)] == [1, 2, 3, 4]
@@ -0,0 +1,32 @@
+import io
+import json
+
+from ocpp.hooks import PARSED, RECEIVED, SpanExporter, StageEvent
+
+
+def test_span_exporter():
+    file = io.StringIO()
+    exporter = SpanExporter(file)
+    context = {}
+
+    received = StageEvent(RECEIVED, "CP_1", "inbound", None, None, "[]", context)
+    parsed = StageEvent(PARSED, "CP_1", "inbound", "1", "Heartbeat", None, context)
+    exporter(received)
+    exporter(parsed)
+
+    first, second = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert first["name"] == "received"
+    assert first["startTimeUnixNano"] == first["endTimeUnixNano"] == received.time_ns
+    assert first["attributes"] == [
+        {"key": "ocpp.charge_point_id", "value": {"stringValue": "CP_1"}},
+        {"key": "ocpp.direction", "value": {"stringValue": "inbound"}},
+    ]
+
+    assert second["name"] == "parsed"
+    assert second["traceId"] == first["traceId"]
+    assert second["spanId"] != first["spanId"]
+    assert second["startTimeUnixNano"] == received.time_ns
+    assert second["endTimeUnixNano"] == parsed.time_ns
+    assert {"key": "ocpp.action", "value": {"stringValue": "Heartbeat"}} in second[
+        "attributes"
+    ]
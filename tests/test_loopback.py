@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from ocpp.loopback import ConnectionClosed, connect_charge_points, loopback_pair
+from ocpp.v201 import ChargePoint, call
+
+
+@pytest.mark.asyncio
+async def test_loopback_pair():
+    a, b = loopback_pair()
+
+    await a.send("ping")
+    await a.send(b"bytes")
+    await b.send("pong")
+
+    assert await b.recv() == "ping"
+    assert await b.recv() == b"bytes"
+    assert await a.recv() == "pong"
+    assert (a.frames_sent, a.frames_received) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_close_wakes_up_receivers():
+    a, b = loopback_pair()
+    receiver = asyncio.ensure_future(b.recv())
+    await asyncio.sleep(0)
+
+    await a.send("last")
+    await a.close()
+
+    assert await receiver == "last"
+    assert a.closed and b.closed
+    with pytest.raises(ConnectionClosed):
+        await b.recv()
+    with pytest.raises(ConnectionClosed):
+        await a.recv()
+    with pytest.raises(ConnectionClosed):
+        await b.send("too late")
+
+
+@pytest.mark.asyncio
+async def test_close_with_full_queue():
+    a, b = loopback_pair(max_queue_size=1)
+    await a.send("first")
+    await b.close()
+
+    assert await b.recv() == "first"
+    with pytest.raises(ConnectionClosed):
+        await b.recv()
+
+
+@pytest.mark.asyncio
+async def test_connect_charge_points(heartbeat_central_system_class):
+    csms, station = connect_charge_points(
+        heartbeat_central_system_class, ChargePoint, "CP_1"
+    )
+    assert csms.id == station.id == "CP_1"
+    tasks = [asyncio.ensure_future(cp.start()) for cp in (csms, station)]
+
+    response = await station.call(call.Heartbeat())
+    assert response.current_time == "2018-05-29T17:37:05Z"
+
+    await station._connection.close()
+    for task in tasks:
+        with pytest.raises(ConnectionClosed):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_close_stops_writer_after_disconnect(heartbeat_central_system_class):
+    csms, station = connect_charge_points(
+        heartbeat_central_system_class, ChargePoint, "CP_1", max_queued_frames=10
+    )
+    tasks = [asyncio.ensure_future(cp.start()) for cp in (csms, station)]
+    await station.call(call.Heartbeat())
+    writer_task = csms._writer._task
+    assert not writer_task.done()
+
+    await station._connection.close()
+    with pytest.raises(ConnectionClosed):
+        await tasks[0]
+    await csms.close()
+
+    assert writer_task.done()
+    assert csms._writer._task is None
+
+    tasks[1].cancel()
+    await station.close()
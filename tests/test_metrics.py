@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from ocpp.metrics import Histogram, Metrics, start_metrics_server
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    for value in [0.05, 0.1, 0.5, 2.0]:
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+
+
+def test_metrics_timer_ignores_failures():
+    metrics = Metrics()
+
+    with metrics.time("ocpp_handler_duration_seconds", "Heartbeat"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.time("ocpp_handler_duration_seconds", "Heartbeat"):
+            raise ValueError
+
+    assert (
+        metrics.histograms["ocpp_handler_duration_seconds"][("Heartbeat",)].count == 1
+    )
+
+
+def test_metrics_export():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.inc("ocpp_messages_received_total", "Heartbeat", "Call")
+    metrics.inc("ocpp_messages_received_total", "Heartbeat", "Call")
+    metrics.inc("ocpp_call_errors_total", 'Data"Transfer', "InternalError", "outbound")
+    metrics.observe("ocpp_call_duration_seconds", 0.5, "Reset")
+
+    assert metrics.export() == (
+        "# HELP ocpp_messages_received_total Number of messages received.\n"
+        "# TYPE ocpp_messages_received_total counter\n"
+        'ocpp_messages_received_total{action="Heartbeat",message_type="Call"} 2\n'
+        "# HELP ocpp_call_errors_total Number of CallErrors received or sent.\n"
+        "# TYPE ocpp_call_errors_total counter\n"
+        'ocpp_call_errors_total{action="Data\\"Transfer",error_code="InternalError",'
+        'direction="outbound"} 1\n'
+        "# HELP ocpp_call_duration_seconds Time between sending a Call and "
+        "receiving its response.\n"
+        "# TYPE ocpp_call_duration_seconds histogram\n"
+        'ocpp_call_duration_seconds_bucket{action="Reset",le="0.1"} 0\n'
+        'ocpp_call_duration_seconds_bucket{action="Reset",le="1.0"} 1\n'
+        'ocpp_call_duration_seconds_bucket{action="Reset",le="+Inf"} 1\n'
+        'ocpp_call_duration_seconds_sum{action="Reset"} 0.5\n'
+        'ocpp_call_duration_seconds_count{action="Reset"} 1\n'
+    )
+
+
+def test_metrics_export_with_label_values_of_other_types():
+    metrics = Metrics()
+    metrics.inc("ocpp_messages_received_total", 5, "Call")
+    metrics.inc("ocpp_messages_received_total", "Heartbeat", "Call")
+    metrics.observe("ocpp_handler_duration_seconds", 0.5, None)
+
+    assert set(metrics.counters["ocpp_messages_received_total"]) == {
+        ("5", "Call"),
+        ("Heartbeat", "Call"),
+    }
+    assert 'ocpp_handler_duration_seconds_count{action="None"} 1' in (metrics.export())
+
+
+@pytest.mark.asyncio
+async def test_start_metrics_server():
+    metrics = Metrics()
+    metrics.inc("ocpp_messages_sent_total", "Reset", "Call")
+    server = await start_metrics_server(metrics, port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def get(path):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        response = await reader.read()
+        writer.close()
+        return response.decode()
+
+    try:
+        response = await get("/metrics")
+        assert response.startswith("HTTP/1.1 200 OK\r\n")
+        assert response.endswith(metrics.export())
+
+        assert (await get("/")).startswith("HTTP/1.1 404 Not Found\r\n")
+    finally:
+        server.close()
+        await server.wait_closed()
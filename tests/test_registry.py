@@ -0,0 +1,110 @@
+import pytest
+
+from ocpp.registry import StationRegistry
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def registry(clock):
+    registry = StationRegistry(clock=clock)
+    registry.register("CP_1", group="Brussels")
+    registry.register("CP_2", group="Brussels")
+    registry.register("CP_3", group="Ghent")
+    return registry
+
+
+def test_register_and_unregister(registry):
+    assert len(registry) == 3
+    assert "CP_1" in registry
+    assert registry.get("CP_1").group == "Brussels"
+    assert registry.get("CP_4") is None
+
+    registry.on_status_notification("CP_1", 1, 1, "Occupied")
+    registry.on_boot_notification("CP_1", {"vendor_name": "Alphen", "model": "S1"})
+    record = registry.unregister("CP_1")
+
+    assert record.id == "CP_1"
+    assert "CP_1" not in registry
+    assert registry.query(group="Brussels") == {"CP_2"}
+    assert registry.query(status="Occupied") == set()
+    assert registry.query(vendor="Alphen") == set()
+    assert registry.unregister("CP_1") is None
+
+
+def test_query_by_status_and_group(registry):
+    registry.on_status_notification("CP_1", 1, 1, "Occupied")
+    registry.on_status_notification("CP_1", 2, 1, "Occupied")
+    registry.on_status_notification("CP_2", 1, 1, "Available")
+    registry.on_status_notification("CP_3", 1, 1, "Occupied")
+
+    assert registry.query(status="Occupied") == {"CP_1", "CP_3"}
+    assert registry.query(status="Occupied", group="Brussels") == {"CP_1"}
+    assert registry.count("Occupied") == 2
+    assert registry.counts() == {"Occupied": 2, "Available": 1}
+    assert registry.connectors("Occupied") == {
+        ("CP_1", 1, 1),
+        ("CP_1", 2, 1),
+        ("CP_3", 1, 1),
+    }
+
+    # CP_1 stays Occupied as long as one of its connectors is.
+    registry.on_status_notification("CP_1", 1, 1, "Available")
+    assert registry.query(status="Occupied") == {"CP_1", "CP_3"}
+    registry.on_status_notification("CP_1", 2, 1, "Available")
+    assert registry.query(status="Occupied") == {"CP_3"}
+    assert registry.query(status="Available", group="Brussels") == {"CP_1", "CP_2"}
+    assert registry.query() == {"CP_1", "CP_2", "CP_3"}
+
+
+def test_query_by_vendor_and_model(registry):
+    registry.on_boot_notification("CP_1", {"vendor_name": "Alphen", "model": "S1"})
+    registry.on_boot_notification("CP_2", {"vendor_name": "Alphen", "model": "S2"})
+    registry.on_boot_notification("CP_3", {"vendor_name": "ICU", "model": "Eve"})
+
+    assert registry.query(vendor="Alphen") == {"CP_1", "CP_2"}
+    assert registry.query(vendor="Alphen", model="S2") == {"CP_2"}
+    assert registry.query(vendor="Alphen", group="Ghent") == set()
+
+    # A new BootNotification replaces the model.
+    registry.on_boot_notification("CP_2", {"vendor_name": "Alphen", "model": "S1"})
+    assert registry.query(vendor="Alphen", model="S1") == {"CP_1", "CP_2"}
+
+    with pytest.raises(ValueError):
+        registry.query(model="S1")
+
+
+def test_stale(registry, clock):
+    clock.now += 60
+    registry.on_heartbeat("CP_2")
+    clock.now += 30
+    registry.on_status_notification("CP_3", 1, 1, "Available")
+
+    assert registry.stale(20) == ["CP_1", "CP_2"]
+    assert registry.stale(60) == ["CP_1"]
+    assert registry.get("CP_3").last_seen == clock.now
+
+    # Unknown stations are ignored.
+    registry.on_heartbeat("CP_4")
+
+
+def test_unregister_stale_stations(registry, clock):
+    clock.now += 60
+    registry.on_heartbeat("CP_3")
+
+    for station_id in registry.stale(30):
+        registry.unregister(station_id)
+        registry.on_heartbeat("CP_3")
+
+    assert [record.id for record in registry] == ["CP_3"]
@@ -0,0 +1,144 @@
+import pytest
+from jsonschema import Draft4Validator
+
+from ocpp.exceptions import (
+    FormatViolationError,
+    ProtocolError,
+    TypeConstraintViolationError,
+)
+from ocpp.messages import Call, CallResult, set_validator_class, validate_payload
+from ocpp.schema_compiler import CompiledValidator, compile_schema
+
+schema = {
+    "definitions": {
+        "StatusEnumType": {"type": "string", "enum": ["Accepted", "Rejected"]},
+        "EVSEType": {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {
+                "id": {"type": "integer"},
+                "power": {"type": "number", "minimum": 0.0, "maximum": 100.0},
+            },
+            "required": ["id"],
+        },
+    },
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "status": {"$ref": "#/definitions/StatusEnumType"},
+        "reason": {"type": "string", "maxLength": 5},
+        "evse": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/EVSEType"},
+            "minItems": 1,
+            "maxItems": 2,
+        },
+    },
+    "required": ["status"],
+}
+
+
+@pytest.fixture
+def compiled_validators():
+    set_validator_class(CompiledValidator)
+    yield
+    set_validator_class(Draft4Validator)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"status": "Accepted"},
+        {"status": "Rejected", "reason": "Busy", "evse": [{"id": 1}]},
+        {"status": "Accepted", "evse": [{"id": 1, "power": 0}, {"id": 2}]},
+        # Like Draft4Validator, the format isn't checked.
+        {"status": "Accepted", "evse": [{"id": 1, "power": 100.0}]},
+        {"status": "Accepted", "reason": ""},
+    ],
+)
+def test_compile_schema_with_valid_payload(payload):
+    assert Draft4Validator(schema).is_valid(payload)
+    assert compile_schema(schema)(payload) is True
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [],
+        {},
+        {"status": "Unknown"},
+        {"status": 1},
+        {"status": "Accepted", "unknown": 1},
+        {"status": "Accepted", "reason": "Too long"},
+        {"status": "Accepted", "evse": []},
+        {"status": "Accepted", "evse": [{"id": 1}, {"id": 2}, {"id": 3}]},
+        {"status": "Accepted", "evse": [{}]},
+        {"status": "Accepted", "evse": [{"id": True}]},
+        {"status": "Accepted", "evse": [{"id": 1.0}]},
+        {"status": "Accepted", "evse": [{"id": 1, "power": False}]},
+        {"status": "Accepted", "evse": [{"id": 1, "power": -0.1}]},
+        {"status": "Accepted", "evse": [{"id": 1, "power": 100.1}]},
+    ],
+)
+def test_compile_schema_with_invalid_payload(payload):
+    assert not Draft4Validator(schema).is_valid(payload)
+    assert compile_schema(schema)(payload) is False
+
+
+def test_compile_schema_with_unsupported_keyword():
+    with pytest.raises(ValueError):
+        compile_schema({"type": "string", "pattern": "^[a-z]+$"})
+
+
+def test_compiled_validator_falls_back_to_draft4_validator():
+    validator = CompiledValidator({"type": "string", "pattern": "^[a-z]+$"})
+
+    assert validator.is_valid("abc")
+    assert not validator.is_valid("ABC")
+
+
+def test_validate_payload_with_valid_payload(compiled_validators):
+    message = Call(
+        unique_id="1234",
+        action="BootNotification",
+        payload={
+            "reason": "PowerUp",
+            "chargingStation": {"model": "Model", "vendorName": "Vendor"},
+        },
+    )
+
+    validate_payload(message, ocpp_version="2.0.1")
+
+
+@pytest.mark.parametrize(
+    "payload,error",
+    [
+        ({"currentTime": "2024-01-01T00:00:00Z", "unknown": 1}, FormatViolationError),
+        ({"currentTime": 1}, TypeConstraintViolationError),
+        ({}, ProtocolError),
+    ],
+)
+def test_validate_payload_raises_same_error_as_draft4_validator(
+    compiled_validators, payload, error
+):
+    message = CallResult(unique_id="1234", action="Heartbeat", payload=payload)
+
+    with pytest.raises(error) as compiled_error:
+        validate_payload(message, ocpp_version="2.0.1")
+
+    set_validator_class(Draft4Validator)
+    with pytest.raises(error) as draft4_error:
+        validate_payload(message, ocpp_version="2.0.1")
+
+    assert str(compiled_error.value) == str(draft4_error.value)
+
+
+def test_validate_payload_with_maxlength_violation(compiled_validators):
+    message = Call(
+        unique_id="1234",
+        action="Authorize",
+        payload={"idToken": {"idToken": "0" * 37, "type": "ISO14443"}},
+    )
+
+    with pytest.raises(TypeConstraintViolationError):
+        validate_payload(message, ocpp_version="2.0.1")
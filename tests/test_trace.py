@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+
+from ocpp.trace import TRACE_HEADERS, TRACE_OFF, TRACE_PAYLOAD, MessageTrace
+
+message = '[2,"1337","Heartbeat",{}]'
+
+
+@pytest.fixture
+def trace():
+    return MessageTrace(TRACE_OFF)
+
+
+def test_trace_off(trace, caplog):
+    with caplog.at_level(logging.INFO, logger="ocpp"):
+        trace.received("CP_1", message)
+        trace.sent("CP_1", message)
+
+    assert caplog.records == []
+
+
+def test_trace_headers(trace, caplog):
+    trace.set_level(TRACE_HEADERS)
+
+    with caplog.at_level(logging.INFO, logger="ocpp"):
+        trace.received("CP_1", message)
+        trace.sent("CP_1", b'[3,"1337",{}]')
+
+    assert caplog.messages == [
+        "CP_1: receive Call unique_id=1337 action=Heartbeat size=25",
+        "CP_1: send CallResult unique_id=1337 action=None size=13",
+    ]
+
+
+def test_trace_payload(trace, caplog):
+    trace.set_level(TRACE_PAYLOAD)
+
+    with caplog.at_level(logging.INFO, logger="ocpp"):
+        trace.received("CP_1", message)
+        trace.sent("CP_1", message)
+
+    assert caplog.messages == [
+        f"CP_1: receive message {message}",
+        f"CP_1: send {message}",
+    ]
+
+
+def test_trace_level_per_charge_point(trace, caplog):
+    trace.set_level(TRACE_PAYLOAD, charge_point_id="CP_2")
+
+    with caplog.at_level(logging.INFO, logger="ocpp"):
+        trace.received("CP_1", message)
+        trace.received("CP_2", message)
+
+    assert caplog.messages == [f"CP_2: receive message {message}"]
+
+    trace.reset_level("CP_2")
+    assert trace.get_level("CP_2") == TRACE_OFF
+
+
+def test_trace_doesnt_format_when_logger_is_disabled(trace, caplog):
+    class Message(str):
+        def __str__(self):
+            raise AssertionError("Message must not be formatted.")
+
+    trace.set_level(TRACE_PAYLOAD)
+
+    with caplog.at_level(logging.WARNING, logger="ocpp"):
+        trace.received("CP_1", Message(message))
@@ -0,0 +1,215 @@
+import pytest
+
+from ocpp.exceptions import (
+    FormatViolationError,
+    ProtocolError,
+    TypeConstraintViolationError,
+)
+from ocpp.messages import Call
+from ocpp.validation import (
+    INBOUND,
+    OUTBOUND,
+    AlwaysValidate,
+    LazyValidate,
+    NeverValidate,
+    SampleValidate,
+    ValidateInDebug,
+    ValidateUntilTrusted,
+    ValidationCounters,
+    ValidationPolicies,
+)
+
+valid_heartbeat = Call(unique_id="1", action="Heartbeat", payload={})
+invalid_heartbeat = Call(unique_id="1", action="Heartbeat", payload={"a": 1})
+
+
+def test_always_validate():
+    policy = AlwaysValidate()
+
+    policy.validate("CP_1", valid_heartbeat, "2.0.1")
+    with pytest.raises(FormatViolationError):
+        policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+
+    assert policy.counters == {"Heartbeat": ValidationCounters(valid=1, invalid=1)}
+
+
+def test_never_validate():
+    policy = NeverValidate()
+
+    policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+
+    assert policy.counters == {"Heartbeat": ValidationCounters(skipped=1)}
+
+
+def test_sample_validate():
+    policy = SampleValidate(3)
+
+    for _ in range(7):
+        policy.validate("CP_1", valid_heartbeat, "2.0.1")
+
+    assert policy.counters == {"Heartbeat": ValidationCounters(valid=3, skipped=4)}
+
+    with pytest.raises(ValueError):
+        SampleValidate(0)
+
+
+def test_validate_until_trusted():
+    policy = ValidateUntilTrusted(2)
+
+    # Invalid payloads don't count towards trust.
+    with pytest.raises(FormatViolationError):
+        policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+    policy.validate("CP_1", valid_heartbeat, "2.0.1")
+    policy.validate("CP_1", valid_heartbeat, "2.0.1")
+    policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+
+    # Trust is per charge point.
+    with pytest.raises(FormatViolationError):
+        policy.validate("CP_2", invalid_heartbeat, "2.0.1")
+
+    policy.reset("CP_1")
+    with pytest.raises(FormatViolationError):
+        policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+
+    assert policy.counters == {
+        "Heartbeat": ValidationCounters(valid=2, invalid=3, skipped=1)
+    }
+
+
+def test_validate_until_trusted_revalidates_trusted_charge_points():
+    policy = ValidateUntilTrusted(1, revalidate_every=3)
+    policy.on_valid("CP_1", "StatusNotification")
+    policy.on_valid("CP_2", "Heartbeat")
+
+    policy.validate("CP_1", valid_heartbeat, "2.0.1")
+    policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+    policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+
+    # 1 in every 3 payloads of a trusted charge point is still validated. A
+    # failure ends the trust for all actions.
+    with pytest.raises(FormatViolationError):
+        policy.validate("CP_1", invalid_heartbeat, "2.0.1")
+    assert policy.should_validate("CP_1", "Heartbeat")
+    assert policy.should_validate("CP_1", "StatusNotification")
+    assert not policy.should_validate("CP_2", "Heartbeat")
+
+    assert policy.counters == {
+        "Heartbeat": ValidationCounters(valid=1, invalid=1, skipped=2)
+    }
+
+
+@pytest.mark.parametrize("debug", [True, False])
+def test_validate_in_debug(debug):
+    policy = ValidateInDebug(debug=debug)
+
+    policy.validate("CP_1", valid_heartbeat, "2.0.1")
+
+    assert policy.counters["Heartbeat"].valid == int(debug)
+    assert policy.counters["Heartbeat"].skipped == int(not debug)
+
+
+def test_validation_policies():
+    heartbeat = NeverValidate()
+    outbound = ValidateInDebug()
+    policies = ValidationPolicies(inbound={"Heartbeat": heartbeat}, outbound=outbound)
+
+    assert policies.get("Heartbeat", INBOUND) is heartbeat
+    assert isinstance(policies.get("BootNotification", INBOUND), AlwaysValidate)
+    assert policies.get("Heartbeat", OUTBOUND) is outbound
+
+    policies.set("Heartbeat", OUTBOUND, heartbeat)
+    assert policies.get("Heartbeat", OUTBOUND) is heartbeat
+
+    policies.validate("CP_1", invalid_heartbeat, "2.0.1", INBOUND)
+    assert heartbeat.counters["Heartbeat"].skipped == 1
+
+
+def status_notification(**payload):
+    return Call(
+        unique_id="1",
+        action="StatusNotification",
+        payload={
+            "timestamp": "2024-01-01T00:00:00Z",
+            "connectorStatus": "Available",
+            "evseId": 1,
+            "connectorId": 1,
+            **payload,
+        },
+    )
+
+
+def on_status_notification(self, connector_status, evse_id, **kwargs):
+    pass
+
+
+def test_lazy_validate_checks_fields_of_handler():
+    policy = LazyValidate()
+
+    # Only the fields taken by the handler are checked...
+    policy.validate(
+        "CP_1", status_notification(connectorId="1"), "2.0.1", on_status_notification
+    )
+    assert policy.counters["StatusNotification"] == ValidationCounters(partial=1)
+
+    # ...but if they are invalid, the same errors as by validate_payload() are
+    # raised.
+    with pytest.raises(TypeConstraintViolationError):
+        policy.validate(
+            "CP_1", status_notification(evseId="1"), "2.0.1", on_status_notification
+        )
+
+    message = status_notification()
+    del message.payload["connectorStatus"]
+    with pytest.raises(ProtocolError):
+        policy.validate("CP_1", message, "2.0.1", on_status_notification)
+
+    # Without a handler the payload is validated completely.
+    with pytest.raises(TypeConstraintViolationError):
+        policy.validate("CP_1", status_notification(connectorId="1"), "2.0.1")
+
+    assert policy.counters["StatusNotification"] == ValidationCounters(
+        partial=1, invalid=3
+    )
+
+
+def test_lazy_validate_with_full_validation_sampled():
+    full = SampleValidate(2)
+    policy = LazyValidate(full=full)
+
+    with pytest.raises(TypeConstraintViolationError):
+        policy.validate(
+            "CP_1",
+            status_notification(connectorId="1"),
+            "2.0.1",
+            on_status_notification,
+        )
+    policy.validate(
+        "CP_1", status_notification(connectorId="1"), "2.0.1", on_status_notification
+    )
+
+    assert full.counters["StatusNotification"] == ValidationCounters(
+        invalid=1, skipped=1
+    )
+
+
+def test_lazy_validate_with_deferred_validation():
+    policy = LazyValidate(batch_size=3)
+
+    policy.validate("CP_1", status_notification(), "2.0.1", on_status_notification)
+    policy.validate(
+        "CP_1", status_notification(connectorId="1"), "2.0.1", on_status_notification
+    )
+    assert policy.counters["StatusNotification"] == ValidationCounters(partial=2)
+
+    policy.validate_deferred()
+    assert policy.counters["StatusNotification"] == ValidationCounters(
+        partial=2, valid=1, invalid=1
+    )
+
+    # Without a running event loop a full batch is validated right away.
+    for _ in range(3):
+        policy.validate("CP_1", status_notification(), "2.0.1", on_status_notification)
+    assert policy.counters["StatusNotification"].valid == 4
+
+    with pytest.raises(ValueError):
+        LazyValidate(full=AlwaysValidate(), batch_size=10)
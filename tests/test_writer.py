@@ -0,0 +1,75 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ocpp.writer import FrameWriter
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_sends_queued_frames_in_one_drain():
+    connection = AsyncMock()
+    writer = FrameWriter(connection, max_queue_size=10)
+
+    for i in range(5):
+        writer.send_nowait(str(i))
+    await writer.flush()
+
+    assert [c.args[0] for c in connection.send.call_args_list] == list("01234")
+    assert (writer.frames, writer.drains) == (5, 1)
+
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_backpressure():
+    sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def send(frame):
+        sent.set()
+        await release.wait()
+
+    connection = AsyncMock()
+    connection.send.side_effect = send
+    writer = FrameWriter(connection, max_queue_size=2, high_water_mark=2)
+
+    # The first frame is taken by the writer, which then blocks on the
+    # connection.
+    await writer.send("0")
+    await sent.wait()
+    await writer.send("1")
+    assert not writer.congested
+    await writer.send("2")
+    assert writer.congested
+
+    with pytest.raises(asyncio.QueueFull):
+        writer.send_nowait("3")
+
+    blocked = asyncio.ensure_future(writer.send("3"))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await writer.flush()
+    assert writer.frames == 4
+
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_with_failing_connection():
+    connection = AsyncMock()
+    connection.send.side_effect = ConnectionError("closed")
+    writer = FrameWriter(connection)
+
+    await writer.send("0")
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConnectionError):
+        await writer.send("1")
+    with pytest.raises(ConnectionError):
+        await writer.flush()
+
+    await writer.close()
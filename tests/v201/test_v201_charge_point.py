@@ -1,9 +1,16 @@
+import asyncio
 import json
+from unittest.mock import Mock
 
 import pytest
 
+from ocpp.hooks import HANDLED, PARSED, RECEIVED, SENT
+from ocpp.messages import JSONCodec
+from ocpp.metrics import Metrics
 from ocpp.routing import after, create_route_map, on
-from ocpp.v201 import call_result
+from ocpp.trace import TRACE_OFF, MessageTrace
+from ocpp.v201 import ChargePoint, call_result
+from ocpp.validation import NeverValidate, ValidationPolicies
 
 
 @pytest.mark.asyncio
@@ -118,3 +125,434 @@ async def test_call_without_unique_id_should_return_a_random_value(
     ) = mock_base_central_system._get_specific_response.call_args_list[0][0]
     # Check the actual unique id is equals to the one internally generated
     assert actual_unique_id == expected_unique_id
+
+
+@pytest.mark.asyncio
+async def test_call_ignores_responses_with_unknown_unique_id(
+    base_central_system, mock_boot_request
+):
+    """
+    Test that a late or unexpected response doesn't interfere with the
+    response to the call that is currently awaited.
+
+    """
+
+    async def respond(message):
+        unique_id = json.loads(message)[1]
+        payload = {
+            "currentTime": "2018-05-29T17:37:05.495259",
+            "interval": 350,
+            "status": "Accepted",
+        }
+        await base_central_system.route_message(json.dumps([3, "unknown-id", payload]))
+        await base_central_system.route_message(json.dumps([3, unique_id, payload]))
+
+    base_central_system._connection.send.side_effect = respond
+
+    response = await base_central_system.call(mock_boot_request)
+
+    assert response.interval == 350
+    assert base_central_system._pending_calls == {}
+
+
+@pytest.mark.asyncio
+async def test_call_with_inflight_window(connection, mock_boot_request):
+    """
+    Test that with an in-flight window larger than 1, multiple calls are send
+    before the first response arrives and that responses can be routed in
+    any order.
+
+    """
+    cs = ChargePoint(id=1234, connection=connection, max_inflight_calls=2)
+    sent = []
+    both_sent = asyncio.Event()
+
+    async def send(message):
+        sent.append(json.loads(message)[1])
+        if len(sent) == 2:
+            both_sent.set()
+
+    connection.send.side_effect = send
+
+    calls = asyncio.gather(
+        cs.call(mock_boot_request, unique_id="a"),
+        cs.call(mock_boot_request, unique_id="b"),
+    )
+
+    await asyncio.wait_for(both_sent.wait(), 1)
+    for unique_id, interval in [("b", 2), ("a", 1)]:
+        await cs.route_message(
+            json.dumps(
+                [
+                    3,
+                    unique_id,
+                    {
+                        "currentTime": "2018-05-29T17:37:05.495259",
+                        "interval": interval,
+                        "status": "Accepted",
+                    },
+                ]
+            )
+        )
+
+    response_a, response_b = await calls
+    assert (response_a.interval, response_b.interval) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_route_of_class(connection, heartbeat_call):
+    """
+    Test that handlers registered on a subclass of ChargePoint are called with
+    the instance and, when requested, with the unique id of the call.
+
+    """
+
+    class MyChargePoint(ChargePoint):
+        @on("Heartbeat")
+        def on_heartbeat(self, call_unique_id):
+            assert self is cs
+            assert call_unique_id == 1
+            return call_result.Heartbeat(current_time="2018-05-29T17:37:05Z")
+
+    cs = MyChargePoint(id=1234, connection=connection)
+    assert cs.route_map is MyChargePoint._route_table
+
+    await cs.route_message(heartbeat_call)
+    connection.send.assert_called_once_with(
+        json.dumps(
+            [3, 1, {"currentTime": "2018-05-29T17:37:05Z"}], separators=(",", ":")
+        )
+    )
+
+
+def test_route_table_of_class_is_read_only(heartbeat_central_system_class, connection):
+    cs = heartbeat_central_system_class(id=1234, connection=connection)
+
+    with pytest.raises(TypeError):
+        cs.route_map["Heartbeat"] = {}
+    with pytest.raises(TypeError):
+        cs.route_map["Heartbeat"]["_skip_schema_validation"] = True
+
+    # The routes of a single instance are changed by assigning a new map.
+    cs.route_map = {}
+    assert "Heartbeat" in heartbeat_central_system_class("5678", connection).route_map
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_json_codec_of_charge_point(
+    heartbeat_central_system_class, connection, heartbeat_call
+):
+    class Codec(JSONCodec):
+        def dumps(self, obj):
+            return "encoded"
+
+    cs = heartbeat_central_system_class(
+        id=1234, connection=connection, json_codec=Codec()
+    )
+
+    await cs.route_message(heartbeat_call)
+    connection.send.assert_called_once_with("encoded")
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_validation_policies(
+    heartbeat_central_system_class, connection
+):
+    """
+    Test that the inbound Call and the outbound CallResult are validated
+    according to the policies of their direction.
+
+    """
+    inbound = NeverValidate()
+    policies = ValidationPolicies(inbound={"Heartbeat": inbound})
+    cs = heartbeat_central_system_class(
+        id=1234, connection=connection, validation_policies=policies
+    )
+
+    await cs.route_message(json.dumps([2, "1", "Heartbeat", {"unknown": 1}]))
+    connection.send.assert_called_once_with(
+        json.dumps(
+            [3, "1", {"currentTime": "2018-05-29T17:37:05Z"}], separators=(",", ":")
+        )
+    )
+
+    assert inbound.counters["Heartbeat"].skipped == 1
+    assert policies.get("Heartbeat", "outbound").counters["Heartbeat"].valid == 1
+
+
+@pytest.mark.asyncio
+async def test_route_message_skips_orphaned_responses(connection, monkeypatch):
+    """
+    Test that responses for which no call() is waiting aren't decoded if the
+    ChargePoint is created with `skip_orphaned_responses=True`.
+
+    """
+    cs = ChargePoint(id=1234, connection=connection, skip_orphaned_responses=True)
+
+    def unpack(*args):
+        raise AssertionError("Orphaned response must not be unpacked.")
+
+    monkeypatch.setattr("ocpp.charge_point.unpack", unpack)
+
+    await cs.route_message(json.dumps([3, "1", {"currentTime": "2024"}]))
+    connection.send.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_bytes(heartbeat_central_system_class, connection):
+    """
+    Test that a ChargePoint created with `send_bytes=True` handles a message
+    received as buffer and sends the response as bytes.
+
+    """
+    cs = heartbeat_central_system_class(id=1234, connection=connection, send_bytes=True)
+
+    await cs.route_message(memoryview(b'[2,"1","Heartbeat",{}]'))
+    connection.send.assert_called_once_with(
+        b'[3,"1",{"currentTime":"2018-05-29T17:37:05Z"}]'
+    )
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_frame_writer(
+    heartbeat_central_system_class, connection
+):
+    """
+    Test that a ChargePoint created with `max_queued_frames` sends responses
+    from the writer task.
+
+    """
+    cs = heartbeat_central_system_class(
+        id=1234, connection=connection, max_queued_frames=10
+    )
+
+    await cs.route_message(json.dumps([2, "1", "Heartbeat", {}]))
+    assert not cs.congested
+    await cs._writer.flush()
+    connection.send.assert_called_once_with(
+        '[3,"1",{"currentTime":"2018-05-29T17:37:05Z"}]'
+    )
+    await cs._writer.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_frame_writer_by_default(
+    heartbeat_central_system_class, connection, heartbeat_call
+):
+    cs = heartbeat_central_system_class(
+        id=1234, connection=connection, max_queued_frames=10
+    )
+
+    await cs.route_message(heartbeat_call)
+    await cs.route_message(heartbeat_call)
+    await cs.close()
+    assert connection.send.call_count == 2
+
+    # Without flushing, the queued frames are discarded.
+    await cs.route_message(heartbeat_call)
+    await cs.close(flush=False)
+    assert connection.send.call_count == 2
+    assert cs._writer._task is None
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_message_trace(
+    heartbeat_central_system_class, connection
+):
+    trace = MessageTrace(TRACE_OFF)
+    trace.sent = Mock()
+    cs = heartbeat_central_system_class(
+        id=1234, connection=connection, message_trace=trace
+    )
+
+    await cs.route_message(json.dumps([2, "1", "Heartbeat", {}]))
+    trace.sent.assert_called_once_with(
+        1234, '[3,"1",{"currentTime":"2018-05-29T17:37:05Z"}]'
+    )
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_metrics(heartbeat_central_system_class, connection):
+    class MyChargePoint(heartbeat_central_system_class):
+        @on("StatusNotification")
+        def on_status_notification(self, **kwargs):
+            raise ValueError
+
+    metrics = Metrics()
+    cs = MyChargePoint(id=1234, connection=connection, metrics=metrics)
+
+    await cs.route_message(json.dumps([2, "1", "Heartbeat", {}]))
+    await cs.route_message(json.dumps([2, "2", "Heartbeat", {"unknown": 1}]))
+    await cs.route_message(
+        json.dumps(
+            [
+                2,
+                "3",
+                "StatusNotification",
+                {
+                    "timestamp": "2024-01-01T00:00:00Z",
+                    "connectorStatus": "Available",
+                    "evseId": 1,
+                    "connectorId": 1,
+                },
+            ]
+        )
+    )
+
+    assert metrics.counters["ocpp_messages_received_total"] == {
+        ("Heartbeat", "Call"): 2,
+        ("StatusNotification", "Call"): 1,
+    }
+    assert metrics.counters["ocpp_messages_sent_total"] == {
+        ("Heartbeat", "CallResult"): 1,
+        ("Heartbeat", "CallError"): 1,
+        ("StatusNotification", "CallError"): 1,
+    }
+    assert metrics.counters["ocpp_call_errors_total"] == {
+        ("Heartbeat", "FormatViolation", "outbound"): 1,
+        ("StatusNotification", "InternalError", "outbound"): 1,
+    }
+    assert set(metrics.histograms["ocpp_handler_duration_seconds"]) == {("Heartbeat",)}
+    assert set(metrics.histograms["ocpp_validation_duration_seconds"]) == {
+        ("Heartbeat", "inbound"),
+        ("Heartbeat", "outbound"),
+        ("StatusNotification", "inbound"),
+    }
+    assert (
+        metrics.histograms["ocpp_serialization_duration_seconds"][
+            ("Heartbeat", "encode")
+        ].count
+        == 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_metrics_and_malformed_action(connection):
+    """
+    Test that Calls with an action that isn't a string are answered with a
+    CallError and are counted as 'unknown', so the other side can't create
+    labels of any value or type.
+    """
+    metrics = Metrics()
+    cs = ChargePoint(id=1234, connection=connection, metrics=metrics)
+
+    await cs.route_message(json.dumps([2, "1", 5, {}]))
+    await cs.route_message(json.dumps([2, "2", [1], {}]))
+
+    assert json.loads(connection.send.call_args.args[0])[2] == "FormatViolation"
+    assert metrics.counters["ocpp_messages_received_total"] == {
+        ("unknown", "Call"): 2,
+    }
+    assert metrics.counters["ocpp_call_errors_total"] == {
+        ("unknown", "FormatViolation", "outbound"): 2,
+    }
+    assert 'ocpp_messages_received_total{action="unknown"' in metrics.export()
+
+
+@pytest.mark.asyncio
+async def test_call_with_metrics(mock_base_central_system, mock_boot_request):
+    metrics = Metrics()
+    mock_base_central_system._metrics = metrics
+
+    await mock_base_central_system.call(mock_boot_request)
+
+    assert metrics.counters["ocpp_messages_sent_total"] == {
+        ("BootNotification", "Call"): 1
+    }
+    assert metrics.counters["ocpp_messages_received_total"] == {
+        ("BootNotification", "CallResult"): 1
+    }
+    assert (
+        metrics.histograms["ocpp_call_duration_seconds"][("BootNotification",)].count
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_hooks(heartbeat_central_system_class, connection):
+    cs = heartbeat_central_system_class(id=1234, connection=connection)
+    events = []
+    cs.add_hook(events.append)
+
+    await cs.route_message(json.dumps([2, "1", "Heartbeat", {}]))
+
+    assert [(event.stage, event.direction) for event in events] == [
+        ("received", "inbound"),
+        ("parsed", "inbound"),
+        ("validated", "inbound"),
+        ("converted", "inbound"),
+        ("handled", "inbound"),
+        ("converted", "outbound"),
+        ("validated", "outbound"),
+        ("serialized", "outbound"),
+        ("sent", "outbound"),
+    ]
+    assert all(event.context is events[0].context for event in events)
+    assert [event.unique_id for event in events[1:]] == ["1"] * 8
+    assert events[-1].data == '[3,"1",{"currentTime":"2018-05-29T17:37:05Z"}]'
+
+
+@pytest.mark.asyncio
+async def test_add_hook_for_some_stages(
+    heartbeat_central_system_class, connection, heartbeat_call
+):
+    cs = heartbeat_central_system_class(id=1234, connection=connection)
+    hook = Mock()
+    cs.add_hook(hook, stages=[RECEIVED, SENT])
+    cs.add_hook(hook, stages=[PARSED, HANDLED])
+
+    await cs.route_message(heartbeat_call)
+    assert [call.args[0].stage for call in hook.call_args_list] == [
+        "received",
+        "parsed",
+        "handled",
+        "sent",
+    ]
+
+    cs.remove_hook(hook)
+    await cs.route_message(heartbeat_call)
+    assert hook.call_count == 4
+
+    with pytest.raises(ValueError):
+        cs.add_hook(hook, stages=["unknown"])
+
+
+@pytest.mark.asyncio
+async def test_route_message_with_failing_hook(
+    heartbeat_central_system_class, connection, heartbeat_call
+):
+    """
+    Test that a hook that raises doesn't stop the message from being handled
+    nor the other hooks from being called.
+    """
+    cs = heartbeat_central_system_class(id=1234, connection=connection)
+    cs.add_hook(Mock(side_effect=ValueError("hook boom")))
+    hook = Mock()
+    cs.add_hook(hook)
+
+    await cs.route_message(heartbeat_call)
+
+    connection.send.assert_called_once_with(
+        json.dumps(
+            [3, 1, {"currentTime": "2018-05-29T17:37:05Z"}], separators=(",", ":")
+        )
+    )
+    assert hook.call_args.args[0].stage == "sent"
+
+
+@pytest.mark.asyncio
+async def test_call_with_hooks(mock_base_central_system, mock_boot_request):
+    events = []
+    mock_base_central_system.add_hook(events.append)
+
+    await mock_base_central_system.call(mock_boot_request)
+
+    assert [(event.stage, event.direction) for event in events] == [
+        ("converted", "outbound"),
+        ("validated", "outbound"),
+        ("serialized", "outbound"),
+        ("sent", "outbound"),
+        ("validated", "inbound"),
+        ("converted", "inbound"),
+    ]
+    assert {event.action for event in events} == {"BootNotification"}
@@ -0,0 +1,102 @@
+from ocpp.charge_point import camel_to_snake_case
+from ocpp.v201 import call, converters
+from ocpp.v201.datatypes import (
+    ComponentType,
+    EVSEType,
+    GetVariableDataType,
+    NetworkConnectionProfileType,
+    VariableType,
+)
+from ocpp.v201.enums import OCPPInterfaceType, OCPPTransportType, OCPPVersionType
+
+transaction_event = {
+    "eventType": "Updated",
+    "timestamp": "2024-01-01T00:00:00Z",
+    "triggerReason": "MeterValuePeriodic",
+    "seqNo": 1,
+    "transactionInfo": {"transactionId": "1", "chargingState": "Charging"},
+    "evse": {"id": 1, "connectorId": 1},
+    "meterValue": [
+        {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "sampledValue": [
+                {"value": 10.0, "unitOfMeasure": {"unit": "Wh"}},
+                {"value": 230.0, "measurand": "Voltage", "phase": "L1-N"},
+            ],
+        }
+    ],
+    "customData": {"vendorId": "foo", "someVendorKey": {"nestedKey": 1}},
+}
+
+
+def test_call_to_snake_case_is_equal_to_generic_converter():
+    to_snake_case = converters.CALL_TO_SNAKE_CASE["TransactionEvent"]
+
+    assert to_snake_case(transaction_event) == camel_to_snake_case(transaction_event)
+
+
+def test_call_to_camel_case_with_nested_dataclasses():
+    """
+    Test that all items of a list of dataclasses are converted and that None
+    values are removed.
+    """
+    payload = call.GetVariables(
+        get_variable_data=[
+            GetVariableDataType(
+                component=ComponentType(name="Component", evse=EVSEType(id=1)),
+                variable=VariableType(name="Variable"),
+            ),
+            GetVariableDataType(
+                component=ComponentType(name="Other"),
+                variable=VariableType(name="Variable", instance="1"),
+            ),
+        ]
+    )
+
+    assert converters.CALL_TO_CAMEL_CASE["GetVariables"](payload) == {
+        "getVariableData": [
+            {
+                "component": {"name": "Component", "evse": {"id": 1}},
+                "variable": {"name": "Variable"},
+            },
+            {
+                "component": {"name": "Other"},
+                "variable": {"name": "Variable", "instance": "1"},
+            },
+        ]
+    }
+
+
+def test_call_to_camel_case_uses_property_names_of_schema():
+    payload = call.SetNetworkProfile(
+        configuration_slot=1,
+        connection_data=NetworkConnectionProfileType(
+            ocpp_version=OCPPVersionType.ocpp20,
+            ocpp_transport=OCPPTransportType.json,
+            ocpp_csms_url="wss://localhost:9000",
+            message_timeout=60,
+            security_profile=1,
+            ocpp_interface=OCPPInterfaceType.wired0,
+        ),
+    )
+
+    assert converters.CALL_TO_CAMEL_CASE["SetNetworkProfile"](payload) == {
+        "configurationSlot": 1,
+        "connectionData": {
+            "ocppVersion": "OCPP20",
+            "ocppTransport": "JSON",
+            "ocppCsmsUrl": "wss://localhost:9000",
+            "messageTimeout": 60,
+            "securityProfile": 1,
+            "ocppInterface": "Wired0",
+        },
+    }
+
+
+def test_call_result_to_camel_case_with_unknown_field():
+    payload = {"current_time": "2024-01-01T00:00:00Z", "vendor_field": {"a_b": 1}}
+
+    assert converters.CALL_RESULT_TO_CAMEL_CASE["Heartbeat"](payload) == {
+        "currentTime": "2024-01-01T00:00:00Z",
+        "vendorField": {"aB": 1},
+    }
@@ -0,0 +1,229 @@
+import decimal
+import json
+
+import pytest
+
+from ocpp.exceptions import (
+    FormatViolationError,
+    PropertyConstraintViolationError,
+    ProtocolError,
+)
+from ocpp.messages import (
+    Call,
+    CallError,
+    CallResult,
+    JSONCodec,
+    MessageType,
+    OrjsonCodec,
+    _validators,
+    get_json_codec,
+    get_validator,
+    pack,
+    peek_response_unique_id,
+    preload_validators,
+    set_json_codec,
+    unpack,
+    validate_payload,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# The codecs are created by the tests, OrjsonCodec() fails without orjson.
+CODECS = [
+    pytest.param(JSONCodec, id="json"),
+    pytest.param(
+        OrjsonCodec,
+        id="orjson",
+        marks=pytest.mark.skipif(orjson is None, reason="orjson isn't installed"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "message,cls",
+    [
+        ([2, "1", "Heartbeat", {}], Call),
+        ([3, "1", {}], CallResult),
+        ([4, "1", "InternalError", "", {}], CallError),
+    ],
+)
+def test_unpack(message, cls):
+    msg = unpack(json.dumps(message))
+
+    assert type(msg) is cls
+    assert msg.unique_id == "1"
+
+
+def test_unpack_with_unhashable_message_type_id_in_json():
+    with pytest.raises(PropertyConstraintViolationError):
+        unpack(json.dumps([[2], 1]))
+
+
+def test_unpack_with_missing_elements():
+    with pytest.raises(ProtocolError):
+        unpack(json.dumps([3]))
+
+
+def test_messages_have_no_instance_dict():
+    """Messages are created for every frame, they must be cheap."""
+    for msg in [
+        Call("1", "Heartbeat", {}),
+        CallResult("1", {}),
+        CallError("1", "", ""),
+    ]:
+        assert not hasattr(msg, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "message,unique_id",
+    [
+        ('[3,"1337",{"currentTime":"2024-01-01T00:00:00Z"}]', "1337"),
+        (b' [ 4 , "1337", "InternalError", "", {}]', "1337"),
+        (memoryview(b'[3,"1337",{}]'), "1337"),
+        ('[2,"1337","Heartbeat",{}]', None),
+        ("[3,1337,{}]", None),
+        ('[3,"13\\"37",{}]', None),
+        ("invalid", None),
+    ],
+)
+def test_peek_response_unique_id(message, unique_id):
+    assert peek_response_unique_id(message) == unique_id
+
+
+@pytest.mark.parametrize("use_bundle", [False, True])
+def test_preload_validators(tmp_path, use_bundle):
+    """
+    Test that validators for all schemas of a version are added to the cache,
+    also when the schemas are read from a bundle.
+    """
+    bundle = str(tmp_path / "schemas.json") if use_bundle else None
+    _validators.clear()
+
+    # The first call creates the bundle, the second reads from it.
+    assert preload_validators("2.0.1", bundle) == 128
+    assert preload_validators("2.0.1", bundle) == 128
+
+    schema = _validators["BootNotificationRequest_2.0.1"].schema
+    assert schema["comment"] == "OCPP 2.0.1 FINAL"
+    assert "chargingStation" in schema["properties"]
+    assert get_validator(MessageType.Call, "BootNotification", "2.0.1").schema == (
+        schema
+    )
+
+
+def test_preload_validators_with_bundle_of_other_version(tmp_path):
+    bundle = str(tmp_path / "schemas.json")
+    preload_validators("2.0.1", bundle)
+
+    with pytest.raises(ValueError):
+        preload_validators("2.0", bundle)
+
+
+def test_preload_validators_writes_bundle_atomically(tmp_path, monkeypatch):
+    """
+    Test that a bundle that fails to be written doesn't leave a partial
+    bundle, or the temporary file, behind.
+    """
+    bundle = tmp_path / "schemas.json"
+
+    def dump(obj, f):
+        f.write('{"ocpp_version": ')
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr("ocpp.messages.json.dump", dump)
+    with pytest.raises(OSError):
+        preload_validators("2.0.1", str(bundle))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_validate_payload_doesnt_format_payload_into_cause():
+    """
+    Test that the cause of other violations only names the violation, the
+    payload itself is available via the message.
+    """
+    message = CallResult(
+        unique_id="1234",
+        action="ClearCache",
+        payload={"status": "Unknown"},
+    )
+
+    with pytest.raises(FormatViolationError) as exception_info:
+        validate_payload(message, ocpp_version="2.0.1")
+
+    assert exception_info.value.details == {
+        "cause": "Payload for action 'ClearCache' is not valid: 'Unknown' is not "
+        "one of ['Accepted', 'Rejected']",
+        "ocpp_message": message,
+    }
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_json_codecs_serialize_decimal_and_custom_types(codec_class):
+    """
+    Test that all codecs encode values of type decimal.Decimal with 1 decimal
+    point and objects with a `to_json()` method as the output of that method.
+    """
+    codec = codec_class()
+    details = {"ocpp_message": Call("1", "Heartbeat", {})}
+    message = CallError("1234", "FormatViolation", "Invalid", details)
+    message.error_details["limit"] = decimal.Decimal(2.000001)
+
+    assert json.loads(message.to_json(codec)) == [
+        4,
+        "1234",
+        "FormatViolation",
+        "Invalid",
+        {"ocpp_message": '[2,"1","Heartbeat",{}]', "limit": 2.0},
+    ]
+    assert unpack(message.to_json(codec), codec).error_details["limit"] == 2.0
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+@pytest.mark.parametrize("buffer", [bytes, bytearray, memoryview])
+def test_json_codecs_with_buffers(codec_class, buffer):
+    """
+    Test that messages can be encoded into bytes and unpacked from buffers
+    without decoding them into a str first.
+    """
+    codec = codec_class()
+    message = Call("1", "Heartbeat", {"vendor": "Göteborg"})
+
+    frame = message.to_bytes(codec)
+    assert isinstance(frame, bytes)
+    assert frame.decode("utf-8") == message.to_json(codec)
+    assert pack(message, codec, as_bytes=True) == frame
+
+    msg = unpack(buffer(frame), codec)
+    assert (msg.unique_id, msg.action, msg.payload) == (
+        "1",
+        "Heartbeat",
+        {"vendor": "Göteborg"},
+    )
+
+
+def test_unpack_with_invalid_utf_8():
+    with pytest.raises(FormatViolationError):
+        unpack(b'[2,"1","Heartbeat",{"a":"\xff"}]')
+
+
+def test_set_json_codec():
+    """
+    Test that the codec configured with set_json_codec() is used when no codec
+    is given explicitly.
+    """
+
+    class Codec(JSONCodec):
+        def dumps(self, obj):
+            return "encoded"
+
+    previous = get_json_codec()
+    set_json_codec(Codec())
+    try:
+        assert Call("1", "Heartbeat", {}).to_json() == "encoded"
+        assert Call("1", "Heartbeat", {}).to_json(previous) == '[2,"1","Heartbeat",{}]'
+    finally:
+        set_json_codec(previous)
@@ -0,0 +1,58 @@
+from ocpp.routing import accepts_call_unique_id, after, create_route_table, on
+from ocpp.v201.enums import Action
+
+
+def test_create_route_table():
+    """
+    This test validates that the route table of a class holds the plain
+    functions, respects overrides in subclasses and doesn't evaluate
+    properties.
+
+    """
+
+    class ChargePoint:
+        @on(Action.Heartbeat, skip_schema_validation=True)
+        def on_heartbeat(self):
+            pass
+
+        @on(Action.MeterValues)
+        def meter_values(self):
+            pass
+
+        @property
+        def foo(self):
+            raise RuntimeError("this will be raised")
+
+    class SubChargePoint(ChargePoint):
+        @after(Action.Heartbeat)
+        def after_heartbeat(self):
+            pass
+
+        def meter_values(self):
+            pass
+
+    assert create_route_table(SubChargePoint) == {
+        Action.Heartbeat: {
+            "_on_action": ChargePoint.on_heartbeat,
+            "_after_action": SubChargePoint.after_heartbeat,
+            "_skip_schema_validation": True,
+            "_requires_instance": True,
+            "_on_action_accepts_call_unique_id": False,
+            "_after_action_accepts_call_unique_id": False,
+        },
+    }
+
+
+def test_accepts_call_unique_id_is_cached_in_route():
+    def on_heartbeat(call_unique_id, **kwargs):
+        pass
+
+    def after_heartbeat(**kwargs):
+        pass
+
+    route = {"_on_action": on_heartbeat, "_after_action": after_heartbeat}
+
+    assert accepts_call_unique_id(route, "_on_action") is True
+    assert accepts_call_unique_id(route, "_after_action") is False
+    assert route["_on_action_accepts_call_unique_id"] is True
+    assert route["_after_action_accepts_call_unique_id"] is False
@@ -0,0 +1,102 @@
+from ocpp.charge_point import (
+    camel_to_snake_case,
+    key_translation_cache_info,
+    remove_nones,
+    seed_key_translation_caches,
+    serialize_as_camel_case,
+    serialize_as_dict,
+    snake_to_camel_case,
+)
+from ocpp.v201.call import GetVariables as v201GetVariables
+from ocpp.v201.datatypes import (
+    ComponentType,
+    EVSEType,
+    GetVariableDataType,
+    VariableType,
+)
+
+
+def test_key_translation_caches():
+    """
+    Test that the key translation caches are seeded with the keys of the
+    JSON schemas and that translating a seeded key results in a cache hit.
+    """
+    seed_key_translation_caches("2.0.1")
+    before = key_translation_cache_info()
+
+    assert camel_to_snake_case({"chargingStation": {"vendorName": "foo"}}) == {
+        "charging_station": {"vendor_name": "foo"}
+    }
+    assert snake_to_camel_case({"charging_station": {"vendor_name": "foo"}}) == {
+        "chargingStation": {"vendorName": "foo"}
+    }
+
+    after = key_translation_cache_info()
+    for direction in ["camel_to_snake", "snake_to_camel"]:
+        assert after[direction].hits == before[direction].hits + 2
+        assert after[direction].misses == before[direction].misses
+
+
+def test_serialize_as_dict_with_list_of_dataclasses():
+    """
+    Test that all dataclasses in a list are serialized, not only the last one.
+    """
+    payload = v201GetVariables(
+        get_variable_data=[
+            GetVariableDataType(
+                component=ComponentType(name="Component"),
+                variable=VariableType(name="Variable"),
+            ),
+            GetVariableDataType(
+                component=ComponentType(name="Other"),
+                variable=VariableType(name="Variable"),
+            ),
+        ]
+    )
+
+    serialized = serialize_as_dict(payload)
+
+    assert [item["component"]["name"] for item in serialized["get_variable_data"]] == [
+        "Component",
+        "Other",
+    ]
+
+
+def test_serialize_as_camel_case():
+    """
+    Test that serialize_as_camel_case() gives the same result as serializing,
+    removing the nones and translating the keys in separate steps.
+    """
+    payload = v201GetVariables(
+        get_variable_data=[
+            GetVariableDataType(
+                component=ComponentType(
+                    name="Component",
+                    evse=EVSEType(id=1),
+                ),
+                variable=VariableType(name="Variable"),
+            ),
+            GetVariableDataType(
+                component=ComponentType(name="Other"),
+                variable=VariableType(name="Variable", instance="1"),
+            ),
+        ],
+        custom_data={"vendor_id": "foo", "nested": [{"some_key": None}]},
+    )
+
+    assert serialize_as_camel_case(payload) == snake_to_camel_case(
+        remove_nones(serialize_as_dict(payload))
+    )
+    assert serialize_as_camel_case(payload) == {
+        "getVariableData": [
+            {
+                "component": {"name": "Component", "evse": {"id": 1}},
+                "variable": {"name": "Variable"},
+            },
+            {
+                "component": {"name": "Other"},
+                "variable": {"name": "Variable", "instance": "1"},
+            },
+        ],
+        "customData": {"vendorId": "foo", "nested": [{}]},
+    }